@@ -7,6 +7,16 @@ from .merge_sort import MergeSort
 from .bubble_sort import BubbleSort
 from .insertion_sort import InsertionSort
 from .selection_sort import SelectionSort
+from .bitonic_sort import BitonicSort
+from .auto_sort import AutoSort
+from .quick_select import QuickSelect
+from .online_sorter import OnlineSorter
+from .heap_sort import HeapSort
+from .shell_sort import ShellSort, GAP_SEQUENCES
+from .rotation_merge_sort import RotationMergeSort
+from .cycle_sort import CycleSort
+from .write_selection_sort import WriteSelectionSort
+from .odd_even_sort import OddEvenSort
 
 __all__ = [
     'BaseSorter',
@@ -14,7 +24,18 @@ __all__ = [
     'MergeSort',
     'BubbleSort',
     'InsertionSort',
-    'SelectionSort'
+    'SelectionSort',
+    'BitonicSort',
+    'AutoSort',
+    'QuickSelect',
+    'OnlineSorter',
+    'HeapSort',
+    'ShellSort',
+    'GAP_SEQUENCES',
+    'RotationMergeSort',
+    'CycleSort',
+    'WriteSelectionSort',
+    'OddEvenSort'
 ]
 
 # Algorithm registry for easy access
@@ -23,7 +44,16 @@ ALGORITHM_MAP = {
     'merge_sort': MergeSort,
     'bubble_sort': BubbleSort,
     'insertion_sort': InsertionSort,
-    'selection_sort': SelectionSort
+    'selection_sort': SelectionSort,
+    'bitonic_sort': BitonicSort,
+    'auto': AutoSort,
+    'online': OnlineSorter,
+    'heap_sort': HeapSort,
+    'shell_sort': ShellSort,
+    'rotation_merge_sort': RotationMergeSort,
+    'cycle_sort': CycleSort,
+    'write_selection_sort': WriteSelectionSort,
+    'odd_even_sort': OddEvenSort
 }
 
 
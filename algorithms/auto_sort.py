@@ -0,0 +1,190 @@
+"""
+Automatic algorithm selection driven by a presortedness probe
+"""
+import math
+import time
+from numbers import Real
+from typing import Optional
+from config import Config
+from .base_sorter import BaseSorter
+
+
+def probe(keys, sample_size: int) -> dict:
+    """
+    Estimate input shape from a bounded sample
+    
+    Inputs up to sample_size elements are scanned completely. Larger inputs
+    are read as evenly spaced contiguous windows, so adjacent-pair statistics
+    stay meaningful while the cost stays sublinear. Descents only see local
+    disorder, so the share of inverted pairs is estimated separately from an
+    evenly spaced grid of about sqrt(2 * sample_size) elements spanning the
+    whole input; a few long runs have few descents but many inversions.
+    
+    Args:
+        keys: Keys to inspect
+        sample_size: Maximum number of elements to read
+    
+    Returns:
+        Dictionary with n, sampled, descent_ratio, estimated_runs,
+        inversion_ratio, distinct_ratio and value_range (None for non-numeric
+        keys)
+    """
+    n = len(keys)
+    if n <= sample_size:
+        windows = [keys[:]] if n else []
+    else:
+        count = 16
+        width = sample_size // count
+        stride = (n - width) // (count - 1)
+        windows = [keys[w * stride:w * stride + width] for w in range(count)]
+    
+    pairs = descents = 0
+    sample = []
+    for window in windows:
+        window = list(window)
+        pairs += len(window) - 1
+        descents += sum(1 for a, b in zip(window, window[1:]) if b < a)
+        sample.extend(window)
+    
+    descent_ratio = descents / pairs if pairs > 0 else 0.0
+    
+    # All pairs of the grid: about sample_size comparisons
+    grid_size = min(n, math.isqrt(2 * sample_size))
+    grid = [keys[g * (n - 1) // max(grid_size - 1, 1)] for g in range(grid_size)]
+    grid_pairs = grid_size * (grid_size - 1) // 2
+    inverted = sum(1 for g, a in enumerate(grid) for b in grid[g + 1:] if b < a)
+    inversion_ratio = inverted / grid_pairs if grid_pairs else 0.0
+    
+    try:
+        distinct_ratio = len(set(sample)) / len(sample) if sample else 1.0
+    except TypeError:  # unhashable keys
+        distinct_ratio = 1.0
+    value_range = None
+    if sample and isinstance(sample[0], Real):
+        value_range = max(sample) - min(sample)
+    
+    return {
+        'n': n,
+        'sampled': len(sample),
+        'descent_ratio': descent_ratio,
+        'estimated_runs': 1 + round(descent_ratio * max(n - 1, 0)),
+        'inversion_ratio': inversion_ratio,
+        'distinct_ratio': distinct_ratio,
+        'value_range': value_range
+    }
+
+
+def choose(metrics: dict, thresholds: dict, choices: dict) -> str:
+    """
+    Map probe metrics to a registered algorithm name
+    
+    Args:
+        metrics: Result of probe()
+        thresholds: Decision thresholds (see Config.AUTO_THRESHOLDS)
+        choices: Algorithm name per input shape (see Config.AUTO_CHOICES)
+    
+    Returns:
+        Algorithm name
+    """
+    n = metrics['n']
+    if n <= thresholds['small_size']:
+        return choices['small']
+    if metrics['descent_ratio'] <= thresholds['presorted_descent_ratio']:
+        # Insertion sort pays one shift per inversion
+        inversions_per_element = metrics['inversion_ratio'] * (n - 1) / 2
+        if inversions_per_element <= thresholds['presorted_inversions_per_element']:
+            return choices['presorted']
+        return choices['runs']
+    if metrics['descent_ratio'] >= thresholds['reversed_descent_ratio']:
+        return choices['reversed']
+    
+    small_range = (metrics['value_range'] is not None
+                   and metrics['value_range'] < n * thresholds['duplicate_distinct_ratio'])
+    if metrics['distinct_ratio'] <= thresholds['duplicate_distinct_ratio'] or small_range:
+        return choices['duplicates']
+    return choices['default']
+
+
+class AutoSort(BaseSorter):
+    """
+    Dispatches to the registered sorter best suited to the input
+    
+    The probe runs on the precomputed keys, inside the sort, so key
+    functions are still called only once per element. Stability depends on
+    the chosen sorter.
+    """
+    
+    __slots__ = ('choice', 'metrics', 'probe_time', '_delegate')
+    
+    def __init__(self, visualizer=None):
+        """
+        Initialize sorter
+        
+        Args:
+            visualizer: Callback function for visualization (optional)
+        """
+        super().__init__(visualizer)
+        self.choice: Optional[str] = None
+        self.metrics: Optional[dict] = None
+        self.probe_time = 0.0
+        self._delegate: Optional[BaseSorter] = None
+    
+    def get_name(self) -> str:
+        if self._delegate is not None:
+            return f"Auto ({self._delegate.get_name()})"
+        return "Auto"
+    
+    def get_complexity(self) -> dict:
+        if self._delegate is not None:
+            return self._delegate.get_complexity()
+        return {
+            'time_best': 'O(n)',
+            'time_avg': 'O(n log n)',
+            'time_worst': 'O(n²)',
+            'space': 'O(n)'
+        }
+    
+    def reset_stats(self):
+        """Reset statistics counters and forget the previous choice"""
+        super().reset_stats()
+        self._delegate = None
+    
+    def _sort(self):
+        """Probe self.data, then sort it in place with the chosen algorithm"""
+        from . import ALGORITHM_MAP
+        
+        start = time.perf_counter()
+        self.metrics = probe(self.data, Config.AUTO_PROBE_SAMPLE)
+        self.choice = choose(self.metrics, Config.AUTO_THRESHOLDS, Config.AUTO_CHOICES)
+        self.probe_time = time.perf_counter() - start
+        
+        delegate = ALGORITHM_MAP[self.choice](visualizer=self.visualizer)
+        delegate.data = self.data
+        delegate.records = self.records
+        delegate.tracker = self.tracker
+        delegate.trace = self.trace
+        delegate.memory = self.memory
+        delegate.changes = self.changes
+        self._delegate = delegate
+        delegate._sort()
+        
+        self.data = delegate.data
+        self.records = delegate.records
+        self.comparisons = delegate.comparisons
+        self.swaps = delegate.swaps
+        self.accesses = delegate.accesses
+        self.writes = delegate.writes
+    
+    def get_stats(self) -> dict:
+        """
+        Get statistics from the last sort, including the probe decision
+        
+        Returns:
+            Dictionary with comparisons, swaps, accesses, auto_choice,
+            probe_time and the probe metrics
+        """
+        stats = self._delegate.get_stats() if self._delegate is not None else super().get_stats()
+        stats['auto_choice'] = self.choice
+        stats['probe_time'] = self.probe_time
+        stats['probe'] = self.metrics
+        return stats
@@ -1,12 +1,133 @@
 """
 Abstract base class for sorting algorithms
 """
+import sys
 from abc import ABC, abstractmethod
 from typing import List, Callable, Optional
+from config import Config
+from analysis.access_trace import COMPARE, SWAP, WRITE
+
+# Largest rows * n * n boolean block built at once by batch fast paths
+BATCH_BLOCK_ELEMENTS = 1 << 24
+
+
+def _is_ndarray(obj) -> bool:
+    """Check for a NumPy array without importing NumPy"""
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def _count_left_greater(batch):
+    """
+    Count, per row and position, the earlier elements that are strictly greater
+    
+    Args:
+        batch: 2-D NumPy array, one array per row
+        
+    Returns:
+        int64 array of the same shape; row sums are the inversion counts
+    """
+    import numpy as np
+    
+    rows, n = batch.shape
+    earlier = np.triu(np.ones((n, n), dtype=bool), k=1)
+    counts = np.empty((rows, n), dtype=np.int64)
+    step = max(1, BATCH_BLOCK_ELEMENTS // max(1, n * n))
+    
+    for start in range(0, rows, step):
+        block = batch[start:start + step]
+        # greater[r, j, i] is block[r, j] > block[r, i]
+        greater = block[:, :, None] > block[:, None, :]
+        greater &= earlier
+        counts[start:start + step] = greater.sum(axis=1)
+    
+    return counts
+
+
+def _key_array(keys):
+    """
+    View a sequence of keys as a 1-D NumPy array
+    
+    Composite keys such as tuples are kept whole in an object array instead
+    of becoming extra dimensions.
+    
+    Args:
+        keys: List, array.array or 1-D NumPy array of keys
+        
+    Returns:
+        1-D NumPy array of the keys
+    """
+    import numpy as np
+    
+    if _is_ndarray(keys):
+        return keys
+    try:
+        values = np.asarray(keys)
+    except ValueError:  # tuples of different lengths
+        values = None
+    if values is None or values.ndim != 1:
+        values = np.empty(len(keys), dtype=object)
+        for i, key in enumerate(keys):
+            values[i] = key
+    return values
+
+
+def _stable_ranks(batch):
+    """
+    Rank every row of a batch, equal keys ranked in input order
+    
+    Args:
+        batch: 2-D NumPy array, one array per row
+        
+    Returns:
+        Tuple of (order, ranks): order holds the indices that stably sort each
+        row, ranks the int64 position of each element in that order
+    """
+    import numpy as np
+    
+    rows, n = batch.shape
+    order = np.argsort(batch, axis=1, kind='stable')
+    ranks = np.empty((rows, n), dtype=np.int64)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(n), (rows, n)), axis=1)
+    return order, ranks
 
 
 class BaseSorter(ABC):
-    """Abstract base class for all sorting algorithms"""
+    """
+    Abstract base class for all sorting algorithms
+    
+    Subclasses implement _sort(), which sorts self.data in place using
+    compare()/swap() and the record-aware write helpers below. STABLE states
+    whether equal keys keep their input order.
+    
+    Setting track_inversions makes sort() maintain an InversionTracker in
+    self.tracker; swap() updates it, and sorters that move elements by
+    other means report those moves to it themselves. Likewise, an
+    AccessTrace assigned to self.trace receives the index of every compare,
+    swap and _store(), plus any inline accesses a sorter reports, and a
+    MemoryModel assigned to self.memory receives every element read and
+    write for cache simulation. A change log assigned to self.changes
+    (anything with add() and extend(), such as the web renderer's
+    ChangeLog) receives the index of every element swap() and _store()
+    write, plus any positions a sorter moves by other means, so a renderer
+    can send just those positions per frame.
+    
+    Of the accesses, writes are also counted separately, so get_cost() can
+    weigh reads, writes, comparisons and swaps differently
+    (Config.COST_WEIGHTS), e.g. for storage where writes are expensive.
+    """
+    
+    STABLE = False
+    
+    # Config attributes `main.py tune` may search, with candidate values;
+    # sorters read them through Config.tuned() so tuned values apply
+    TUNABLE: dict = {}
+    
+    # Subclasses declare their own (usually empty) __slots__ so sorter
+    # instances stay small and attribute access stays fast
+    __slots__ = ('visualizer', 'data', 'records', 'comparisons', 'swaps',
+                 'accesses', 'writes', 'batch_stats', 'track_inversions', 'tracker', 'trace',
+                 'memory', 'changes')
     
     def __init__(self, visualizer=None):
         """
@@ -17,15 +138,24 @@ class BaseSorter(ABC):
         """
         self.visualizer = visualizer
         self.data: List[int] = []
+        self.records: Optional[list] = None
         self.comparisons = 0
         self.swaps = 0
         self.accesses = 0
+        self.writes = 0
+        self.batch_stats: Optional[dict] = None
+        self.track_inversions = False
+        self.tracker = None
+        self.trace = None
+        self.memory = None
+        self.changes = None
         
     def reset_stats(self):
         """Reset statistics counters"""
         self.comparisons = 0
         self.swaps = 0
         self.accesses = 0
+        self.writes = 0
     
     def compare(self, i: int, j: int) -> bool:
         """
@@ -40,6 +170,12 @@ class BaseSorter(ABC):
         """
         self.comparisons += 1
         self.accesses += 2
+        if self.trace is not None:
+            self.trace.add(COMPARE, i)
+            self.trace.add(COMPARE, j)
+        if self.memory is not None:
+            self.memory.read(i)
+            self.memory.read(j)
         return self.data[i] <= self.data[j]
     
     def swap(self, i: int, j: int):
@@ -52,7 +188,88 @@ class BaseSorter(ABC):
         """
         self.swaps += 1
         self.accesses += 4  # 2 reads, 2 writes
+        self.writes += 2
         self.data[i], self.data[j] = self.data[j], self.data[i]
+        if self.records is not None:
+            self.records[i], self.records[j] = self.records[j], self.records[i]
+        if self.tracker is not None:
+            self.tracker.swap(i, j)
+        if self.trace is not None:
+            self.trace.add(SWAP, i)
+            self.trace.add(SWAP, j)
+        if self.memory is not None:
+            self.memory.read(i)
+            self.memory.read(j)
+            self.memory.write(i)
+            self.memory.write(j)
+        if self.changes is not None:
+            self.changes.add(i)
+            self.changes.add(j)
+    
+    def _insertion_range(self, start: int, end: int):
+        """
+        Sort a short range data[start..end] with adjacent swaps (stable)
+        
+        Args:
+            start: Starting index
+            end: Ending index
+        """
+        for i in range(start + 1, end + 1):
+            j = i
+            while j > start and not self.compare(j - 1, j):
+                self.swap(j - 1, j)
+                j -= 1
+    
+    def _record(self, i: int):
+        """
+        Get the record at a position when sorting records by key
+        
+        Args:
+            i: Index
+            
+        Returns:
+            Record at i, or None when sorting plain values
+        """
+        return self.records[i] if self.records is not None else None
+    
+    def _store(self, k: int, value, record=None):
+        """
+        Write a key and its record to a position
+        
+        Args:
+            k: Destination index
+            value: Key to write
+            record: Record carried with the key (ignored for plain values)
+        """
+        self.data[k] = value
+        self.writes += 1
+        if self.records is not None:
+            self.records[k] = record
+        if self.trace is not None:
+            self.trace.add(WRITE, k)
+        if self.memory is not None:
+            self.memory.write(k)
+        if self.changes is not None:
+            self.changes.add(k)
+    
+    def _copy_range(self, start: int, stop: int):
+        """
+        Copy a slice of keys together with the matching records
+        
+        Args:
+            start: First index
+            stop: One past the last index
+            
+        Returns:
+            Tuple of (keys, records); records is None for plain values
+        """
+        if self.memory is not None:
+            self.memory.copy_to_scratch(start, stop)
+        keys = self.data[start:stop]
+        if _is_ndarray(keys):
+            keys = keys.copy()  # slices of arrays are views
+        records = self.records[start:stop] if self.records is not None else None
+        return keys, records
     
     def visualize(self, **kwargs):
         """
@@ -61,22 +278,159 @@ class BaseSorter(ABC):
         Args:
             **kwargs: Visualization parameters
         """
+        if self.tracker is not None:
+            self.tracker.mark(self.comparisons + self.swaps)
         if self.visualizer:
             self.visualizer(data=self.data, **kwargs)
     
-    @abstractmethod
-    def sort(self, data: List[int]) -> List[int]:
+    def sort(self, data, key: Optional[Callable] = None, reverse: bool = False,
+             copy: bool = True):
         """
         Sort the data
         
+        data may be a list, an array.array or a 1-D NumPy array. With
+        copy=False it is sorted in place instead of being copied first,
+        which keeps large typed buffers at their compact size.
+        
+        With a key function, keys are computed once per element
+        (decorate-sort-undecorate) into self.data while the records move in
+        lockstep in self.records. reverse=True sorts the reversed input and
+        reverses the result, so stable sorters keep equal keys in input order
+        just like sorted(..., reverse=True).
+        
         Args:
-            data: List to sort
+            data: Sequence to sort
+            key: Function extracting a comparison key from each element (optional)
+            reverse: Sort in descending order
+            copy: Sort a copy of data (default) rather than data itself
             
         Returns:
-            Sorted list
+            Sorted sequence (of the original elements when key is given)
+        """
+        self._load(data, key, copy)
+        
+        if reverse:
+            self._reverse()
+        
+        if self.track_inversions:
+            from analysis import InversionTracker
+            self.tracker = InversionTracker(self.data)
+        else:
+            self.tracker = None
+        
+        # Initial visualization
+        self.visualize(state='initial')
+        
+        self._sort()
+        
+        if reverse:
+            self._reverse()
+        
+        # Final visualization
+        self.visualize(state='complete')
+        
+        return self.data if self.records is None else self.records
+    
+    def _load(self, data, key: Optional[Callable] = None, copy: bool = True):
         """
+        Reset statistics and take data as self.data (and self.records)
+        
+        Args:
+            data: Sequence to work on
+            key: Function extracting a comparison key from each element (optional)
+            copy: Work on a copy of data rather than data itself
+        """
+        self.reset_stats()
+        if key is None:
+            if not copy:
+                self.data = data
+            elif _is_ndarray(data):
+                self.data = data.copy()
+            else:
+                self.data = data[:]
+            self.records = None
+        else:
+            self.records = data if not copy and isinstance(data, list) else list(data)
+            self.data = [key(record) for record in self.records]
+    
+    def _reverse(self):
+        """Reverse keys and records in place without counting statistics"""
+        self.data[:] = self.data[::-1]
+        if self.records is not None:
+            self.records.reverse()
+    
+    @abstractmethod
+    def _sort(self):
+        """Sort self.data (and self.records, if set) in place"""
         pass
     
+    def sort_batch(self, batch):
+        """
+        Sort many independent arrays without visualization
+        
+        A 2-D NumPy array takes the algorithm's vectorized fast path when it
+        has one; otherwise each row is sorted in turn with the visualizer
+        disabled. Per-row statistics are available from get_batch_stats()
+        and get_stats() returns their totals.
+        
+        Args:
+            batch: Sequence of lists, or a 2-D NumPy array with one array per row
+            
+        Returns:
+            Sorted rows, as a 2-D array for array input or a list of lists
+        """
+        result = None
+        if _is_ndarray(batch) and batch.ndim == 2:
+            result = self._sort_batch_array(batch)
+        
+        if result is None:
+            rows = batch.tolist() if _is_ndarray(batch) else batch
+            visualizer, self.visualizer = self.visualizer, None
+            sorted_rows = []
+            stats = {}
+            try:
+                for row in rows:
+                    sorted_rows.append(self.sort(row))
+                    for name, value in self.get_stats().items():
+                        stats.setdefault(name, []).append(value)
+            finally:
+                self.visualizer = visualizer
+            
+            if _is_ndarray(batch):
+                import numpy as np
+                sorted_rows = np.array(sorted_rows, dtype=batch.dtype).reshape(batch.shape)
+            result = (sorted_rows, stats)
+        
+        sorted_rows, self.batch_stats = result
+        self.comparisons = int(sum(self.batch_stats.get('comparisons', [])))
+        self.swaps = int(sum(self.batch_stats.get('swaps', [])))
+        self.accesses = int(sum(self.batch_stats.get('accesses', [])))
+        self.writes = int(sum(self.batch_stats.get('writes', [])))
+        return sorted_rows
+    
+    def _sort_batch_array(self, batch):
+        """
+        Vectorized batch sort hook for subclasses
+        
+        Args:
+            batch: 2-D NumPy array, one array per row
+            
+        Returns:
+            Tuple of (sorted array, per-row stats dict) or None when the
+            algorithm has no fast path for this input
+        """
+        return None
+    
+    def get_batch_stats(self) -> Optional[dict]:
+        """
+        Get per-row statistics from the last sort_batch call
+        
+        Returns:
+            Dictionary mapping comparisons, swaps, accesses and writes to one
+            value per row, or None if sort_batch has not been called
+        """
+        return self.batch_stats
+    
     @abstractmethod
     def get_name(self) -> str:
         """Return the name of the sorting algorithm"""
@@ -92,15 +446,44 @@ class BaseSorter(ABC):
         """
         pass
     
+    def get_cost(self, weights: Optional[dict] = None) -> float:
+        """
+        Weighted operation cost of the last sort
+        
+        Reads are the accesses that were not writes; a swap's reads and
+        writes are already counted there, so its own weight is any extra
+        per-exchange overhead.
+        
+        Args:
+            weights: Weights overriding Config.COST_WEIGHTS, by 'compare',
+                'read', 'write' and 'swap' (optional)
+        
+        Returns:
+            Weighted sum of comparisons, reads, writes and swaps
+        """
+        w = dict(Config.COST_WEIGHTS, **(weights or {}))
+        return (w['compare'] * self.comparisons
+                + w['read'] * (self.accesses - self.writes)
+                + w['write'] * self.writes
+                + w['swap'] * self.swaps)
+    
     def get_stats(self) -> dict:
         """
         Get statistics from the last sort
         
         Returns:
-            Dictionary with comparisons, swaps, and accesses
+            Dictionary with comparisons, swaps, accesses, writes and the
+            weighted cost, plus the remaining and initial inversions when
+            tracking them
         """
-        return {
+        stats = {
             'comparisons': self.comparisons,
             'swaps': self.swaps,
-            'accesses': self.accesses
-        }
\ No newline at end of file
+            'accesses': self.accesses,
+            'writes': self.writes,
+            'cost': self.get_cost()
+        }
+        if self.tracker is not None:
+            stats['inversions'] = self.tracker.count
+            stats['initial_inversions'] = self.tracker.total
+        return stats
\ No newline at end of file
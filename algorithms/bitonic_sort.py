@@ -0,0 +1,73 @@
+"""
+BitonicSort implementation with visualization
+"""
+from .network_sorter import NetworkSorter
+
+
+class BitonicSort(NetworkSorter):
+    """
+    Bitonic sorting network
+    
+    Uses the all-ascending form of the network, where the first stage of
+    each merge compares mirrored positions. The network runs on the stable
+    ranks of the keys rather than the keys themselves, so any comparable
+    keys work (strings, tuples) and equal keys end in input order. The ranks
+    are padded to the next power of two with rank n. Every stage is a fixed
+    set of independent compare-exchange pairs, run as one vectorized NumPy
+    minimum/maximum and shown as a single frame, so a sort emits O(log² n)
+    frames.
+    """
+    
+    __slots__ = ()
+    
+    def get_name(self) -> str:
+        return "BitonicSort"
+    
+    def get_complexity(self) -> dict:
+        return {
+            'time_best': 'O(n log² n)',
+            'time_avg': 'O(n log² n)',
+            'time_worst': 'O(n log² n)',
+            'space': 'O(n)'
+        }
+    
+    def _width(self, n: int) -> int:
+        return 1 << (n - 1).bit_length() if n > 1 else n
+    
+    def _rounds(self, width: int):
+        """
+        Yield the (block size, distance) pair of every network stage
+        
+        Args:
+            width: Power-of-two network width
+        """
+        k = 2
+        while k <= width:
+            j = k // 2
+            while j >= 1:
+                yield (k, j), {'state': 'stage', 'stage': (k, j)}
+                j //= 2
+            k *= 2
+    
+    @staticmethod
+    def _halves(rows, k: int, j: int):
+        """
+        Split rows into the low and high side of every pair in a stage
+        
+        The first stage of a k-block (j == k / 2) pairs mirrored positions
+        b*k + t and b*k + k - 1 - t; later stages pair i with i + j.
+        
+        Args:
+            rows: 2-D NumPy array of power-of-two width
+            k: Size of the blocks being merged
+            j: Distance between paired elements
+            
+        Returns:
+            Tuple of (low, high) views into rows
+        """
+        count, size = rows.shape
+        if j == k // 2:
+            blocks = rows.reshape(count, size // k, k)
+            return blocks[:, :, :j], blocks[:, :, :j - 1:-1]
+        blocks = rows.reshape(count, size // (2 * j), 2, j)
+        return blocks[:, :, 0, :], blocks[:, :, 1, :]
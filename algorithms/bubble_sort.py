@@ -1,12 +1,15 @@
 """
 BubbleSort implementation with visualization
 """
-from typing import List
-from .base_sorter import BaseSorter
+from .base_sorter import BaseSorter, BATCH_BLOCK_ELEMENTS, _count_left_greater
 
 
 class BubbleSort(BaseSorter):
-    """BubbleSort algorithm"""
+    """BubbleSort algorithm (stable: only strictly out-of-order neighbours swap)"""
+    
+    STABLE = True
+    
+    __slots__ = ()
     
     def get_name(self) -> str:
         return "BubbleSort"
@@ -19,23 +22,10 @@ class BubbleSort(BaseSorter):
             'space': 'O(1)'
         }
     
-    def sort(self, data: List[int]) -> List[int]:
-        """
-        Sort using BubbleSort algorithm
-        
-        Args:
-            data: List to sort
-            
-        Returns:
-            Sorted list
-        """
-        self.data = data[:]
-        self.reset_stats()
+    def _sort(self):
+        """Sort self.data in place using BubbleSort algorithm"""
         n = len(self.data)
         
-        # Initial visualization
-        self.visualize(state='initial')
-        
         # Bubble sort with optimization
         for i in range(n):
             swapped = False
@@ -71,8 +61,41 @@ class BubbleSort(BaseSorter):
             # If no swaps occurred, array is sorted
             if not swapped:
                 break
+    
+    def _sort_batch_array(self, batch):
+        """
+        Vectorized batch sort with exact per-row statistics
         
-        # Final visualization
-        self.visualize(state='complete')
+        Every swap removes one inversion, and each pass moves every element
+        that still has a greater element before it one step left, so the
+        number of passes is one more than the largest such count.
         
-        return self.data
\ No newline at end of file
+        Args:
+            batch: 2-D NumPy array, one array per row
+            
+        Returns:
+            Tuple of (sorted array, per-row stats dict), or None for rows
+            too long for the pairwise inversion count
+        """
+        import numpy as np
+        
+        rows, n = batch.shape
+        if n * n > BATCH_BLOCK_ELEMENTS:
+            return None
+        
+        left_greater = _count_left_greater(batch)
+        swaps = left_greater.sum(axis=1)
+        if n:
+            passes = np.minimum(left_greater.max(axis=1) + 1, n)
+        else:
+            passes = np.zeros(rows, dtype=np.int64)
+        # Pass p makes n - 1 - p comparisons
+        comparisons = passes * (n - 1) - passes * (passes - 1) // 2
+        
+        stats = {
+            'comparisons': comparisons,
+            'swaps': swaps,
+            'accesses': 2 * comparisons + 4 * swaps,
+            'writes': 2 * swaps
+        }
+        return np.sort(batch, axis=1, kind='stable'), stats
\ No newline at end of file
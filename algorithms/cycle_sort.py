@@ -0,0 +1,112 @@
+"""
+CycleSort implementation with visualization
+"""
+from analysis.access_trace import COMPARE
+from .base_sorter import BaseSorter
+
+
+class CycleSort(BaseSorter):
+    """
+    CycleSort: writes every misplaced element once, straight to its final slot
+    
+    The permutation is followed cycle by cycle. The element held in hand is
+    counted against the rest of the unsorted part to find its destination,
+    skipping past equal keys already placed there, and swapped with whatever
+    sits there, which becomes the next element in hand. The number of
+    writes is the minimum possible, the number of misplaced elements, at
+    O(n²) comparisons. Not stable.
+    """
+    
+    __slots__ = ()
+    
+    def get_name(self) -> str:
+        return "CycleSort"
+    
+    def get_complexity(self) -> dict:
+        return {
+            'time_best': 'O(n²)',
+            'time_avg': 'O(n²)',
+            'time_worst': 'O(n²)',
+            'space': 'O(1)'
+        }
+    
+    def _order(self, i: int, value) -> int:
+        """
+        Three-way comparison of data[i] with the key in hand, counted as one
+        
+        Args:
+            i: Index
+            value: Key in hand
+        
+        Returns:
+            -1, 0 or 1 as data[i] is smaller than, equal to or greater than value
+        """
+        self.comparisons += 1
+        self.accesses += 1
+        if self.trace is not None:
+            self.trace.add(COMPARE, i)
+        if self.memory is not None:
+            self.memory.read(i)
+        key = self.data[i]
+        if key < value:
+            return -1
+        return 1 if value < key else 0
+    
+    def _destination(self, start: int, value) -> int:
+        """
+        Final position of the key in hand for the cycle started at start
+        
+        Args:
+            start: Start of the unsorted part (and of the cycle)
+            value: Key in hand
+        
+        Returns:
+            start plus the number of smaller keys after it, moved past any
+            equal keys already written there
+        """
+        pos = start
+        for i in range(start + 1, len(self.data)):
+            if self._order(i, value) < 0:
+                pos += 1
+        while pos != start and self._order(pos, value) == 0:
+            pos += 1
+        return pos
+    
+    def _sort(self):
+        """Sort self.data in place using CycleSort algorithm"""
+        n = len(self.data)
+        
+        for start in range(n - 1):
+            value = self.data[start]
+            record = self._record(start)
+            self.accesses += 1
+            if self.memory is not None:
+                self.memory.read(start)
+            
+            pos = self._destination(start, value)
+            moved = pos != start
+            # The slot at start holds the key in hand until its cycle closes
+            while pos != start:
+                displaced, displaced_record = self.data[pos], self._record(pos)
+                self.accesses += 1
+                if self.memory is not None:
+                    self.memory.read(pos)
+                self._store(pos, value, record)
+                self.accesses += 1
+                if self.tracker is not None:
+                    self.tracker.swap(start, pos)
+                
+                self.visualize(
+                    state='cycle_write',
+                    current_idx=pos,
+                    pivot_idx=start,
+                    sorted_section=(0, start - 1) if start else None
+                )
+                value, record = displaced, displaced_record
+                pos = self._destination(start, value)
+            
+            if moved:
+                self._store(start, value, record)
+                self.accesses += 1
+            
+            self.visualize(state='cycle_closed', sorted_section=(0, start))
@@ -0,0 +1,90 @@
+"""
+HeapSort implementation with visualization
+"""
+from .base_sorter import BaseSorter
+
+
+class HeapSort(BaseSorter):
+    """
+    HeapSort on an array-backed binary max-heap (not stable)
+    
+    The heap is built bottom-up (Floyd's O(n) heapify) and every sift uses
+    Floyd's bottom-up variant: the hole descends to a leaf along the larger
+    children at one comparison per level, then climbs back to where the
+    sifted key belongs, usually only a level or two. That saves close to
+    half the comparisons of the textbook sift-down, which compares with
+    both children on every level.
+    """
+    
+    __slots__ = ()
+    
+    def get_name(self) -> str:
+        return "HeapSort"
+    
+    def get_complexity(self) -> dict:
+        return {
+            'time_best': 'O(n log n)',
+            'time_avg': 'O(n log n)',
+            'time_worst': 'O(n log n)',
+            'space': 'O(1)'
+        }
+    
+    def _sort(self):
+        """Sort self.data in place using HeapSort algorithm"""
+        n = len(self.data)
+        
+        # Build the heap bottom-up
+        for root in range(n // 2 - 1, -1, -1):
+            self._sift_down(root, n, n)
+        self.visualize(state='heap_built', section_range=(0, n - 1))
+        
+        # Move the maximum behind the heap and restore it
+        for end in range(n - 1, 0, -1):
+            self.swap(0, end)
+            self.visualize(
+                state='swapped',
+                swap_indices=(0, end),
+                section_range=(0, end - 1),
+                sorted_section=(end, n - 1)
+            )
+            self._sift_down(0, end, n)
+    
+    def _sift_down(self, root: int, end: int, n: int):
+        """
+        Sift data[root] into the max-heap data[0:end] with Floyd's method
+        
+        Args:
+            root: Index of the key to sift
+            end: Heap size
+            n: Length of the data, for the sorted section shown
+        """
+        # Descend to a leaf along the larger children
+        leaf = root
+        child = 2 * leaf + 1
+        while child + 1 < end:
+            leaf = child + 1 if self.compare(child, child + 1) else child
+            child = 2 * leaf + 1
+        if child < end:
+            leaf = child
+        
+        # Climb back to the first node not below the sifted key
+        while leaf > root and not self.compare(root, leaf):
+            leaf = (leaf - 1) // 2
+        if leaf == root:
+            return
+        
+        path = [leaf]
+        while path[-1] != root:
+            path.append((path[-1] - 1) // 2)
+        path.reverse()
+        
+        # Rotate the path: its nodes move up a level, the key drops to leaf
+        for parent, node in zip(path, path[1:]):
+            self.swap(parent, node)
+        
+        self.visualize(
+            state='sifting',
+            swap_indices=path,
+            section_range=(0, end - 1),
+            sorted_section=(end, n - 1) if end < n else None
+        )
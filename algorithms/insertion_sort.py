@@ -1,12 +1,16 @@
 """
 InsertionSort implementation with visualization
 """
-from typing import List
-from .base_sorter import BaseSorter
+from analysis.access_trace import COMPARE
+from .base_sorter import BaseSorter, BATCH_BLOCK_ELEMENTS, _count_left_greater
 
 
 class InsertionSort(BaseSorter):
-    """InsertionSort algorithm"""
+    """InsertionSort algorithm (stable: only strictly greater keys shift)"""
+    
+    STABLE = True
+    
+    __slots__ = ()
     
     def get_name(self) -> str:
         return "InsertionSort"
@@ -19,27 +23,17 @@ class InsertionSort(BaseSorter):
             'space': 'O(1)'
         }
     
-    def sort(self, data: List[int]) -> List[int]:
-        """
-        Sort using InsertionSort algorithm
-        
-        Args:
-            data: List to sort
-            
-        Returns:
-            Sorted list
-        """
-        self.data = data[:]
-        self.reset_stats()
+    def _sort(self):
+        """Sort self.data in place using InsertionSort algorithm"""
         n = len(self.data)
         
-        # Initial visualization
-        self.visualize(state='initial')
-        
         # Insertion sort
         for i in range(1, n):
             key = self.data[i]
+            record = self._record(i)
             self.accesses += 1
+            if self.memory is not None:
+                self.memory.read(i)
             
             # Show current element being inserted
             self.visualize(
@@ -54,6 +48,10 @@ class InsertionSort(BaseSorter):
             while j >= 0:
                 self.comparisons += 1
                 self.accesses += 1
+                if self.trace is not None:
+                    self.trace.add(COMPARE, j)
+                if self.memory is not None:
+                    self.memory.read(j)
                 
                 # Show comparison
                 self.visualize(
@@ -63,8 +61,11 @@ class InsertionSort(BaseSorter):
                 )
                 
                 if self.data[j] > key:
-                    self.data[j + 1] = self.data[j]
+                    self._store(j + 1, self.data[j], self._record(j))
                     self.accesses += 1
+                    if self.tracker is not None:
+                        # The key logically moves one slot left
+                        self.tracker.swap(j, j + 1)
                     
                     # Show shift
                     self.visualize(
@@ -78,7 +79,7 @@ class InsertionSort(BaseSorter):
                     break
             
             # Insert key in correct position
-            self.data[j + 1] = key
+            self._store(j + 1, key, record)
             self.accesses += 1
             
             # Show insertion
@@ -87,8 +88,40 @@ class InsertionSort(BaseSorter):
                 inserted_idx=j + 1,
                 sorted_section=(0, i)
             )
+    
+    def _sort_batch_array(self, batch):
+        """
+        Vectorized batch sort with exact per-row statistics
         
-        # Final visualization
-        self.visualize(state='complete')
+        Each element shifts past every earlier, greater element, and costs
+        one extra comparison unless it ends up at the front of the prefix,
+        so the counts follow from per-position inversion counts.
         
-        return self.data
\ No newline at end of file
+        Args:
+            batch: 2-D NumPy array, one array per row
+            
+        Returns:
+            Tuple of (sorted array, per-row stats dict), or None for rows
+            too long for the pairwise inversion count
+        """
+        import numpy as np
+        
+        rows, n = batch.shape
+        if n * n > BATCH_BLOCK_ELEMENTS:
+            return None
+        
+        left_greater = _count_left_greater(batch)
+        shifts = left_greater.sum(axis=1)
+        stops = (left_greater[:, 1:] < np.arange(1, n)).sum(axis=1)
+        comparisons = shifts + stops
+        
+        stats = {
+            'comparisons': comparisons,
+            'swaps': np.zeros(rows, dtype=np.int64),
+            # key read + final write per element, one read per comparison,
+            # one write per shift
+            'accesses': 2 * max(n - 1, 0) + comparisons + shifts,
+            # final write per element, one per shift
+            'writes': max(n - 1, 0) + shifts
+        }
+        return np.sort(batch, axis=1, kind='stable'), stats
\ No newline at end of file
@@ -1,12 +1,34 @@
 """
 MergeSort implementation with visualization
 """
-from typing import List
+from config import Config
+from analysis.access_trace import COMPARE
 from .base_sorter import BaseSorter
 
 
 class MergeSort(BaseSorter):
-    """MergeSort algorithm"""
+    """
+    MergeSort algorithm (stable: ties are taken from the left half first)
+    
+    Sections of at most Config.MERGE_INSERTION_CUTOFF elements are
+    insertion-sorted instead of split further (0 disables the cutoff).
+    """
+    
+    STABLE = True
+    
+    TUNABLE = {'MERGE_INSERTION_CUTOFF': (0, 4, 8, 12, 16, 24, 32, 48)}
+    
+    __slots__ = ('cutoff',)
+    
+    def __init__(self, visualizer=None):
+        """
+        Initialize sorter
+        
+        Args:
+            visualizer: Callback function for visualization (optional)
+        """
+        super().__init__(visualizer)
+        self.cutoff = 0
     
     def get_name(self) -> str:
         return "MergeSort"
@@ -19,29 +41,10 @@ class MergeSort(BaseSorter):
             'space': 'O(n)'
         }
     
-    def sort(self, data: List[int]) -> List[int]:
-        """
-        Sort using MergeSort algorithm
-        
-        Args:
-            data: List to sort
-            
-        Returns:
-            Sorted list
-        """
-        self.data = data[:]
-        self.reset_stats()
-        
-        # Initial visualization
-        self.visualize(state='initial')
-        
-        # Sort
+    def _sort(self):
+        """Sort self.data in place using MergeSort algorithm"""
+        self.cutoff = Config.tuned('MERGE_INSERTION_CUTOFF', len(self.data))
         self._mergesort(0, len(self.data) - 1)
-        
-        # Final visualization
-        self.visualize(state='complete')
-        
-        return self.data
     
     def _mergesort(self, left: int, right: int):
         """
@@ -53,6 +56,10 @@ class MergeSort(BaseSorter):
         """
         if left >= right:
             return
+        if right - left < self.cutoff:
+            self._insertion_range(left, right)
+            self.visualize(state='inserted', sorted_section=(left, right))
+            return
         
         mid = (left + right) // 2
         
@@ -80,8 +87,12 @@ class MergeSort(BaseSorter):
             right: Ending index
         """
         # Create copies of the subarrays
-        left_copy = self.data[left:mid + 1]
-        right_copy = self.data[mid + 1:right + 1]
+        left_copy, left_records = self._copy_range(left, mid + 1)
+        right_copy, right_records = self._copy_range(mid + 1, right + 1)
+        tracker = self.tracker
+        if tracker is not None:
+            tracker.begin_merge(left, mid, right)
+        memory = self.memory
         
         # Show merging sections
         self.visualize(
@@ -97,14 +108,29 @@ class MergeSort(BaseSorter):
         while i < len(left_copy) and j < len(right_copy):
             self.comparisons += 1
             self.accesses += 2
+            if self.trace is not None:
+                # Traced at the positions the copies were taken from
+                self.trace.add(COMPARE, left + i)
+                self.trace.add(COMPARE, mid + 1 + j)
+            if memory is not None:
+                memory.read_scratch(left + i)
+                memory.read_scratch(mid + 1 + j)
             
             if left_copy[i] <= right_copy[j]:
-                self.data[k] = left_copy[i]
+                if memory is not None:
+                    memory.read_scratch(left + i)
+                self._store(k, left_copy[i], left_records[i] if left_records else None)
                 self.accesses += 1
+                if tracker is not None:
+                    tracker.merge_take(True)
                 i += 1
             else:
-                self.data[k] = right_copy[j]
+                if memory is not None:
+                    memory.read_scratch(mid + 1 + j)
+                self._store(k, right_copy[j], right_records[j] if right_records else None)
                 self.accesses += 1
+                if tracker is not None:
+                    tracker.merge_take(False)
                 j += 1
             
             # Show merge progress
@@ -117,14 +143,22 @@ class MergeSort(BaseSorter):
         
         # Copy remaining elements
         while i < len(left_copy):
-            self.data[k] = left_copy[i]
+            if memory is not None:
+                memory.read_scratch(left + i)
+            self._store(k, left_copy[i], left_records[i] if left_records else None)
             self.accesses += 1
+            if tracker is not None:
+                tracker.merge_take(True)
             i += 1
             k += 1
         
         while j < len(right_copy):
-            self.data[k] = right_copy[j]
+            if memory is not None:
+                memory.read_scratch(mid + 1 + j)
+            self._store(k, right_copy[j], right_records[j] if right_records else None)
             self.accesses += 1
+            if tracker is not None:
+                tracker.merge_take(False)
             j += 1
             k += 1
         
@@ -0,0 +1,246 @@
+"""
+Shared driver for sorting networks run as vectorized compare-exchange rounds
+"""
+from abc import abstractmethod
+from array import array
+from typing import Optional
+from analysis.access_trace import COMPARE
+from .base_sorter import BaseSorter, _is_ndarray, _key_array, _stable_ranks
+
+
+class NetworkSorter(BaseSorter):
+    """
+    Base class for sorting networks such as BitonicSort and OddEvenSort
+    
+    Subclasses describe the network: _width() gives the number of wires for
+    n elements and _rounds() yields the rounds of disjoint compare-exchange
+    pairs, each split into low and high sides by _halves(). Every round runs
+    as one vectorized NumPy minimum/maximum over those views and is shown as
+    a single frame.
+    
+    The network runs on the stable ranks of the keys rather than the keys
+    themselves, so any comparable keys work (strings, tuples), equal keys
+    end in input order, and extra wires are padded with rank n. Ascending
+    comparators never move that padding below index n, so pairs reaching
+    into it are skipped.
+    """
+    
+    STABLE = True
+    
+    # Stop after this many rounds in a row without an exchange (None runs all)
+    QUIET_ROUNDS: Optional[int] = None
+    
+    __slots__ = ()
+    
+    def _width(self, n: int) -> int:
+        """Number of wires the network needs for n elements"""
+        return n
+    
+    @abstractmethod
+    def _rounds(self, width: int):
+        """
+        Yield every round of the network
+        
+        Args:
+            width: Number of wires
+        
+        Yields:
+            Tuple of (arguments for _halves(), visualization parameters)
+        """
+        pass
+    
+    @staticmethod
+    @abstractmethod
+    def _halves(rows, *args):
+        """
+        Split rows into the low and high side of every pair in a round
+        
+        Args:
+            rows: 2-D NumPy array of network width
+            *args: Round arguments yielded by _rounds()
+        
+        Returns:
+            Tuple of (low, high) views into rows
+        """
+        pass
+    
+    def _sort(self):
+        """Sort self.data by running the network on its ranks"""
+        import numpy as np
+        
+        target = self.data
+        keys = _key_array(target)
+        n = len(keys)
+        
+        order, ranks = _stable_ranks(keys[None, :])
+        # Rank r belongs to the key at keys[order[r]]
+        keys = keys[order[0]]
+        buffer = self._padded(ranks)
+        wires = np.arange(buffer.shape[1])[None, :]
+        
+        quiet = 0
+        for args, frame in self._rounds(buffer.shape[1]):
+            if quiet == self.QUIET_ROUNDS:
+                break
+            low, high = self._pairs(wires, n, args)
+            if self.tracker is not None:
+                # Pairs this round exchanges, read before it runs
+                moved = buffer[0, low] > buffer[0, high]
+            swapped = int(self._exchange(buffer, args)[0])
+            quiet = 0 if swapped else quiet + 1
+            self.comparisons += len(low)
+            self.swaps += swapped
+            self.accesses += 2 * len(low) + 4 * swapped
+            self.writes += 2 * swapped
+            if self.visualizer:
+                # Gather the keys in their current order only for display
+                self.data = keys[buffer[0, :n]]
+            if self.tracker is not None:
+                self._track(keys, buffer[0, :n], low[moved], high[moved])
+            if self.trace is not None:
+                self.trace.extend(COMPARE, np.concatenate([low, high]))
+            if self.memory is not None:
+                self.memory.exchange_many(np.column_stack([low, high]).ravel().tolist())
+            if self.changes is not None:
+                self.changes.extend(low)
+                self.changes.extend(high)
+            
+            # Show the whole round as one frame
+            self.visualize(
+                exchange_pairs=(low, high),
+                comparing_indices=np.concatenate([low, high]),
+                **frame
+            )
+        
+        # The network's final order, not the argsort, decides the output
+        final = buffer[0, :n]
+        keys = keys[final]
+        
+        # Write back into the caller's buffer type
+        if _is_ndarray(target):
+            target[...] = keys
+        elif isinstance(target, array):
+            target[:] = array(target.typecode, keys.tobytes())
+        else:
+            target[:] = keys.tolist()
+        self.data = target
+        if self.records is not None:
+            self.records[:] = [self.records[i] for i in order[0][final]]
+    
+    def _track(self, keys, ranks, low, high):
+        """
+        Update the inversion tracker after a round
+        
+        Recounts from scratch in O(n log n); networks whose exchanges have
+        a cheaper effect override this.
+        
+        Args:
+            keys: Keys in stable-rank order
+            ranks: Stable rank at each position after the round
+            low: Low indices of the pairs the round exchanged
+            high: High indices of the pairs the round exchanged
+        """
+        # Recount on the keys: ranks would count ties as inversions
+        self.tracker.reset(keys[ranks])
+    
+    def _padded(self, ranks):
+        """
+        Copy rank rows into a buffer of network width padded with rank n
+        
+        Args:
+            ranks: 2-D NumPy array of stable ranks, one row per array
+        
+        Returns:
+            Padded copy of ranks
+        """
+        import numpy as np
+        
+        rows, n = ranks.shape
+        buffer = np.full((rows, self._width(n)), n, dtype=ranks.dtype)
+        buffer[:, :n] = ranks
+        return buffer
+    
+    def _pairs(self, wires, n: int, args: tuple):
+        """
+        Index pairs of a round that lie entirely inside the real data
+        
+        Args:
+            wires: 1 x width NumPy array of wire indices
+            n: Number of real (unpadded) elements
+            args: Round arguments yielded by _rounds()
+        
+        Returns:
+            Tuple of (low, high) index arrays
+        """
+        low, high = self._halves(wires, *args)
+        low, high = low.ravel(), high.ravel()
+        if wires.shape[1] == n:
+            return low, high
+        inside = high < n
+        return low[inside], high[inside]
+    
+    def _exchange(self, buffer, args: tuple):
+        """
+        Run one ascending compare-exchange round in place on every row
+        
+        Args:
+            buffer: 2-D NumPy array of network width
+            args: Round arguments yielded by _rounds()
+        
+        Returns:
+            Number of exchanged pairs per row
+        """
+        import numpy as np
+        
+        low, high = self._halves(buffer, *args)
+        exchanged = low > high
+        smaller = np.minimum(low, high)
+        high[...] = np.maximum(low, high)
+        low[...] = smaller
+        return exchanged.reshape(len(buffer), -1).sum(axis=1)
+    
+    def _sort_batch_array(self, batch):
+        """
+        Run the network on every row at once
+        
+        With QUIET_ROUNDS set, a row stops counting comparisons once it has
+        gone that many rounds without an exchange, as it would when sorted
+        on its own.
+        
+        Args:
+            batch: 2-D NumPy array, one array per row
+        
+        Returns:
+            Tuple of (sorted array, per-row stats dict)
+        """
+        import numpy as np
+        
+        rows, n = batch.shape
+        order, ranks = _stable_ranks(batch)
+        buffer = self._padded(ranks)
+        wires = np.arange(buffer.shape[1])[None, :]
+        comparisons = np.zeros(rows, dtype=np.int64)
+        swaps = np.zeros(rows, dtype=np.int64)
+        quiet = np.zeros(rows, dtype=np.int64)
+        for args, _ in self._rounds(buffer.shape[1]):
+            if self.QUIET_ROUNDS is None:
+                active = True
+            else:
+                active = quiet < self.QUIET_ROUNDS
+                if not active.any():
+                    break
+            # Finished rows are sorted and exchange nothing
+            swapped = self._exchange(buffer, args)
+            comparisons += active * len(self._pairs(wires, n, args)[0])
+            swaps += swapped
+            quiet = np.where(swapped > 0, 0, quiet + 1)
+        
+        stats = {
+            'comparisons': comparisons,
+            'swaps': swaps,
+            'accesses': 2 * comparisons + 4 * swaps,
+            'writes': 2 * swaps
+        }
+        # Follow the network's final order rather than the argsort
+        order = np.take_along_axis(order, buffer[:, :n], axis=1)
+        return np.take_along_axis(batch, order, axis=1), stats
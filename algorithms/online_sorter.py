@@ -0,0 +1,376 @@
+"""
+Online sorting of values that arrive one at a time
+"""
+import time
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Optional
+from config import Config
+from .base_sorter import BaseSorter
+
+
+class OnlineSorter(BaseSorter):
+    """
+    Keeps values sorted as they arrive, with a sorted view at every moment
+    
+    Values live in a list of sorted chunks plus the maximum of each chunk.
+    An insert binary-searches the maxima, then the chunk, and shifts the
+    chunk's tail, so it costs O(log n) comparisons and O(load) moves,
+    load being Config.ONLINE_LOAD. A chunk growing past twice the load is
+    split in half; one shrinking below half of it after a remove is merged
+    into a neighbour.
+    
+    Values are fed with insert(), feed() (any iterable, e.g. a generator)
+    or afeed() (an async iterable). sort() replaces the contents and inserts
+    the input one element at a time. Arrivals are visualized as a
+    fixed-length view: the sorted values followed by the inputs still to
+    arrive (nothing, for streams). Comparisons are counted as the
+    binary-search depth and accesses include every shifted element.
+    get_stats() adds insert, remove and query counts with their rates
+    (operations per second of time spent in them).
+    """
+    
+    STABLE = True
+    
+    __slots__ = ('load', 'chunks', 'maxes', 'record_chunks', 'size', 'inserts',
+                 'removes', 'queries', 'insert_time', 'query_time')
+    
+    def __init__(self, visualizer=None, load: Optional[int] = None):
+        """
+        Initialize an empty sorter
+        
+        Args:
+            visualizer: Callback function for visualization (optional)
+            load: Target chunk length (default: Config.ONLINE_LOAD)
+        """
+        super().__init__(visualizer)
+        self.load = load or Config.ONLINE_LOAD
+        self.clear()
+    
+    def get_name(self) -> str:
+        return "Online Sort"
+    
+    def get_complexity(self) -> dict:
+        return {
+            'time_best': 'O(n log n)',
+            'time_avg': 'O(n log n)',
+            'time_worst': 'O(n log n)',
+            'space': 'O(n)'
+        }
+    
+    def clear(self, keyed: bool = False):
+        """
+        Drop all values and reset the counters
+        
+        Args:
+            keyed: Carry a record alongside each value
+        """
+        self.chunks: List[list] = []
+        self.maxes: list = []
+        self.record_chunks: Optional[List[list]] = [] if keyed else None
+        self.size = 0
+        self.inserts = 0
+        self.removes = 0
+        self.queries = 0
+        self.insert_time = 0.0
+        self.query_time = 0.0
+        self.reset_stats()
+        self.data = []
+        self.records = None
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+    
+    def insert(self, value, record=None):
+        """
+        Insert one value after any equal ones
+        
+        Args:
+            value: Value (key) to insert
+            record: Record carried with the value (keyed sorters only)
+        """
+        start = time.perf_counter()
+        chunks, maxes = self.chunks, self.maxes
+        if not chunks:
+            chunks.append([value])
+            maxes.append(value)
+            if self.record_chunks is not None:
+                self.record_chunks.append([record])
+        else:
+            c = bisect_right(maxes, value)
+            self.comparisons += len(maxes).bit_length()
+            if c == len(chunks):
+                c -= 1
+            chunk = chunks[c]
+            i = bisect_right(chunk, value)
+            self.comparisons += len(chunk).bit_length()
+            chunk.insert(i, value)
+            if self.record_chunks is not None:
+                self.record_chunks[c].insert(i, record)
+            self.accesses += len(chunk) - i
+            self.writes += len(chunk) - i
+            if i == len(chunk) - 1:
+                maxes[c] = value
+            if len(chunk) > 2 * self.load:
+                self._split(c)
+        
+        self.size += 1
+        self.inserts += 1
+        self.insert_time += time.perf_counter() - start
+    
+    def extend(self, values: Iterable):
+        """
+        Insert every value of an iterable
+        
+        Args:
+            values: Values to insert
+        """
+        for value in values:
+            self.insert(value)
+    
+    def remove(self, value) -> bool:
+        """
+        Remove the first occurrence of a value
+        
+        Args:
+            value: Value to remove
+        
+        Returns:
+            True if the value was present
+        """
+        chunks, maxes = self.chunks, self.maxes
+        c = bisect_left(maxes, value)
+        self.comparisons += len(maxes).bit_length()
+        if c == len(chunks):
+            return False
+        chunk = chunks[c]
+        i = bisect_left(chunk, value)
+        self.comparisons += len(chunk).bit_length() + 1
+        if chunk[i] != value:
+            return False
+        
+        del chunk[i]
+        if self.record_chunks is not None:
+            del self.record_chunks[c][i]
+        self.accesses += len(chunk) - i
+        self.writes += len(chunk) - i
+        self.size -= 1
+        self.removes += 1
+        if not chunk:
+            del chunks[c], maxes[c]
+            if self.record_chunks is not None:
+                del self.record_chunks[c]
+        else:
+            maxes[c] = chunk[-1]
+            if len(chunk) < self.load // 2 and len(chunks) > 1:
+                self._merge(c - 1 if c else c)
+        return True
+    
+    def _split(self, c: int):
+        """
+        Split chunk c in two at the load
+        
+        Args:
+            c: Chunk index
+        """
+        chunk = self.chunks[c]
+        self.chunks[c:c + 1] = [chunk[:self.load], chunk[self.load:]]
+        self.maxes[c:c + 1] = [chunk[self.load - 1], chunk[-1]]
+        if self.record_chunks is not None:
+            records = self.record_chunks[c]
+            self.record_chunks[c:c + 1] = [records[:self.load], records[self.load:]]
+    
+    def _merge(self, c: int):
+        """
+        Merge chunk c + 1 into chunk c, splitting again if it grows too long
+        
+        Args:
+            c: Index of the left chunk
+        """
+        self.chunks[c].extend(self.chunks.pop(c + 1))
+        self.maxes.pop(c)
+        if self.record_chunks is not None:
+            self.record_chunks[c].extend(self.record_chunks.pop(c + 1))
+        if len(self.chunks[c]) > 2 * self.load:
+            self._split(c)
+    
+    def __getitem__(self, index: int):
+        """
+        Value at a position of the sorted view
+        
+        Args:
+            index: Position; negative values count from the end
+        
+        Returns:
+            Value at index
+        """
+        start = time.perf_counter()
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("OnlineSorter index out of range")
+        for chunk in self.chunks:
+            if index < len(chunk):
+                break
+            index -= len(chunk)
+        self.queries += 1
+        self.query_time += time.perf_counter() - start
+        return chunk[index]
+    
+    def rank(self, value) -> int:
+        """
+        Count values smaller than value
+        
+        Args:
+            value: Value to rank
+        
+        Returns:
+            Number of smaller values
+        """
+        start = time.perf_counter()
+        smaller = self._count_before(value, bisect_left)
+        self.queries += 1
+        self.query_time += time.perf_counter() - start
+        return smaller
+    
+    def _count_before(self, value, bisect) -> int:
+        """
+        Count values before the insertion point of value, in O(n / load)
+        
+        Args:
+            value: Value to look up
+            bisect: bisect_left (smaller values) or bisect_right (not greater)
+        
+        Returns:
+            Number of values before the insertion point
+        """
+        c = bisect(self.maxes, value)
+        before = sum(len(chunk) for chunk in self.chunks[:c])
+        if c < len(self.chunks):
+            before += bisect(self.chunks[c], value)
+        return before
+    
+    def snapshot(self) -> list:
+        """
+        Copy of the sorted values
+        
+        Returns:
+            Sorted list of the values inserted so far
+        """
+        return [value for chunk in self.chunks for value in chunk]
+    
+    def view(self) -> list:
+        """
+        Sorted values followed by the inputs of sort() still to arrive
+        
+        Returns:
+            List shown by the visualizer
+        """
+        return self.snapshot() + list(self.data[self.size:])
+    
+    def visualize(self, **kwargs):
+        """
+        Call the visualizer with the current view
+        
+        Args:
+            **kwargs: Visualization parameters
+        """
+        if self.tracker is not None:
+            self.tracker.mark(self.comparisons + self.swaps)
+        if self.visualizer:
+            self.visualizer(data=self.view(), **kwargs)
+    
+    def _arrive(self, value, record=None):
+        """
+        Insert an arriving value and show where it landed
+        
+        Args:
+            value: Arriving value
+            record: Record carried with the value (keyed sorters only)
+        """
+        source = self.size
+        self.insert(value, record)
+        if self.tracker is None and not self.visualizer:
+            return
+        # Arrivals land after equal values
+        position = self._count_before(value, bisect_right) - 1
+        if self.tracker is not None:
+            self.tracker.move(source, position)
+        if self.changes is not None:
+            # Everything from the landing spot to the arrival's old slot shifted
+            self.changes.extend(range(position, self.size))
+        self.visualize(
+            state='arrival',
+            current_idx=position,
+            sorted_section=(0, self.size - 1)
+        )
+    
+    def feed(self, source: Iterable) -> int:
+        """
+        Insert values from an iterable as they are produced
+        
+        Args:
+            source: Iterable or generator of values
+        
+        Returns:
+            Number of values inserted
+        """
+        count = 0
+        for value in source:
+            self._arrive(value)
+            count += 1
+        return count
+    
+    async def afeed(self, source) -> int:
+        """
+        Insert values from an async iterable as they arrive
+        
+        Args:
+            source: Async iterable of values, e.g. DataGenerator.stream()
+        
+        Returns:
+            Number of values inserted
+        """
+        count = 0
+        async for value in source:
+            self._arrive(value)
+            count += 1
+        return count
+    
+    def _sort(self):
+        """Insert self.data one element at a time, then write the result back"""
+        keys, records = self.data, self.records
+        self.clear(keyed=records is not None)
+        self.data, self.records = keys, records
+        
+        for i in range(len(keys)):
+            self.accesses += 1
+            self._arrive(keys[i], records[i] if records is not None else None)
+        
+        position = 0
+        for c, chunk in enumerate(self.chunks):
+            chunk_records = self.record_chunks[c] if self.record_chunks is not None else None
+            for i, value in enumerate(chunk):
+                self._store(position, value, chunk_records[i] if chunk_records else None)
+                self.accesses += 1
+                position += 1
+    
+    def get_stats(self) -> dict:
+        """
+        Get statistics with throughput counters
+        
+        Returns:
+            Dictionary with comparisons, swaps and accesses, plus inserts,
+            removes, queries, insert_rate, query_rate and chunks
+        """
+        stats = super().get_stats()
+        stats['inserts'] = self.inserts
+        stats['removes'] = self.removes
+        stats['queries'] = self.queries
+        stats['insert_rate'] = self.inserts / self.insert_time if self.insert_time else 0.0
+        stats['query_rate'] = self.queries / self.query_time if self.query_time else 0.0
+        stats['chunks'] = len(self.chunks)
+        return stats
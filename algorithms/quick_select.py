@@ -0,0 +1,368 @@
+"""
+Selection and partial sorting (quickselect, heap-select, introselect)
+"""
+from random import randrange
+from typing import Callable, Optional
+from config import Config
+from analysis.access_trace import COMPARE
+from .quick_sort import QuickSort
+
+
+class QuickSelect(QuickSort):
+    """
+    Finds the k-th smallest element or the k smallest in order without a full sort
+    
+    select() and partial_sort() pick an engine by k:
+    
+    - heap-select for k up to Config.SELECT_HEAP_LIMIT: a bounded max-heap
+      of the k smallest seen so far sits in the array prefix and each later
+      element costs one comparison unless it beats the heap maximum,
+      O(n log k)
+    - introselect otherwise: quickselect with random pivots and a
+      three-way partition, so runs of equal keys never degrade it, that
+      switches to median-of-medians pivots after 2 log2(n) rounds,
+      O(n) expected and worst case
+    
+    Elements ruled out are shown with the 'discarded' highlight. Statistics
+    use the same counters as sort(), which remains a full QuickSort, so a
+    selection can be compared directly with sorting the same input.
+    """
+    
+    __slots__ = ('k', 'method')
+    
+    def __init__(self, visualizer=None):
+        """
+        Initialize selector
+        
+        Args:
+            visualizer: Callback function for visualization (optional)
+        """
+        super().__init__(visualizer)
+        self.k: Optional[int] = None
+        self.method: Optional[str] = None
+    
+    def get_name(self) -> str:
+        return "QuickSelect"
+    
+    def reset_stats(self):
+        """Reset statistics counters and forget the previous selection"""
+        super().reset_stats()
+        self.k = None
+        self.method = None
+    
+    def select(self, data, k: int, key: Optional[Callable] = None, copy: bool = True):
+        """
+        Find the k-th smallest element (0-based)
+        
+        Afterwards self.data is partitioned around position k: nothing
+        before it is greater and nothing after it is smaller.
+        
+        Args:
+            data: Sequence to select from
+            k: Rank of the element to find; 0 is the minimum
+            key: Function extracting a comparison key from each element (optional)
+            copy: Work on a copy of data (default) rather than data itself
+        
+        Returns:
+            The k-th smallest element (the original element when key is given)
+        
+        Raises:
+            IndexError: If k is not in range(len(data))
+        """
+        if not 0 <= k < len(data):
+            raise IndexError(f"k={k} out of range for {len(data)} elements")
+        self._begin(data, key, copy, k)
+        
+        if k + 1 <= Config.SELECT_HEAP_LIMIT:
+            self.method = 'heap'
+            self._heap_select(k + 1)
+            # The heap maximum is the k-th smallest; park it at k
+            if k:
+                self.swap(0, k)
+        else:
+            self.method = 'quickselect'
+            self._select_range(0, len(self.data) - 1, k)
+        
+        self.visualize(state='selected', pivot_idx=k)
+        return self.data[k] if self.records is None else self.records[k]
+    
+    def partial_sort(self, data, k: int, key: Optional[Callable] = None, copy: bool = True):
+        """
+        Move the k smallest elements, in sorted order, to the front
+        
+        Args:
+            data: Sequence to partially sort
+            k: Number of smallest elements to sort; clipped to [0, len(data)]
+            key: Function extracting a comparison key from each element (optional)
+            copy: Work on a copy of data (default) rather than data itself
+        
+        Returns:
+            The whole sequence, sorted in its first k positions and in no
+            particular order after them
+        """
+        k = max(0, min(k, len(data)))
+        self._begin(data, key, copy, k)
+        
+        if k:
+            if k <= Config.SELECT_HEAP_LIMIT:
+                self.method = 'heap'
+                self._heap_select(k)
+            else:
+                self.method = 'quickselect'
+                self._select_range(0, len(self.data) - 1, k - 1)
+                self._heapify(k)
+            self._heap_sort_prefix(k)
+        
+        self.visualize(state='selected', sorted_section=(0, k - 1) if k else None)
+        return self.data if self.records is None else self.records
+    
+    def _begin(self, data, key: Optional[Callable], copy: bool, k: int):
+        """
+        Load data and reset per-selection state
+        
+        Args:
+            data: Sequence to work on
+            key: Key function (optional)
+            copy: Work on a copy of data
+            k: Requested rank or count
+        """
+        self._load(data, key, copy)
+        self.k = k
+        if self.track_inversions:
+            from analysis import InversionTracker
+            self.tracker = InversionTracker(self.data)
+        else:
+            self.tracker = None
+        self.visualize(state='initial')
+    
+    def _discarded(self, low: int, high: int) -> list:
+        """
+        Ranges outside the live window [low, high]
+        
+        Args:
+            low: First live index
+            high: Last live index
+        
+        Returns:
+            List of inclusive (start, end) ranges
+        """
+        ranges = []
+        if low > 0:
+            ranges.append((0, low - 1))
+        if high < len(self.data) - 1:
+            ranges.append((high + 1, len(self.data) - 1))
+        return ranges
+    
+    def _select_range(self, low: int, high: int, k: int, deterministic: bool = False):
+        """
+        Place the k-th smallest element of data[low..high] at index k
+        
+        Args:
+            low: Starting index
+            high: Ending index
+            k: Target index, low <= k <= high
+            deterministic: Use median-of-medians pivots from the start
+        """
+        limit = 2 * max(1, (high - low + 1).bit_length())
+        rounds = 0
+        while low < high:
+            if deterministic or rounds >= limit:
+                if self.method == 'quickselect':
+                    self.method = 'quickselect+median_of_medians'
+                pivot_idx = self._median_of_medians(low, high)
+            else:
+                pivot_idx = randrange(low, high + 1)
+            
+            lt, gt = self._partition3(low, high, pivot_idx)
+            if k < lt:
+                high = lt - 1
+            elif k > gt:
+                low = gt + 1
+            else:
+                return
+            rounds += 1
+            
+            self.visualize(
+                state='discarded',
+                section_range=(low, high),
+                discarded_ranges=self._discarded(low, high)
+            )
+    
+    def _compare_pivot(self, i: int, pivot) -> int:
+        """
+        Three-way comparison of data[i] with a pivot value, counted as one
+        
+        Args:
+            i: Index
+            pivot: Pivot key
+        
+        Returns:
+            -1, 0 or 1 as data[i] is smaller than, equal to or greater than pivot
+        """
+        self.comparisons += 1
+        self.accesses += 1
+        if self.trace is not None:
+            self.trace.add(COMPARE, i)
+        if self.memory is not None:
+            self.memory.read(i)
+        value = self.data[i]
+        if value < pivot:
+            return -1
+        return 1 if pivot < value else 0
+    
+    def _partition3(self, low: int, high: int, pivot_idx: int):
+        """
+        Dutch national flag partition of data[low..high] around a pivot
+        
+        Args:
+            low: Starting index
+            high: Ending index
+            pivot_idx: Index of the pivot element
+        
+        Returns:
+            Tuple (lt, gt): data[low..lt-1] < pivot, data[lt..gt] == pivot
+            and data[gt+1..high] > pivot
+        """
+        pivot = self.data[pivot_idx]
+        self.accesses += 1
+        self.visualize(
+            state='pivot_selected',
+            pivot_idx=pivot_idx,
+            section_range=(low, high),
+            discarded_ranges=self._discarded(low, high)
+        )
+        
+        lt = i = low
+        gt = high
+        while i <= gt:
+            order = self._compare_pivot(i, pivot)
+            if order < 0:
+                if lt != i:
+                    self.swap(lt, i)
+                lt += 1
+                i += 1
+            elif order > 0:
+                if i != gt:
+                    self.swap(i, gt)
+                gt -= 1
+            else:
+                i += 1
+        
+        self.visualize(
+            state='partitioning',
+            left_indices=range(low, lt),
+            right_indices=range(gt + 1, high + 1),
+            section_range=(low, high),
+            discarded_ranges=self._discarded(low, high)
+        )
+        return lt, gt
+    
+    def _median_of_medians(self, low: int, high: int) -> int:
+        """
+        Choose a pivot guaranteed to split data[low..high] 30/70 or better
+        
+        Medians of groups of five are gathered at the front of the range
+        and their median is selected recursively.
+        
+        Args:
+            low: Starting index
+            high: Ending index
+        
+        Returns:
+            Index of the pivot
+        """
+        if high - low < 5:
+            self._insertion_range(low, high)
+            return (low + high) // 2
+        
+        count = 0
+        for start in range(low, high + 1, 5):
+            end = min(start + 4, high)
+            self._insertion_range(start, end)
+            median = (start + end) // 2
+            if median != low + count:
+                self.swap(median, low + count)
+            count += 1
+        
+        middle = low + (count - 1) // 2
+        self._select_range(low, low + count - 1, middle, deterministic=True)
+        return middle
+    
+    def _sift_down(self, root: int, end: int):
+        """
+        Restore the max-heap below root within data[0:end]
+        
+        Args:
+            root: Index to sift down from
+            end: Heap size
+        """
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end and self.compare(child, child + 1):
+                child += 1
+            if self.compare(child, root):
+                return
+            self.swap(root, child)
+            root = child
+    
+    def _heapify(self, size: int):
+        """
+        Build a max-heap in data[0:size]
+        
+        Args:
+            size: Heap size
+        """
+        for root in range(size // 2 - 1, -1, -1):
+            self._sift_down(root, size)
+    
+    def _heap_select(self, size: int):
+        """
+        Gather the size smallest elements in a max-heap at data[0:size]
+        
+        Args:
+            size: Number of elements to keep
+        """
+        self._heapify(size)
+        for i in range(size, len(self.data)):
+            # Anything not below the heap maximum is discarded
+            if not self.compare(0, i):
+                self.swap(0, i)
+                self._sift_down(0, size)
+                self.visualize(
+                    state='heap_select',
+                    section_range=(0, size - 1),
+                    current_idx=i,
+                    discarded_ranges=[(size, i)]
+                )
+    
+    def _heap_sort_prefix(self, size: int):
+        """
+        Sort the max-heap in data[0:size] into ascending order
+        
+        Args:
+            size: Heap size
+        """
+        for end in range(size - 1, 0, -1):
+            self.swap(0, end)
+            self._sift_down(0, end)
+            self.visualize(
+                state='heap_sort',
+                sorted_section=(end, size - 1),
+                discarded_ranges=self._discarded(0, size - 1)
+            )
+    
+    def get_stats(self) -> dict:
+        """
+        Get statistics from the last sort or selection
+        
+        Returns:
+            Dictionary with comparisons, swaps and accesses, plus select_k
+            and select_method after select() or partial_sort()
+        """
+        stats = super().get_stats()
+        if self.method is not None:
+            stats['select_k'] = self.k
+            stats['select_method'] = self.method
+        return stats
@@ -1,13 +1,41 @@
 """
 QuickSort implementation with visualization
 """
-from typing import List
-from random import randrange
+from random import Random
+from typing import Optional
+from config import Config
 from .base_sorter import BaseSorter
 
 
 class QuickSort(BaseSorter):
-    """QuickSort algorithm with in-place sorting"""
+    """
+    QuickSort algorithm with in-place sorting (not stable)
+    
+    Partitions of at most Config.QUICK_INSERTION_CUTOFF elements are
+    finished by insertion sort instead (0 disables the cutoff).
+    
+    Pivots come from a random.Random of the sorter's own, seeded with
+    self.seed at the start of every sort: a seeded sorter picks the same
+    pivots each time it sorts the same input, and the random module's
+    global state is never touched.
+    """
+    
+    TUNABLE = {'QUICK_INSERTION_CUTOFF': (0, 4, 8, 12, 16, 24, 32, 48)}
+    
+    __slots__ = ('cutoff', 'seed', 'rng')
+    
+    def __init__(self, visualizer=None, seed: Optional[int] = None):
+        """
+        Initialize sorter
+        
+        Args:
+            visualizer: Callback function for visualization (optional)
+            seed: Pivot seed (default: fresh pivots every sort)
+        """
+        super().__init__(visualizer)
+        self.cutoff = 0
+        self.seed = seed
+        self.rng = Random(seed)
     
     def get_name(self) -> str:
         return "QuickSort"
@@ -20,53 +48,45 @@ class QuickSort(BaseSorter):
             'space': 'O(log n)'
         }
     
-    def sort(self, data: List[int]) -> List[int]:
-        """
-        Sort using QuickSort algorithm
-        
-        Args:
-            data: List to sort
-            
-        Returns:
-            Sorted list
-        """
-        self.data = data[:]
-        self.reset_stats()
-        
-        # Initial visualization
-        self.visualize(state='initial')
-        
-        # Sort
+    def _sort(self):
+        """Sort self.data in place using QuickSort algorithm"""
+        self.cutoff = Config.tuned('QUICK_INSERTION_CUTOFF', len(self.data))
+        self.rng.seed(self.seed)
         self._quicksort(0, len(self.data) - 1)
-        
-        # Final visualization
-        self.visualize(state='complete')
-        
-        return self.data
     
     def _quicksort(self, low: int, high: int):
         """
         Recursive quicksort implementation
         
+        Recurses into the smaller partition and loops on the larger one, so
+        the stack stays O(log n) deep even when pivots are always extreme.
+        
         Args:
             low: Starting index
             high: Ending index
         """
-        if low >= high:
-            return
-        
-        # Show the section being worked on
-        self.visualize(
-            state='working',
-            section_range=(low, high)
-        )
-        
-        # Partition and get pivot position
-        pivot_idx = self._partition(low, high)
-        
-        # Recursively sort left and right partitions
-        self._quicksort(low, pivot_idx - 1)
-        self._quicksort(pivot_idx + 1, high)
+        while low < high:
+            if high - low < self.cutoff:
+                self._insertion_range(low, high)
+                self.visualize(state='inserted', sorted_section=(low, high))
+                return
+            
+            # Show the section being worked on
+            self.visualize(
+                state='working',
+                section_range=(low, high)
+            )
+            
+            # Partition and get pivot position
+            pivot_idx = self._partition(low, high)
+            
+            # Sort the smaller partition recursively, then the larger one here
+            if pivot_idx - low < high - pivot_idx:
+                self._quicksort(low, pivot_idx - 1)
+                low = pivot_idx + 1
+            else:
+                self._quicksort(pivot_idx + 1, high)
+                high = pivot_idx - 1
     
     def _partition(self, low: int, high: int) -> int:
         """
@@ -80,7 +100,7 @@ class QuickSort(BaseSorter):
             Final position of pivot
         """
         # Choose random pivot and move to end
-        pivot_idx = randrange(low, high + 1)
+        pivot_idx = self.rng.randrange(low, high + 1)
         pivot_value = self.data[pivot_idx]
         
         # Show pivot selection
@@ -100,10 +120,9 @@ class QuickSort(BaseSorter):
         right_indices = []
         
         for j in range(low, high):
-            if self.compare(j, pivot_idx):
-                left_indices.append(j)
-            else:
-                right_indices.append(j)
+            side = left_indices if self.compare(j, pivot_idx) else right_indices
+            if self.visualizer:
+                side.append(j)
         
         # Show partitioning
         self.visualize(
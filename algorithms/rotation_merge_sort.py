@@ -0,0 +1,151 @@
+"""
+In-place stable merge sort with rotation-based merging
+"""
+from config import Config
+from .base_sorter import BaseSorter
+
+
+class RotationMergeSort(BaseSorter):
+    """
+    Stable merge sort that needs no auxiliary array (SymMerge)
+    
+    Runs of Config.ROTATION_MERGE_RUN elements are insertion-sorted, then merged
+    bottom-up. Each merge binary-searches a split that divides both runs
+    so that the upper part of the left run and the lower part of the
+    right run trade places with one block rotation. The two smaller
+    merges left on either side are then merged recursively. A rotation is
+    done with block swaps (n - gcd swaps), and runs that are already in
+    order are not merged at all. The only extra memory is the O(log n)
+    recursion stack, at the price of O(n log² n) time.
+    """
+    
+    STABLE = True
+    
+    TUNABLE = {'ROTATION_MERGE_RUN': (4, 8, 12, 16, 20, 24, 32, 48, 64)}
+    
+    __slots__ = ()
+    
+    def get_name(self) -> str:
+        return "RotationMergeSort"
+    
+    def get_complexity(self) -> dict:
+        return {
+            'time_best': 'O(n)',
+            'time_avg': 'O(n log² n)',
+            'time_worst': 'O(n log² n)',
+            'space': 'O(log n)'
+        }
+    
+    def _sort(self):
+        """Sort self.data in place using insertion-sorted blocks and SymMerge"""
+        n = len(self.data)
+        run = Config.tuned('ROTATION_MERGE_RUN', n)
+        
+        for start in range(0, n, run):
+            end = min(start + run, n) - 1
+            self._insertion_range(start, end)
+            self.visualize(state='inserted', sorted_section=(start, end))
+        
+        width = run
+        while width < n:
+            for start in range(0, n - width, 2 * width):
+                mid = start + width
+                end = min(mid + width, n)
+                # Runs already in order need no merge
+                if not self.compare(mid - 1, mid):
+                    self._sym_merge(start, mid, end)
+                self.visualize(state='merged', sorted_section=(start, end - 1))
+            width *= 2
+    
+    def _sym_merge(self, start: int, mid: int, end: int):
+        """
+        Stably merge the sorted runs data[start:mid] and data[mid:end] in place
+        
+        Args:
+            start: First index of the left run
+            mid: First index of the right run
+            end: One past the last index of the right run
+        """
+        if mid - start == 1:
+            # Insert the single left element after the smaller right ones
+            low, high = mid, end
+            while low < high:
+                h = (low + high) // 2
+                if self.compare(start, h):
+                    high = h
+                else:
+                    low = h + 1
+            for k in range(start, low - 1):
+                self.swap(k, k + 1)
+            return
+        
+        if end - mid == 1:
+            # Insert the single right element after the left ones not above it
+            low, high = start, mid
+            while low < high:
+                h = (low + high) // 2
+                if self.compare(h, mid):
+                    low = h + 1
+                else:
+                    high = h
+            for k in range(mid, low, -1):
+                self.swap(k, k - 1)
+            return
+        
+        half = (start + end) // 2
+        n = half + mid
+        if mid > half:
+            low, high = n - end, half
+        else:
+            low, high = start, mid
+        last = n - 1
+        # Find the split: data[low:mid] and data[mid:n - low] swap sides
+        while low < high:
+            c = (low + high) // 2
+            if self.compare(c, last - c):
+                low = c + 1
+            else:
+                high = c
+        split_end = n - low
+        
+        if low < mid < split_end:
+            self._rotate(low, mid, split_end)
+        if start < low < half:
+            self._sym_merge(start, low, half)
+        if half < split_end < end:
+            self._sym_merge(half, split_end, end)
+    
+    def _rotate(self, start: int, mid: int, end: int):
+        """
+        Exchange the adjacent blocks data[start:mid] and data[mid:end]
+        
+        Equal-length pieces are swapped off the larger block until both
+        remaining pieces have the same length, n - gcd swaps in total.
+        
+        Args:
+            start: First index of the first block
+            mid: First index of the second block
+            end: One past the last index of the second block
+        """
+        self.visualize(state='rotating', rotation=(start, mid, end))
+        i, j = mid - start, end - mid
+        while i != j:
+            if i > j:
+                self._swap_range(mid - i, mid, j)
+                i -= j
+            else:
+                self._swap_range(mid - i, mid + j - i, i)
+                j -= i
+        self._swap_range(mid - i, mid, i)
+    
+    def _swap_range(self, a: int, b: int, count: int):
+        """
+        Swap data[a:a + count] with data[b:b + count]
+        
+        Args:
+            a: First index of one block
+            b: First index of the other block
+            count: Block length
+        """
+        for k in range(count):
+            self.swap(a + k, b + k)
@@ -1,12 +1,13 @@
 """
 SelectionSort implementation with visualization
 """
-from typing import List
 from .base_sorter import BaseSorter
 
 
 class SelectionSort(BaseSorter):
-    """SelectionSort algorithm"""
+    """SelectionSort algorithm (not stable: the long-range swap can reorder equal keys)"""
+    
+    __slots__ = ()
     
     def get_name(self) -> str:
         return "SelectionSort"
@@ -19,23 +20,10 @@ class SelectionSort(BaseSorter):
             'space': 'O(1)'
         }
     
-    def sort(self, data: List[int]) -> List[int]:
-        """
-        Sort using SelectionSort algorithm
-        
-        Args:
-            data: List to sort
-            
-        Returns:
-            Sorted list
-        """
-        self.data = data[:]
-        self.reset_stats()
+    def _sort(self):
+        """Sort self.data in place using SelectionSort algorithm"""
         n = len(self.data)
         
-        # Initial visualization
-        self.visualize(state='initial')
-        
         # Selection sort
         for i in range(n):
             # Find minimum element in unsorted portion
@@ -84,9 +72,4 @@ class SelectionSort(BaseSorter):
                     state='in_place',
                     current_idx=i,
                     sorted_section=(0, i)
-                )
-        
-        # Final visualization
-        self.visualize(state='complete')
-        
-        return self.data
\ No newline at end of file
+                )
\ No newline at end of file
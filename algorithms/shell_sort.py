@@ -0,0 +1,140 @@
+"""
+ShellSort implementation with selectable gap sequences
+"""
+from typing import List, Optional
+from config import Config
+from .base_sorter import BaseSorter
+
+# Ciura's experimentally found gaps; longer arrays extend them by 2.25x
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+
+
+def shell_gaps(n: int) -> List[int]:
+    """Shell's original sequence n/2, n/4, ..., 1"""
+    gaps = []
+    gap = n // 2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps[::-1] or [1]
+
+
+def knuth_gaps(n: int) -> List[int]:
+    """Knuth's (3^k - 1) / 2 = 1, 4, 13, 40, ... up to n / 3"""
+    gaps = [1]
+    while 3 * gaps[-1] + 1 <= n // 3:
+        gaps.append(3 * gaps[-1] + 1)
+    return gaps
+
+
+def ciura_gaps(n: int) -> List[int]:
+    """Ciura's 1, 4, 10, 23, 57, ... below n"""
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [gap for gap in gaps if gap < n] or [1]
+
+
+def sedgewick_gaps(n: int) -> List[int]:
+    """Sedgewick's 4^k + 3 * 2^(k-1) + 1 = 1, 8, 23, 77, 281, ... below n"""
+    gaps = [1]
+    k = 1
+    while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+        gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+        k += 1
+    return gaps
+
+
+# Gap generators by name: length -> ascending gaps starting at 1
+GAP_SEQUENCES = {
+    'shell': shell_gaps,
+    'knuth': knuth_gaps,
+    'ciura': ciura_gaps,
+    'sedgewick': sedgewick_gaps
+}
+
+# Proven (Shell, Knuth, Sedgewick) or empirical (Ciura) growth per sequence
+GAP_COMPLEXITY = {
+    'shell': ('O(n^(3/2))', 'O(n²)'),
+    'knuth': ('O(n^(3/2))', 'O(n^(3/2))'),
+    'ciura': ('O(n^(4/3))', 'O(n^(3/2))'),
+    'sedgewick': ('O(n^(4/3))', 'O(n^(4/3))')
+}
+
+
+class ShellSort(BaseSorter):
+    """
+    ShellSort: gapped insertion sorts over a shrinking gap sequence (not stable)
+    
+    Each pass insertion-sorts the elements gap apart with adjacent-in-gap
+    swaps, so distant inversions are removed early and the final gap-1
+    pass is a plain insertion sort over nearly sorted data. The gap
+    sequence decides the running time; see GAP_SEQUENCES.
+    """
+    
+    TUNABLE = {'SHELL_GAPS': tuple(GAP_SEQUENCES)}
+    
+    __slots__ = ('gaps',)
+    
+    def __init__(self, visualizer=None, gaps: Optional[str] = None):
+        """
+        Initialize sorter
+        
+        Args:
+            visualizer: Callback function for visualization (optional)
+            gaps: Gap sequence name in GAP_SEQUENCES (default: Config.SHELL_GAPS,
+                or its tuned value for the input)
+        
+        Raises:
+            ValueError: If the gap sequence is unknown
+        """
+        super().__init__(visualizer)
+        if gaps is not None and gaps not in GAP_SEQUENCES:
+            raise ValueError(f"Unknown gap sequence '{gaps}'; "
+                             f"choose from {', '.join(GAP_SEQUENCES)}")
+        self.gaps = gaps
+    
+    def _sequence(self, n: int) -> str:
+        """
+        Gap sequence name used for an input of n elements
+        
+        Args:
+            n: Input length
+        
+        Returns:
+            Key in GAP_SEQUENCES
+        """
+        return self.gaps or Config.tuned('SHELL_GAPS', n)
+    
+    def get_name(self) -> str:
+        return f"ShellSort ({self._sequence(len(self.data)).capitalize()} gaps)"
+    
+    def get_complexity(self) -> dict:
+        average, worst = GAP_COMPLEXITY[self._sequence(len(self.data))]
+        return {
+            'time_best': 'O(n log n)',
+            'time_avg': average,
+            'time_worst': worst,
+            'space': 'O(1)'
+        }
+    
+    def _sort(self):
+        """Sort self.data in place using ShellSort algorithm"""
+        n = len(self.data)
+        
+        for gap in reversed(GAP_SEQUENCES[self._sequence(n)](n)):
+            self.visualize(state='gap_pass', gap=gap)
+            
+            # Insertion sort of every gap-strided subsequence at once
+            for i in range(gap, n):
+                j = i
+                while j >= gap:
+                    self.visualize(
+                        state='comparing',
+                        comparing_indices=(j - gap, j),
+                        gap=gap
+                    )
+                    if self.compare(j - gap, j):
+                        break
+                    self.swap(j - gap, j)
+                    j -= gap
@@ -0,0 +1,101 @@
+"""
+Write-optimized SelectionSort: select on indices, then place each element once
+"""
+from analysis.access_trace import COMPARE
+from .selection_sort import SelectionSort
+
+
+class WriteSelectionSort(SelectionSort):
+    """
+    SelectionSort that leaves the data untouched until every rank is known
+    
+    The selection passes run over a list of indices, so choosing the
+    minimum costs comparisons but no element writes. Ties go to the lower
+    original index, which also makes the sort stable. The finished order
+    is then applied cycle by cycle: the first element of a cycle is held
+    aside while the others are pulled into place, so each misplaced
+    element is written exactly once. Plain SelectionSort swaps, which
+    writes two elements per misplaced one. The price is O(n) extra
+    indices.
+    """
+    
+    STABLE = True
+    
+    __slots__ = ()
+    
+    def get_name(self) -> str:
+        return "SelectionSort (min writes)"
+    
+    def get_complexity(self) -> dict:
+        return {
+            'time_best': 'O(n²)',
+            'time_avg': 'O(n²)',
+            'time_worst': 'O(n²)',
+            'space': 'O(n)'
+        }
+    
+    def _less(self, a: int, b: int) -> bool:
+        """
+        Order two original indices by key, then by index
+        
+        Args:
+            a: First original index
+            b: Second original index
+        
+        Returns:
+            True if element a sorts before element b
+        """
+        self.comparisons += 1
+        self.accesses += 2
+        if self.trace is not None:
+            self.trace.add(COMPARE, a)
+            self.trace.add(COMPARE, b)
+        if self.memory is not None:
+            self.memory.read(a)
+            self.memory.read(b)
+        x, y = self.data[a], self.data[b]
+        return x < y or (not y < x and a < b)
+    
+    def _sort(self):
+        """Sort self.data by selecting over indices, then following the cycles"""
+        n = len(self.data)
+        order = list(range(n))
+        
+        # Selection sort of the indices; the data is only read
+        for i in range(n - 1):
+            best = i
+            for j in range(i + 1, n):
+                if self._less(order[j], order[best]):
+                    best = j
+            order[i], order[best] = order[best], order[i]
+            self.visualize(
+                state='ranked',
+                current_idx=order[i],
+                comparing_indices=order[:i + 1]
+            )
+        
+        # order[k] is the index of the element that belongs at k
+        for start in range(n):
+            if order[start] == start:
+                continue
+            held, held_record = self.data[start], self._record(start)
+            self.accesses += 1
+            if self.memory is not None:
+                self.memory.read(start)
+            k = start
+            while order[k] != start:
+                source = order[k]
+                self._store(k, self.data[source], self._record(source))
+                self.accesses += 2
+                if self.memory is not None:
+                    self.memory.read(source)
+                if self.tracker is not None:
+                    # The held element logically moves into the emptied slot
+                    self.tracker.swap(k, source)
+                order[k] = k
+                self.visualize(state='cycle_write', current_idx=k, pivot_idx=source)
+                k = source
+            self._store(k, held, held_record)
+            self.accesses += 1
+            order[k] = k
+            self.visualize(state='cycle_closed', current_idx=k)
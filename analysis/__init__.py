@@ -0,0 +1,42 @@
+"""
+Input analysis package
+"""
+from .presortedness import (
+    count_inversions,
+    count_runs,
+    lis_length,
+    entropy,
+    presortedness,
+    correlation
+)
+from .inversion_tracker import InversionTracker, FenwickTree
+from .access_trace import AccessTrace, COMPARE, SWAP, WRITE, KIND_NAMES
+from .cache import CacheLevel, CacheSimulator, MemoryModel
+from .complexity import MODELS, power_law_fit, model_fit, classify
+from .memory import MemoryProbe, memory_budget, current_rss
+
+__all__ = [
+    'count_inversions',
+    'count_runs',
+    'lis_length',
+    'entropy',
+    'presortedness',
+    'correlation',
+    'InversionTracker',
+    'FenwickTree',
+    'AccessTrace',
+    'COMPARE',
+    'SWAP',
+    'WRITE',
+    'KIND_NAMES',
+    'CacheLevel',
+    'CacheSimulator',
+    'MemoryModel',
+    'MODELS',
+    'power_law_fit',
+    'model_fit',
+    'classify',
+    'MemoryProbe',
+    'memory_budget',
+    'current_rss'
+]
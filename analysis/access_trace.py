@@ -0,0 +1,139 @@
+"""
+Bounded-memory recording of the array indices a sort touches
+"""
+from array import array
+from typing import Iterable, Optional
+
+# Event kinds
+COMPARE = 0
+SWAP = 1
+WRITE = 2
+KIND_NAMES = ['compare', 'swap', 'write']
+
+
+class AccessTrace:
+    """
+    Time x index histogram of compare/swap/write events
+    
+    Events are packed as index * 4 + kind into a flat array('q') buffer.
+    Every chunk_size events the buffer is folded with one np.bincount into a
+    row of per-kind index-bucket counts. When more than max_rows rows pile
+    up, neighbouring rows are summed pairwise and the chunk size doubles,
+    so memory stays bounded however long the sort runs while short sorts
+    keep a fine time resolution.
+    """
+    
+    __slots__ = ('n', 'index_buckets', 'chunk_size', 'max_rows', 'events',
+                 '_buffer', '_rows')
+    
+    def __init__(self, n: int, index_buckets: int = 512, chunk_size: int = 64,
+                 max_rows: int = 4096):
+        """
+        Initialize an empty trace
+        
+        Args:
+            n: Length of the array being sorted
+            index_buckets: Number of index columns (capped at n)
+            chunk_size: Initial number of events per time row
+            max_rows: Row count that triggers halving the time resolution
+        """
+        self.n = max(n, 1)
+        self.index_buckets = max(1, min(index_buckets, self.n))
+        self.chunk_size = chunk_size
+        self.max_rows = max_rows
+        self.events = 0
+        self._buffer = array('q')
+        self._rows = []
+    
+    def add(self, kind: int, index: int):
+        """
+        Record one event
+        
+        Args:
+            kind: COMPARE, SWAP or WRITE
+            index: Array index touched
+        """
+        buffer = self._buffer
+        buffer.append(index * 4 + kind)
+        if len(buffer) >= self.chunk_size:
+            self._fold()
+    
+    def extend(self, kind: int, indices: Iterable[int]):
+        """
+        Record many events of one kind, e.g. a whole vectorized stage
+        
+        Args:
+            kind: COMPARE, SWAP or WRITE
+            indices: Array indices touched
+        """
+        import numpy as np
+        
+        packed = np.asarray(indices, dtype=np.int64).ravel() * 4 + kind
+        position = 0
+        while position < len(packed):
+            room = self.chunk_size - len(self._buffer)
+            self._buffer.frombytes(packed[position:position + room].tobytes())
+            position += room
+            if len(self._buffer) >= self.chunk_size:
+                self._fold()
+    
+    def _fold(self):
+        """Turn the buffered events into one histogram row"""
+        import numpy as np
+        
+        if not self._buffer:
+            return
+        packed = np.frombuffer(self._buffer, dtype=np.int64)
+        kinds = packed & 3
+        buckets = (packed >> 2) * self.index_buckets // self.n
+        row = np.bincount(
+            kinds * self.index_buckets + buckets,
+            minlength=len(KIND_NAMES) * self.index_buckets
+        ).reshape(len(KIND_NAMES), self.index_buckets)
+        self.events += len(packed)
+        self._buffer = array('q')
+        self._rows.append(row.astype(np.int64))
+        
+        if len(self._rows) > self.max_rows:
+            if len(self._rows) % 2:
+                self._rows.append(np.zeros_like(row, dtype=np.int64))
+            self._rows = [a + b for a, b in zip(self._rows[0::2], self._rows[1::2])]
+            self.chunk_size *= 2
+    
+    def histogram(self, time_buckets: Optional[int] = None, kinds=None):
+        """
+        Build the (time bucket x index bucket) histogram
+        
+        Args:
+            time_buckets: Number of time rows (default: all recorded rows)
+            kinds: Iterable of event kinds to include (default: all)
+        
+        Returns:
+            2-D int64 array; row 0 is the start of the sort
+        """
+        import numpy as np
+        
+        self._fold()
+        if not self._rows:
+            return np.zeros((1, self.index_buckets), dtype=np.int64)
+        rows = np.stack(self._rows)
+        selected = list(range(len(KIND_NAMES))) if kinds is None else list(kinds)
+        counts = rows[:, selected, :].sum(axis=1)
+        
+        if time_buckets is not None and time_buckets < len(counts):
+            starts = np.unique((np.arange(time_buckets) * len(counts)) // time_buckets)
+            counts = np.add.reduceat(counts, starts, axis=0)
+        return counts
+    
+    def totals(self) -> dict:
+        """
+        Count recorded events per kind
+        
+        Returns:
+            Dictionary of kind name -> event count
+        """
+        self._fold()
+        if not self._rows:
+            return {name: 0 for name in KIND_NAMES}
+        per_kind = sum(row.sum(axis=1) for row in self._rows)
+        return {name: int(count) for name, count in zip(KIND_NAMES, per_kind)}
@@ -0,0 +1,233 @@
+"""
+Set-associative multi-level LRU cache simulator for sorter memory traffic
+"""
+from array import array
+from typing import List, Optional
+
+
+class CacheLevel:
+    """
+    One set-associative LRU cache level
+    
+    Tags live in a flat array('q') with one slot per (set, way). Each set
+    keeps its ways ordered most- to least-recently used, so a lookup is a
+    bounded array.index() and an LRU update is one slice move, all in C.
+    """
+    
+    __slots__ = ('name', 'line_size', 'sets', 'ways', 'latency', 'tags',
+                 'hits', 'misses')
+    
+    def __init__(self, name: str, size: int, line_size: int, associativity: int,
+                 latency: int):
+        """
+        Initialize an empty cache level
+        
+        Args:
+            name: Label used in reports
+            size: Capacity in bytes
+            line_size: Line size in bytes
+            associativity: Ways per set
+            latency: Cycles charged for every lookup at this level
+        """
+        self.name = name
+        self.line_size = line_size
+        self.ways = associativity
+        self.sets = max(1, size // (line_size * associativity))
+        self.latency = latency
+        self.tags = array('q', [-1]) * (self.sets * self.ways)
+        self.hits = 0
+        self.misses = 0
+    
+    def access(self, address: int) -> bool:
+        """
+        Look up the line holding address and make it most recently used
+        
+        Args:
+            address: Byte address
+        
+        Returns:
+            True on a hit; on a miss the line is filled, evicting the LRU way
+        """
+        line = address // self.line_size
+        base = (line % self.sets) * self.ways
+        tags = self.tags
+        try:
+            way = tags.index(line, base, base + self.ways)
+        except ValueError:
+            self.misses += 1
+            tags[base + 1:base + self.ways] = tags[base:base + self.ways - 1]
+            tags[base] = line
+            return False
+        self.hits += 1
+        if way != base:
+            tags[base + 1:way + 1] = tags[base:way]
+            tags[base] = line
+        return True
+
+
+class CacheSimulator:
+    """
+    Inclusive cache hierarchy in front of main memory
+    
+    An access probes each level in turn, paying its latency, until one
+    hits; every level that missed is filled. Writes allocate like reads.
+    """
+    
+    __slots__ = ('levels', 'memory_latency', 'cycles', 'accesses', '_last_line')
+    
+    def __init__(self, levels: List[dict], memory_latency: int):
+        """
+        Initialize the hierarchy
+        
+        Args:
+            levels: One dict per level, innermost first, with name, size,
+                line_size, associativity and latency (see Config.CACHE_LEVELS)
+            memory_latency: Cycles for an access that misses every level
+        """
+        self.levels = [CacheLevel(**level) for level in levels]
+        self.memory_latency = memory_latency
+        self.cycles = 0
+        self.accesses = 0
+        self._last_line = -1
+    
+    def access(self, address: int):
+        """
+        Simulate one access
+        
+        Args:
+            address: Byte address
+        """
+        self.accesses += 1
+        first = self.levels[0]
+        line = address // first.line_size
+        if line == self._last_line:
+            # Still on the most recently used L1 line: a guaranteed hit
+            first.hits += 1
+            self.cycles += first.latency
+            return
+        self._last_line = line
+        
+        for level in self.levels:
+            self.cycles += level.latency
+            if level.access(address):
+                return
+        self.cycles += self.memory_latency
+    
+    def report(self) -> dict:
+        """
+        Summarize the simulation
+        
+        Returns:
+            Dictionary with accesses, cycles, cycles_per_access and per-level
+            hits, misses and hit_rate
+        """
+        return {
+            'accesses': self.accesses,
+            'cycles': self.cycles,
+            'cycles_per_access': self.cycles / self.accesses if self.accesses else 0.0,
+            'levels': {
+                level.name: {
+                    'hits': level.hits,
+                    'misses': level.misses,
+                    'hit_rate': level.hits / (level.hits + level.misses)
+                    if level.hits + level.misses else 0.0
+                }
+                for level in self.levels
+            }
+        }
+
+
+class MemoryModel:
+    """
+    Maps a sorter's element accesses to byte addresses for a CacheSimulator
+    
+    The data is modelled as a flat array of element_size-byte slots at
+    address 0. Auxiliary copies (merge buffers) go to a scratch array of
+    the same length placed after it, page aligned, where scratch[i] holds
+    the copy of data[i], like the preallocated buffer of a textbook
+    top-down merge sort.
+    """
+    
+    __slots__ = ('simulator', 'element_size', 'scratch_base', 'reads', 'writes')
+    
+    # Alignment of the scratch array
+    PAGE_SIZE = 4096
+    
+    def __init__(self, n: int, simulator: Optional[CacheSimulator] = None,
+                 element_size: Optional[int] = None):
+        """
+        Initialize model for an array of n elements
+        
+        Args:
+            n: Number of elements
+            simulator: Cache hierarchy (default: built from Config)
+            element_size: Bytes per element (default: Config.CACHE_ELEMENT_SIZE)
+        """
+        from config import Config
+        
+        self.simulator = simulator or CacheSimulator(
+            Config.CACHE_LEVELS, Config.CACHE_MEMORY_LATENCY
+        )
+        self.element_size = element_size or Config.CACHE_ELEMENT_SIZE
+        data_bytes = n * self.element_size
+        self.scratch_base = -(-data_bytes // self.PAGE_SIZE) * self.PAGE_SIZE + self.PAGE_SIZE
+        self.reads = 0
+        self.writes = 0
+    
+    def read(self, index: int):
+        """Record a read of data[index]"""
+        self.reads += 1
+        self.simulator.access(index * self.element_size)
+    
+    def write(self, index: int):
+        """Record a write of data[index]"""
+        self.writes += 1
+        self.simulator.access(index * self.element_size)
+    
+    def read_scratch(self, offset: int):
+        """Record a read of scratch[offset]"""
+        self.reads += 1
+        self.simulator.access(self.scratch_base + offset * self.element_size)
+    
+    def copy_to_scratch(self, start: int, stop: int):
+        """
+        Record copying data[start:stop] into scratch[start:stop]
+        
+        Args:
+            start: First index
+            stop: One past the last index
+        """
+        access = self.simulator.access
+        size = self.element_size
+        for index in range(start, stop):
+            access(index * size)
+            access(self.scratch_base + index * size)
+        self.reads += stop - start
+        self.writes += stop - start
+    
+    def exchange_many(self, indices):
+        """
+        Record a vectorized pass that reads then rewrites every index
+        
+        Args:
+            indices: Indices of the pass, in access order
+        """
+        access = self.simulator.access
+        size = self.element_size
+        for index in indices:
+            access(index * size)
+            access(index * size)
+        self.reads += len(indices)
+        self.writes += len(indices)
+    
+    def report(self) -> dict:
+        """
+        Summarize the simulated traffic
+        
+        Returns:
+            CacheSimulator.report() plus reads and writes
+        """
+        report = self.simulator.report()
+        report['reads'] = self.reads
+        report['writes'] = self.writes
+        return report
@@ -0,0 +1,126 @@
+"""
+Empirical complexity fitting for measured sorter work
+"""
+import math
+from typing import Dict, Optional, Sequence
+
+# Growth functions for the complexity strings returned by get_complexity()
+MODELS = {
+    'O(1)': lambda n: 1.0,
+    'O(log n)': lambda n: math.log2(n),
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * math.log2(n),
+    'O(n log² n)': lambda n: n * math.log2(n) ** 2,
+    'O(n^(4/3))': lambda n: n ** (4 / 3),
+    'O(n^(3/2))': lambda n: n ** 1.5,
+    'O(n²)': lambda n: n * n
+}
+
+# Two-sided 95% Student t quantiles for 1..30 degrees of freedom
+_T95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042]
+
+# get_complexity() keys checked against measurements, preferred first
+CASES = [('average', 'time_avg'), ('best', 'time_best'), ('worst', 'time_worst')]
+
+
+def power_law_fit(sizes: Sequence[float], values: Sequence[float]) -> Optional[dict]:
+    """
+    Fit values ~ c * n^k by least squares on log-log axes
+    
+    Args:
+        sizes: Input sizes, at least three distinct
+        values: Measured work per size; all must be positive
+    
+    Returns:
+        Dictionary with exponent, ci (95% interval for the exponent),
+        coefficient and r2, or None when the series cannot be fitted
+    """
+    import numpy as np
+    
+    n = np.asarray(sizes, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+    if len(n) < 3 or np.any(n <= 0) or np.any(y <= 0) or np.ptp(n) == 0:
+        return None
+    
+    x = np.log(n)
+    ly = np.log(y)
+    slope, intercept = np.polyfit(x, ly, 1)
+    residuals = ly - (slope * x + intercept)
+    dof = len(x) - 2
+    sxx = ((x - x.mean()) ** 2).sum()
+    stderr = math.sqrt((residuals ** 2).sum() / dof / sxx)
+    t = _T95[dof - 1] if dof <= len(_T95) else 1.96
+    total = ((ly - ly.mean()) ** 2).sum()
+    return {
+        'exponent': float(slope),
+        'ci': (float(slope - t * stderr), float(slope + t * stderr)),
+        'coefficient': float(math.exp(intercept)),
+        'r2': float(1 - (residuals ** 2).sum() / total) if total else 1.0
+    }
+
+
+def model_fit(sizes: Sequence[float], values: Sequence[float], model: str) -> Optional[dict]:
+    """
+    Fit the growth left over after dividing out a complexity model
+    
+    A residual exponent near 0 means the model explains the measurements;
+    n log n against n leaves roughly 1 / ln(n), n² against n log n
+    nearly 1.
+    
+    Args:
+        sizes: Input sizes
+        values: Measured work per size
+        model: Key in MODELS, e.g. 'O(n log n)'
+    
+    Returns:
+        power_law_fit() of values / model(n), or None if the model is
+        unknown or the series cannot be fitted
+    """
+    growth = MODELS.get(model)
+    if growth is None:
+        return None
+    return power_law_fit(sizes, [v / growth(n) for n, v in zip(sizes, values)])
+
+
+def classify(sizes: Sequence[float], values: Sequence[float], complexity: Dict[str, str],
+             tolerance: float = 0.1) -> dict:
+    """
+    Decide which claimed case, if any, the measurements follow
+    
+    A case matches when the 95% interval of its residual exponent reaches
+    into [-tolerance, tolerance]. Of the matching cases the one with the
+    smallest residual wins, the average case on ties.
+    
+    Args:
+        sizes: Input sizes
+        values: Measured work per size
+        complexity: Result of a sorter's get_complexity()
+        tolerance: Largest residual exponent still counted as a match
+    
+    Returns:
+        Dictionary with verdict ('average', 'best', 'worst', 'mismatch' or
+        'unfitted'), the matched claim and residual exponent per case
+    """
+    residuals = {}
+    for case, key in CASES:
+        fit = model_fit(sizes, values, complexity.get(key, ''))
+        if fit is not None:
+            residuals[case] = fit
+    if not residuals:
+        return {'verdict': 'unfitted', 'claim': None, 'residuals': {}}
+    
+    matching = [
+        case for case in residuals
+        if residuals[case]['ci'][0] <= tolerance and residuals[case]['ci'][1] >= -tolerance
+    ]
+    if not matching:
+        return {'verdict': 'mismatch', 'claim': None,
+                'residuals': {case: fit['exponent'] for case, fit in residuals.items()}}
+    case = min(matching, key=lambda c: abs(residuals[c]['exponent']))
+    return {
+        'verdict': case,
+        'claim': complexity[dict(CASES)[case]],
+        'residuals': {case: fit['exponent'] for case, fit in residuals.items()}
+    }
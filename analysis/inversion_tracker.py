@@ -0,0 +1,214 @@
+"""
+Incremental inversion counting while a sort runs
+"""
+from typing import List, Tuple
+from .presortedness import _ranks, _count_rank_inversions
+
+
+class FenwickTree:
+    """Binary indexed tree of counts over ranks 0..size-1"""
+    
+    __slots__ = ('tree',)
+    
+    def __init__(self, size: int):
+        """
+        Initialize an empty tree
+        
+        Args:
+            size: Number of ranks
+        """
+        self.tree = [0] * (size + 1)
+    
+    def add(self, rank: int, delta: int):
+        """
+        Add delta to the count of a rank in O(log n)
+        
+        Args:
+            rank: Rank to update
+            delta: Amount to add
+        """
+        tree = self.tree
+        i = rank + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+    
+    def prefix(self, rank: int) -> int:
+        """
+        Total count of ranks 0..rank in O(log n)
+        
+        Args:
+            rank: Last rank included (-1 for an empty prefix)
+        
+        Returns:
+            Prefix count
+        """
+        tree = self.tree
+        total = 0
+        i = rank + 1
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+class InversionTracker:
+    """
+    Maintains the inversion count of a sort's data as it changes
+    
+    The tracker mirrors the data as value ranks and is told about each
+    logical move rather than each raw write:
+    
+    - swap(i, j) for exchanges and for insertion-sort shifts (moving a key
+      one slot left is an adjacent exchange); O(1) when adjacent,
+      O(|i - j|) vectorized otherwise
+    - move(src, dst) for a whole insertion at once, O(|src - dst|) vectorized
+    - begin_merge()/merge_take() for merges, where taking a right-half
+      element moves it past the remaining left-half elements, counted with
+      a Fenwick tree over their ranks in O(log n)
+    - reset() to recount from scratch, for sorters that rewrite whole
+      stages at once
+    
+    mark() samples (operations, inversions) points for a progress curve.
+    """
+    
+    __slots__ = ('ranks', 'count', 'total', 'curve', '_fenwick', '_merge')
+    
+    def __init__(self, data):
+        """
+        Initialize tracker from the data about to be sorted
+        
+        Args:
+            data: Keys being sorted
+        """
+        ranks, counts = _ranks(data)
+        self.ranks = ranks
+        self.count = _count_rank_inversions(ranks)
+        self.total = self.count
+        self.curve: List[Tuple[int, int]] = []
+        self._fenwick = FenwickTree(len(counts))
+        self._merge = None
+    
+    def reset(self, data):
+        """
+        Recount inversions of data from scratch in O(n log n)
+        
+        Args:
+            data: Current keys (a permutation of the initial ones)
+        """
+        self.ranks, _ = _ranks(data)
+        self.count = _count_rank_inversions(self.ranks)
+    
+    def swap(self, i: int, j: int):
+        """
+        Account for exchanging the elements at i and j
+        
+        Args:
+            i: First index
+            j: Second index
+        """
+        if i == j:
+            return
+        low, high = (i, j) if i < j else (j, i)
+        ranks = self.ranks
+        a, b = int(ranks[low]), int(ranks[high])
+        if a != b:
+            small, large = (a, b) if a < b else (b, a)
+            delta = 1
+            if high - low > 1:
+                between = ranks[low + 1:high]
+                # Values strictly between the pair flip two pairs, values
+                # equal to one end flip one
+                delta += int(((between >= small) & (between < large)).sum()
+                             + ((between > small) & (between <= large)).sum())
+            self.count += delta if a < b else -delta
+        ranks[low], ranks[high] = b, a
+    
+    def move(self, src: int, dst: int):
+        """
+        Account for moving the element at src to dst, shifting the ones between
+        
+        Args:
+            src: Current index of the element
+            dst: Index it ends up at
+        """
+        if src == dst:
+            return
+        ranks = self.ranks
+        rank = ranks[src]
+        if dst < src:
+            passed = ranks[dst:src]
+            # Passing a greater element leftwards removes an inversion
+            self.count += int((passed < rank).sum() - (passed > rank).sum())
+            ranks[dst + 1:src + 1] = passed.copy()
+        else:
+            passed = ranks[src + 1:dst + 1]
+            self.count += int((passed > rank).sum() - (passed < rank).sum())
+            ranks[src:dst] = passed.copy()
+        ranks[dst] = rank
+    
+    def begin_merge(self, left: int, mid: int, right: int):
+        """
+        Start tracking a merge of data[left..mid] with data[mid+1..right]
+        
+        Args:
+            left: Starting index
+            mid: Middle index
+            right: Ending index
+        """
+        left_ranks = self.ranks[left:mid + 1].tolist()
+        right_ranks = self.ranks[mid + 1:right + 1].tolist()
+        for rank in left_ranks:
+            self._fenwick.add(rank, 1)
+        # [left ranks, right ranks, left taken, right taken, next output index]
+        self._merge = [left_ranks, right_ranks, 0, 0, left]
+    
+    def merge_take(self, from_left: bool):
+        """
+        Account for the merge writing its next element
+        
+        Args:
+            from_left: Whether the element comes from the left half
+        """
+        merge = self._merge
+        left_ranks, right_ranks, i, j, k = merge
+        if from_left:
+            rank = left_ranks[i]
+            self._fenwick.add(rank, -1)
+            merge[2] = i + 1
+        else:
+            rank = right_ranks[j]
+            remaining = len(left_ranks) - i
+            if remaining:
+                # Moves before every remaining left element
+                not_greater = self._fenwick.prefix(rank)
+                smaller = self._fenwick.prefix(rank - 1)
+                self.count += smaller - (remaining - not_greater)
+            merge[3] = j + 1
+        self.ranks[k] = rank
+        merge[4] = k + 1
+    
+    def mark(self, operations: int):
+        """
+        Sample the curve if the count changed since the last sample
+        
+        Args:
+            operations: Operations performed so far
+        """
+        if not self.curve or self.curve[-1][1] != self.count:
+            self.curve.append((operations, self.count))
+    
+    def sampled_curve(self, points: int = 100) -> List[Tuple[int, int]]:
+        """
+        Thin the curve to at most the given number of points
+        
+        Args:
+            points: Maximum number of points; the last one is always kept
+        
+        Returns:
+            List of (operations, inversions) pairs
+        """
+        if len(self.curve) <= points:
+            return list(self.curve)
+        step = (len(self.curve) - 1) / (points - 1)
+        return [self.curve[round(p * step)] for p in range(points)]
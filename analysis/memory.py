@@ -0,0 +1,156 @@
+"""
+Peak memory measurement for the sort phase
+"""
+import gc
+import os
+import sys
+from typing import Optional
+
+from .complexity import MODELS
+
+
+def current_rss() -> int:
+    """
+    Resident set size of this process in bytes
+    
+    Reads /proc/self/statm where available. Elsewhere falls back to the
+    process-lifetime high-water mark from getrusage(), which can only grow.
+    
+    Returns:
+        RSS in bytes, or 0 when it cannot be read
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def memory_budget(n: int, space: str) -> Optional[float]:
+    """
+    Bytes a sort of n elements may allocate for a claimed space complexity
+    
+    Args:
+        n: Number of elements
+        space: Claim from get_complexity()['space'], e.g. 'O(log n)'
+    
+    Returns:
+        Config.MEMORY_BUDGET_BASE + Config.MEMORY_BUDGET_PER_ELEMENT * space(n),
+        or None for an unknown claim
+    """
+    from config import Config
+    
+    growth = MODELS.get(space)
+    if growth is None:
+        return None
+    return Config.MEMORY_BUDGET_BASE + Config.MEMORY_BUDGET_PER_ELEMENT * growth(max(n, 2))
+
+
+class MemoryProbe:
+    """
+    Context manager measuring the memory a block of code allocates
+    
+    tracemalloc gives the exact peak of Python allocations above the
+    level on entry. A background thread samples RSS and the interpreter's
+    allocated block count, so allocations outside tracemalloc's view
+    (NumPy buffers that bypass it, fragmentation) still show up. Tracing
+    slows allocation-heavy Python code down many times over, so time the
+    block in a separate, unprofiled run.
+    """
+    
+    __slots__ = ('interval', 'peak_bytes', 'net_bytes', 'peak_blocks', 'rss_start',
+                 'rss_peak', 'samples', '_base_bytes', '_base_blocks', '_started',
+                 '_stop', '_thread')
+    
+    def __init__(self, interval: Optional[float] = None):
+        """
+        Initialize probe
+        
+        Args:
+            interval: Seconds between RSS samples (default: Config.MEMORY_SAMPLE_INTERVAL)
+        """
+        from config import Config
+        
+        self.interval = interval or Config.MEMORY_SAMPLE_INTERVAL
+        self.peak_bytes = 0
+        self.net_bytes = 0
+        self.peak_blocks = 0
+        self.rss_start = 0
+        self.rss_peak = 0
+        self.samples = 0
+        self._base_bytes = 0
+        self._base_blocks = 0
+        self._started = False
+        self._stop = None
+        self._thread = None
+    
+    def __enter__(self):
+        import threading
+        import tracemalloc
+        
+        # Created before the baseline so they are not charged to the block
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        gc.collect()
+        
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._base_bytes = tracemalloc.get_traced_memory()[0]
+        self._base_blocks = sys.getallocatedblocks()
+        self.rss_start = self.rss_peak = current_rss()
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        import tracemalloc
+        
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._started:
+            tracemalloc.stop()
+        self.peak_bytes = peak - self._base_bytes
+        self.net_bytes = current - self._base_bytes
+        return False
+    
+    def _run(self):
+        """Sampling loop of the background thread"""
+        while not self._stop.wait(self.interval):
+            self._sample()
+    
+    def _sample(self):
+        """Update the RSS and block high-water marks"""
+        rss = current_rss()
+        if rss > self.rss_peak:
+            self.rss_peak = rss
+        blocks = sys.getallocatedblocks() - self._base_blocks
+        if blocks > self.peak_blocks:
+            self.peak_blocks = blocks
+        self.samples += 1
+    
+    def report(self) -> dict:
+        """
+        Summarize the measurement
+        
+        Returns:
+            Dictionary with peak_bytes and net_bytes (tracemalloc, above
+            the entry level), peak_blocks (sampled), rss_peak (sampled
+            growth over the entry RSS, bytes) and samples
+        """
+        return {
+            'peak_bytes': self.peak_bytes,
+            'net_bytes': self.net_bytes,
+            'peak_blocks': self.peak_blocks,
+            'rss_peak': self.rss_peak - self.rss_start,
+            'samples': self.samples
+        }
@@ -0,0 +1,204 @@
+"""
+Presortedness metrics for sorting inputs
+"""
+from bisect import bisect_right
+from typing import List, Sequence
+
+
+def _ranks(data):
+    """
+    Map data to dense integer ranks, equal values sharing a rank
+    
+    Args:
+        data: Sequence of mutually comparable values
+    
+    Returns:
+        Tuple of (int64 rank array, count per distinct value)
+    """
+    import numpy as np
+    
+    values = np.asarray(data) if len(data) else np.empty(0, dtype=np.int64)
+    if values.ndim == 1 and values.dtype != object:
+        _, ranks, counts = np.unique(values, return_inverse=True, return_counts=True)
+        return ranks.astype(np.int64).ravel(), counts
+    
+    # Tuples, mixed objects: rank with Python comparisons
+    order = sorted(range(len(data)), key=data.__getitem__)
+    ranks = np.empty(len(data), dtype=np.int64)
+    counts = []
+    previous = None
+    for position, index in enumerate(order):
+        if position == 0 or previous < data[index]:
+            counts.append(0)
+            previous = data[index]
+        ranks[index] = len(counts) - 1
+        counts[-1] += 1
+    return ranks, np.asarray(counts, dtype=np.int64)
+
+
+def count_inversions(data) -> int:
+    """
+    Count pairs i < j with data[i] > data[j] in O(n log n)
+    
+    Works one rank bit at a time, most significant first. Two elements
+    whose ranks agree above bit b and differ at b form an inversion exactly
+    when the earlier one has the 1 bit. After each level the ranks are
+    stably partitioned by that bit (a wavelet matrix), which keeps elements
+    with equal higher bits contiguous and in input order, so every level is
+    a few vectorized passes with no sorting or scattered writes.
+    
+    Args:
+        data: Sequence of mutually comparable values
+    
+    Returns:
+        Number of inversions
+    """
+    ranks, _ = _ranks(data)
+    return _count_rank_inversions(ranks)
+
+
+def _count_rank_inversions(ranks) -> int:
+    """Count inversions of a dense rank array (see count_inversions)"""
+    import numpy as np
+    
+    n = len(ranks)
+    if n < 2:
+        return 0
+    dtype = np.int32 if n < 2 ** 31 else np.int64
+    current = ranks.astype(dtype)
+    sizes = np.array([n], dtype=np.int64)  # contiguous groups of equal prefix
+    total = 0
+    for bit in reversed(range(int(current.max()).bit_length())):
+        ones = (current >> bit) & 1
+        ones_before = np.cumsum(ones, dtype=dtype)
+        count = int(ones_before[-1])
+        ones_before -= ones
+        
+        # 1 bits before each 0 bit, first across the whole array...
+        total += int(ones_before.sum(dtype=np.int64)) - count * (count - 1) // 2
+        # ...then without those that belong to earlier groups
+        group_base = ones_before[np.cumsum(sizes) - sizes].astype(np.int64)
+        group_ones = np.diff(np.append(group_base, count))
+        group_zeros = sizes - group_ones
+        total -= int(np.dot(group_zeros, group_base))
+        
+        zero = ones == 0
+        current = np.concatenate((np.compress(zero, current), np.compress(~zero, current)))
+        sizes = np.concatenate((group_zeros, group_ones))
+        sizes = sizes[sizes > 0]
+    return total
+
+
+def count_runs(data) -> int:
+    """
+    Count maximal non-decreasing runs
+    
+    Args:
+        data: Sequence of mutually comparable values
+    
+    Returns:
+        Number of runs (0 for empty input)
+    """
+    import numpy as np
+    
+    if len(data) == 0:
+        return 0
+    values = np.asarray(data)
+    if values.ndim == 1 and values.dtype != object:
+        return 1 + int(np.count_nonzero(values[1:] < values[:-1]))
+    return 1 + sum(1 for i in range(1, len(data)) if data[i] < data[i - 1])
+
+
+def lis_length(data) -> int:
+    """
+    Length of the longest non-decreasing subsequence in O(n log n)
+    
+    n minus this length is the fewest elements that must move to sort
+    the input.
+    
+    Args:
+        data: Sequence of mutually comparable values
+    
+    Returns:
+        Subsequence length
+    """
+    ranks, _ = _ranks(data)
+    return _rank_lis_length(ranks)
+
+
+def _rank_lis_length(ranks) -> int:
+    """Patience-sorting LIS of a dense rank array (see lis_length)"""
+    tails: List[int] = []
+    append, search = tails.append, bisect_right
+    for rank in ranks.tolist():
+        position = search(tails, rank)
+        if position == len(tails):
+            append(rank)
+        else:
+            tails[position] = rank
+    return len(tails)
+
+
+def entropy(counts: Sequence[int]) -> float:
+    """
+    Shannon entropy in bits of a value distribution
+    
+    Args:
+        counts: Occurrences of each distinct value
+    
+    Returns:
+        Entropy; 0 for constant input, log2(n) when all values differ
+    """
+    import numpy as np
+    
+    counts = np.asarray(counts, dtype=np.float64)
+    if counts.sum() == 0:
+        return 0.0
+    p = counts / counts.sum()
+    return float(-(p * np.log2(p)).sum()) + 0.0
+
+
+def presortedness(data) -> dict:
+    """
+    Compute all presortedness metrics of an input
+    
+    Args:
+        data: Sequence of mutually comparable values
+    
+    Returns:
+        Dictionary with n, inversions, inversion_ratio (share of all
+        n(n-1)/2 pairs), runs, lis, distinct and entropy
+    """
+    n = len(data)
+    ranks, counts = _ranks(data)
+    inversions = _count_rank_inversions(ranks)
+    pairs = n * (n - 1) // 2
+    return {
+        'n': n,
+        'inversions': inversions,
+        'inversion_ratio': inversions / pairs if pairs else 0.0,
+        'runs': count_runs(data),
+        'lis': _rank_lis_length(ranks),
+        'distinct': len(counts),
+        'entropy': entropy(counts)
+    }
+
+
+def correlation(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """
+    Pearson correlation of two equally long series
+    
+    Args:
+        xs: First series, e.g. inversions per input
+        ys: Second series, e.g. swaps per input
+    
+    Returns:
+        Coefficient in [-1, 1], or nan when either series is constant
+    """
+    import numpy as np
+    
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    if len(x) < 2 or x.std() == 0 or y.std() == 0:
+        return float('nan')
+    return float(np.corrcoef(x, y)[0, 1])
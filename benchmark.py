@@ -0,0 +1,525 @@
+"""
+Headless benchmark relating measured sorter work to input presortedness
+"""
+import sys
+import json
+import time
+import argparse
+from typing import List, Optional
+
+from config import Config
+from data import DataGenerator, DataPattern
+from algorithms import get_algorithm, ALGORITHM_MAP, GAP_SEQUENCES
+from analysis import (presortedness, correlation, MemoryModel, MemoryProbe, memory_budget,
+                      power_law_fit, classify)
+
+
+# Metrics and stats paired up in the correlation report
+CORRELATED_METRICS = ['inversions', 'runs', 'lis']
+CORRELATED_STATS = ['comparisons', 'swaps']
+
+# Points kept per exported inversion curve
+CURVE_POINTS = 100
+
+# Measurements fitted by the scaling report; 'operations' drives the verdict
+SCALING_SERIES = ['comparisons', 'swaps', 'time']
+
+
+def run_case(algorithm_name: str, data: List[int], track_inversions: bool = False,
+             simulate_cache: bool = False, profile_memory: bool = False) -> dict:
+    """
+    Sort one input without visualization
+    
+    Args:
+        algorithm_name: Key in ALGORITHM_MAP
+        data: Input to sort (not modified)
+        track_inversions: Also record remaining inversions against
+            operations (slows the sort down; time includes the tracking)
+        simulate_cache: Feed every element access through the cache
+            simulator (much slower; time includes the simulation)
+        profile_memory: Sort a second copy under a MemoryProbe (time is
+            taken from the first, unprofiled sort)
+    
+    Returns:
+        Dictionary with time, verified, the sorter's get_stats() counters,
+        when tracking, inversion_curve as (operations, inversions) pairs,
+        when simulating, cache as MemoryModel.report(), when profiling,
+        memory as MemoryProbe.report() plus space, budget and over_budget,
+        and, if the sort hit Python's recursion limit, error
+    """
+    sorter = get_algorithm(algorithm_name)()
+    DataGenerator.seed_sorter(sorter, data)
+    sorter.track_inversions = track_inversions
+    if simulate_cache:
+        sorter.memory = MemoryModel(len(data))
+    start = time.perf_counter()
+    try:
+        result = sorter.sort(data)
+    except RecursionError:
+        # Degenerate partitions on large inputs; keep the counters so far
+        result = None
+    elapsed = time.perf_counter() - start
+    
+    stats = sorter.get_stats()
+    row = {
+        'time': elapsed,
+        'verified': result is not None
+        and all(result[i] <= result[i + 1] for i in range(len(result) - 1)),
+        'comparisons': stats['comparisons'],
+        'swaps': stats['swaps'],
+        'accesses': stats['accesses'],
+        'writes': stats['writes'],
+        'cost': stats['cost']
+    }
+    if result is None:
+        row['error'] = 'recursion limit'
+        return row
+    if track_inversions:
+        row['inversion_curve'] = sorter.tracker.sampled_curve(CURVE_POINTS)
+    if simulate_cache:
+        row['cache'] = sorter.memory.report()
+    if profile_memory:
+        row['memory'] = profile_case(algorithm_name, data)
+    return row
+
+
+def profile_case(algorithm_name: str, data: List[int]) -> dict:
+    """
+    Measure the memory one sort allocates, input copy excluded
+    
+    Args:
+        algorithm_name: Key in ALGORITHM_MAP
+        data: Input to sort (not modified)
+    
+    Returns:
+        MemoryProbe.report() plus the claimed space complexity, its budget
+        in bytes (see memory_budget) and whether the peak exceeded it
+    """
+    sorter = get_algorithm(algorithm_name)()
+    DataGenerator.seed_sorter(sorter, data)
+    work = data[:]
+    with MemoryProbe() as probe:
+        sorter.sort(work, copy=False)
+    
+    report = probe.report()
+    report['space'] = sorter.get_complexity()['space']
+    report['budget'] = memory_budget(len(data), report['space'])
+    report['over_budget'] = report['budget'] is not None and report['peak_bytes'] > report['budget']
+    return report
+
+
+def run_matrix(algorithms: List[str], patterns: List[DataPattern], sizes: List[int],
+               min_val: int = Config.DATA_MIN, max_val: int = Config.DATA_MAX,
+               track_inversions: bool = False, simulate_cache: bool = False,
+               scale_range: bool = False, profile_memory: bool = False) -> List[dict]:
+    """
+    Benchmark every algorithm on every (pattern, size) input
+    
+    Each input is generated and analysed once, then sorted by every
+    algorithm, so rows for one input share the same metrics. Adaptive
+    patterns (DataPattern.adaptive) are generated per algorithm instead.
+    
+    Args:
+        algorithms: Algorithm names
+        patterns: Data patterns to generate
+        sizes: Input sizes
+        min_val: Minimum generated value
+        max_val: Maximum generated value
+        track_inversions: Record an inversion curve per row (see run_case)
+        simulate_cache: Add a cache simulation report per row (see run_case)
+        scale_range: Widen the value range to at least size values for each
+            size, so patterns keep their shape along a size ladder (a sorted
+            input wider than the range would otherwise be all equal)
+        profile_memory: Add a memory profile per row (see run_case)
+    
+    Returns:
+        List of result rows
+    """
+    rows = []
+    for pattern in patterns:
+        # Sorters look up tuned parameters for the pattern being sorted
+        Config.TUNING_PATTERN = pattern.value
+        for size in sizes:
+            top = max(max_val, min_val + size) if scale_range else max_val
+            if not pattern.adaptive:
+                data = DataGenerator.generate(size, min_val, top, pattern)
+                metrics = presortedness(data)
+            for name in algorithms:
+                if pattern.adaptive:
+                    # Built against each sorter in turn, right before it runs
+                    data = DataGenerator.generate(size, min_val, top, pattern, target=name)
+                    metrics = presortedness(data)
+                row = {'algorithm': name, 'pattern': pattern.value, 'size': size}
+                row.update(run_case(name, data, track_inversions, simulate_cache,
+                                    profile_memory))
+                row['metrics'] = metrics
+                rows.append(row)
+    return rows
+
+
+def correlations(rows: List[dict]) -> dict:
+    """
+    Correlate presortedness metrics with measured work per algorithm
+    
+    Args:
+        rows: Result of run_matrix()
+    
+    Returns:
+        Dictionary of algorithm -> {'metric/stat': Pearson coefficient}
+    """
+    report = {}
+    for name in dict.fromkeys(row['algorithm'] for row in rows):
+        own = [row for row in rows if row['algorithm'] == name]
+        report[name] = {
+            f"{metric}/{stat}": correlation(
+                [row['metrics'][metric] for row in own],
+                [row[stat] for row in own]
+            )
+            for metric in CORRELATED_METRICS
+            for stat in CORRELATED_STATS
+        }
+    return report
+
+
+def fit_scaling(rows: List[dict], tolerance: float = Config.COMPLEXITY_TOLERANCE) -> List[dict]:
+    """
+    Fit growth exponents per (algorithm, pattern) over the benchmarked sizes
+    
+    Comparisons, swaps and time are each fitted to a power law. Their sum
+    of comparisons and swaps, the operation count, is checked against the
+    sorter's get_complexity() claims. Rows that failed are left out of the
+    fits and reported as failed_sizes.
+    
+    Args:
+        rows: Result of run_matrix() over at least three sizes
+        tolerance: Residual exponent still accepted as matching a claim
+    
+    Returns:
+        List of dictionaries with algorithm, pattern, claimed (average case),
+        fits (series -> power_law_fit() or None), verdict and claim from
+        classify(), and failed_sizes
+    """
+    groups = {}
+    for row in rows:
+        groups.setdefault((row['algorithm'], row['pattern']), []).append(row)
+    
+    report = []
+    for (name, pattern), group in groups.items():
+        complexity = get_algorithm(name)().get_complexity()
+        done = sorted((row for row in group if 'error' not in row), key=lambda row: row['size'])
+        sizes = [row['size'] for row in done]
+        operations = [row['comparisons'] + row['swaps'] for row in done]
+        fits = {series: power_law_fit(sizes, [row[series] for row in done])
+                for series in SCALING_SERIES}
+        fits['operations'] = power_law_fit(sizes, operations)
+        entry = {
+            'algorithm': name,
+            'pattern': pattern,
+            'claimed': complexity['time_avg'],
+            'fits': fits,
+            'failed_sizes': [row['size'] for row in group if 'error' in row]
+        }
+        entry.update(classify(sizes, operations, complexity, tolerance))
+        report.append(entry)
+    return report
+
+
+def print_results(rows: List[dict], report: dict):
+    """
+    Print result rows and the correlation report as tables
+    
+    Args:
+        rows: Result of run_matrix()
+        report: Result of correlations()
+    """
+    print(f"{'Algorithm':<16} {'Pattern':<16} {'Size':>7} {'Inversions':>12} {'Runs':>7} "
+          f"{'Comparisons':>12} {'Swaps':>10} {'Time (ms)':>10}")
+    print("-" * 98)
+    for row in rows:
+        metrics = row['metrics']
+        flag = '' if row['verified'] else f"  {row.get('error', 'unsorted').upper()}"
+        print(f"{row['algorithm']:<16} {row['pattern']:<16} {row['size']:>7} "
+              f"{metrics['inversions']:>12} {metrics['runs']:>7} "
+              f"{row['comparisons']:>12} {row['swaps']:>10} {row['time'] * 1000:>10.2f}{flag}")
+    
+    print(f"\nPearson correlation across inputs (metric/stat)")
+    print("-" * 98)
+    columns = list(next(iter(report.values()), {}))
+    print(f"{'Algorithm':<16} " + " ".join(f"{column:>22}" for column in columns))
+    for name, values in report.items():
+        print(f"{name:<16} " + " ".join(f"{values[column]:>22.3f}" for column in columns))
+
+
+def parse_weights(spec: str) -> dict:
+    """
+    Parse cost weights given as name=value pairs
+    
+    Args:
+        spec: Comma-separated pairs such as 'write=10,read=1'
+    
+    Returns:
+        Config.COST_WEIGHTS with the given weights replaced
+    
+    Raises:
+        ValueError: If a name is not in Config.COST_WEIGHTS or a value is not a number
+    """
+    weights = dict(Config.COST_WEIGHTS)
+    for pair in filter(None, spec.split(',')):
+        name, _, value = pair.partition('=')
+        name = name.strip()
+        if name not in weights:
+            raise ValueError(f"Unknown cost weight '{name}'; choose from {', '.join(weights)}")
+        weights[name] = float(value)
+    return weights
+
+
+def print_cost(rows: List[dict]):
+    """
+    Rank algorithms by weighted cost for each input
+    
+    Args:
+        rows: Result of run_matrix()
+    """
+    weights = ', '.join(f"{name}={value:g}" for name, value in Config.COST_WEIGHTS.items())
+    print(f"\nWeighted cost ranking ({weights})")
+    print("-" * 98)
+    print(f"{'Pattern':<16} {'Size':>7} {'Rank':>4}  {'Algorithm':<22} {'Cost':>14} "
+          f"{'Comparisons':>12} {'Writes':>10} {'vs best':>8}")
+    groups = {}
+    for row in rows:
+        if row['verified']:
+            groups.setdefault((row['pattern'], row['size']), []).append(row)
+    for (pattern, size), group in groups.items():
+        group.sort(key=lambda row: row['cost'])
+        best = group[0]['cost'] or 1
+        for rank, row in enumerate(group, 1):
+            print(f"{pattern:<16} {size:>7} {rank:>4}  {row['algorithm']:<22} {row['cost']:>14,.0f} "
+                  f"{row['comparisons']:>12} {row['writes']:>10} {row['cost'] / best:>7.2f}x")
+
+
+def print_scaling(report: List[dict]):
+    """
+    Print fitted exponents with 95% intervals next to the claimed complexity
+    
+    Args:
+        report: Result of fit_scaling()
+    """
+    def exponent(fit):
+        if fit is None:
+            return f"{'-':>17}"
+        low, high = fit['ci']
+        return f"{fit['exponent']:>5.2f} [{low:>4.2f},{high:>5.2f}]"
+    
+    print(f"\nFitted growth exponents, work ~ n^k (95% interval)")
+    print("-" * 98)
+    print(f"{'Algorithm':<16} {'Pattern':<16} {'Claimed':<12} {'Operations':>17} "
+          f"{'Swaps':>17} {'Time':>17}  Verdict")
+    for entry in report:
+        fits = entry['fits']
+        if entry['verdict'] == 'average':
+            verdict = 'ok'
+        elif entry['verdict'] in ('best', 'worst'):
+            verdict = f"! {entry['verdict']} case {entry['claim']}"
+        else:
+            verdict = f"! {entry['verdict'].upper()}"
+        if entry['failed_sizes']:
+            verdict += f" (failed at n={', '.join(map(str, entry['failed_sizes']))})"
+        print(f"{entry['algorithm']:<16} {entry['pattern']:<16} {entry['claimed']:<12} "
+              f"{exponent(fits['operations'])} {exponent(fits['swaps'])} "
+              f"{exponent(fits['time'])}  {verdict}")
+
+
+def print_memory(rows: List[dict]):
+    """
+    Print the peak memory of each sort next to its space budget
+    
+    Args:
+        rows: Result of run_matrix() with profile_memory
+    """
+    print(f"\nPeak memory of the sort phase (KiB, input copy excluded)")
+    print("-" * 98)
+    print(f"{'Algorithm':<16} {'Pattern':<16} {'Size':>7} {'Space':<10} {'Peak':>10} "
+          f"{'Retained':>10} {'Blocks':>8} {'RSS':>10} {'Budget':>10}")
+    for row in rows:
+        if 'memory' not in row:
+            continue
+        memory = row['memory']
+        budget = f"{memory['budget'] / 1024:>10.1f}" if memory['budget'] is not None else f"{'-':>10}"
+        flag = '  OVER BUDGET' if memory['over_budget'] else ''
+        print(f"{row['algorithm']:<16} {row['pattern']:<16} {row['size']:>7} {memory['space']:<10} "
+              f"{memory['peak_bytes'] / 1024:>10.1f} {memory['net_bytes'] / 1024:>10.1f} "
+              f"{memory['peak_blocks']:>8} {memory['rss_peak'] / 1024:>10.1f} {budget}{flag}")
+
+
+def print_cache(rows: List[dict]):
+    """
+    Print the simulated cache behaviour of each row
+    
+    Args:
+        rows: Result of run_matrix() with simulate_cache
+    """
+    levels = list(rows[0]['cache']['levels']) if rows else []
+    print(f"\nSimulated cache ({Config.CACHE_ELEMENT_SIZE}-byte elements)")
+    print("-" * 98)
+    print(f"{'Algorithm':<16} {'Pattern':<16} {'Size':>7} {'Accesses':>10} "
+          + " ".join(f"{level + ' miss':>10}" for level in levels)
+          + f" {'Cycles':>12} {'Cyc/acc':>8}")
+    for row in rows:
+        cache = row['cache']
+        print(f"{row['algorithm']:<16} {row['pattern']:<16} {row['size']:>7} "
+              f"{cache['accesses']:>10} "
+              + " ".join(f"{cache['levels'][level]['misses']:>10}" for level in levels)
+              + f" {cache['cycles']:>12} {cache['cycles_per_access']:>8.2f}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function with CLI argument parsing"""
+    parser = argparse.ArgumentParser(
+        description='Headless sorting benchmark',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark.py
+  python benchmark.py --algorithms quick_sort merge_sort --sizes 1000 5000
+  python benchmark.py --patterns sorted reversed --json results.json
+  python benchmark.py --patterns quicksort_killer zipf --skew 2 --seed 7
+  python benchmark.py --algorithms merge_sort insertion_sort --curves --json curves.json
+  python benchmark.py --algorithms merge_sort quick_sort --sizes 20000 --cache
+  python benchmark.py --algorithms bubble_sort quick_sort --scaling
+  python benchmark.py --algorithms merge_sort bitonic_sort --sizes 10000 --memory
+  python benchmark.py --algorithms cycle_sort selection_sort write_selection_sort --weights write=20
+        """
+    )
+    
+    parser.add_argument(
+        '--algorithms',
+        nargs='+',
+        choices=list(ALGORITHM_MAP.keys()),
+        default=list(ALGORITHM_MAP.keys()),
+        help='Algorithms to benchmark (default: all)'
+    )
+    
+    parser.add_argument(
+        '--patterns',
+        nargs='+',
+        choices=[p.value for p in DataPattern],
+        default=[p.value for p in DataPattern],
+        help='Data patterns to generate (default: all)'
+    )
+    
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=Config.PATTERN_RUNS,
+        help=f'Ascending runs of the sawtooth pattern (default: {Config.PATTERN_RUNS})'
+    )
+    
+    parser.add_argument(
+        '--skew',
+        type=float,
+        default=Config.PATTERN_SKEW,
+        help=f'Exponent of the zipf pattern (default: {Config.PATTERN_SKEW})'
+    )
+    
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Seed for reproducible generated data (default: random)'
+    )
+    
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        help='Input sizes (default: 100 500, or Config.SCALING_SIZES with --scaling)'
+    )
+    
+    parser.add_argument(
+        '--curves',
+        action='store_true',
+        help='Track remaining inversions during each sort and export the curves'
+    )
+    
+    parser.add_argument(
+        '--scaling',
+        action='store_true',
+        help='Fit growth exponents over the sizes and check them against get_complexity()'
+    )
+    
+    parser.add_argument(
+        '--memory',
+        action='store_true',
+        help='Profile peak memory of each sort against its claimed space complexity'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Simulate the cache hierarchy in Config.CACHE_LEVELS for every sort'
+    )
+    
+    parser.add_argument(
+        '--cost',
+        action='store_true',
+        help='Rank algorithms by weighted operation cost per input'
+    )
+    
+    parser.add_argument(
+        '--weights',
+        metavar='SPEC',
+        help='Cost weights as name=value pairs, e.g. write=10,read=1 (implies --cost)'
+    )
+    
+    parser.add_argument(
+        '--gaps',
+        choices=list(GAP_SEQUENCES),
+        help=f'ShellSort gap sequence; overrides a tuning profile '
+             f'(default: tuned, else {Config.SHELL_GAPS})'
+    )
+    
+    parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help='Also write rows and correlations to a JSON file'
+    )
+    
+    args = parser.parse_args(argv)
+    Config.load_tuning()
+    Config.update(pattern_runs=args.runs, pattern_skew=args.skew, pattern_seed=args.seed)
+    if args.gaps:
+        Config.pin(shell_gaps=args.gaps)
+    if args.weights is not None:
+        try:
+            Config.update(cost_weights=parse_weights(args.weights))
+        except ValueError as e:
+            parser.error(str(e))
+    sizes = args.sizes or (Config.SCALING_SIZES if args.scaling else [100, 500])
+    
+    rows = run_matrix(args.algorithms, [DataPattern(p) for p in args.patterns], sizes,
+                      track_inversions=args.curves, simulate_cache=args.cache,
+                      scale_range=args.scaling, profile_memory=args.memory)
+    report = correlations(rows)
+    print_results(rows, report)
+    scaling = fit_scaling(rows) if args.scaling else None
+    if scaling is not None:
+        print_scaling(scaling)
+    if args.memory:
+        print_memory(rows)
+    if args.cache:
+        print_cache(rows)
+    if args.cost or args.weights is not None:
+        print_cost(rows)
+    
+    if args.json:
+        output = {'rows': rows, 'correlations': report}
+        if scaling is not None:
+            output['scaling'] = scaling
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+    
+    # Recursion-limit failures are findings of the run, not harness errors
+    return 0 if all(row['verified'] or 'error' in row for row in rows) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,17 +2,47 @@
 Configuration file for Sorting Visualizer
 All tuneable parameters in one place
 """
+import os
+from bisect import bisect_right
+
 
 class Config:
     # Data Generation
     DATA_SIZE = 100
     DATA_MIN = 0
     DATA_MAX = 100
+    PATTERN_RUNS = 4  # ascending runs of the sawtooth pattern
+    PATTERN_SKEW = 1.2  # Zipf exponent; larger concentrates on fewer keys
+    PATTERN_SEED = None  # seed for reproducible inputs (None = fresh each run)
+    
+    # Real inputs (main.py --input), sampled down to DATA_SIZE values
+    INPUT_PATH = None  # .npy, raw little-endian .i32/.i64 or .csv file
+    INPUT_DTYPE = None  # 'int32' or 'int64' for raw files without those extensions
+    INPUT_SAMPLE = 'stride'  # 'stride' keeps the file's layout, 'reservoir' is uniform
+    CSV_COLUMN = 0  # zero-based column holding the keys
+    CSV_CHUNK_ROWS = 100000  # rows parsed at a time
     
     # Visualization Settings
     FIG_WIDTH = 14
     FIG_HEIGHT = 7
     ANIMATION_DELAY = 0.05  # seconds between frames
+    PLAYBACK_SPEED = 1.0  # playback speed multiplier
+    LIVE_RENDERING = False  # draw while sorting instead of recorded playback
+    AGGREGATE_THRESHOLD = None  # bucket bars above this size (None = axes pixel width)
+    TRACK_INVERSIONS = False  # plot remaining inversions on a second axis
+    SHOW_HEATMAP = False  # show an access heatmap instead of per-frame bars
+    HEATMAP_BUCKETS = 512  # index columns of the access heatmap
+    HEATMAP_CMAP = 'magma'
+    
+    # Cache simulation (--cache); data is modelled as a flat array
+    SIMULATE_CACHE = False
+    CACHE_ELEMENT_SIZE = 8  # bytes per element
+    CACHE_LEVELS = [
+        {'name': 'L1', 'size': 32 * 1024, 'line_size': 64, 'associativity': 8, 'latency': 4},
+        {'name': 'L2', 'size': 256 * 1024, 'line_size': 64, 'associativity': 8, 'latency': 12},
+        {'name': 'L3', 'size': 8 * 1024 * 1024, 'line_size': 64, 'associativity': 16, 'latency': 40}
+    ]
+    CACHE_MEMORY_LATENCY = 200  # cycles for an access missing every level
     
     # Color Scheme
     COLORS = {
@@ -23,7 +53,22 @@ class Config:
         'right_partition': 'orange',
         'comparing': 'yellow',
         'sorted': 'purple',
-        'swapping': 'magenta'
+        'swapping': 'magenta',
+        'discarded': 'lightgray'
+    }
+    
+    # Terminal renderer (main.py --terminal): ANSI SGR color per COLORS key
+    TERMINAL_RENDERING = False
+    TERMINAL_COLORS = {
+        'default': '96',
+        'active_section': '34',
+        'pivot': '31',
+        'left_partition': '32',
+        'right_partition': '38;5;208',
+        'comparing': '93',
+        'sorted': '35',
+        'swapping': '95',
+        'discarded': '90'
     }
     
     # Algorithm Settings
@@ -32,11 +77,83 @@ class Config:
         'merge_sort',
         'bubble_sort',
         'insertion_sort',
-        'selection_sort'
+        'selection_sort',
+        'bitonic_sort',
+        'auto',
+        'online',
+        'heap_sort',
+        'shell_sort',
+        'rotation_merge_sort',
+        'cycle_sort',
+        'write_selection_sort',
+        'odd_even_sort'
     ]
     
     DEFAULT_ALGORITHM = 'quick_sort'
     
+    # Auto algorithm selection ('auto'); retune thresholds from benchmark runs
+    AUTO_PROBE_SAMPLE = 4096  # elements read by the presortedness probe
+    AUTO_THRESHOLDS = {
+        'small_size': 16,  # at or below: small-input choice
+        'presorted_descent_ratio': 0.01,  # at or below: nearly sorted
+        'presorted_inversions_per_element': 8,  # above: a few long runs instead
+        'reversed_descent_ratio': 0.9,  # at or above: mostly descending
+        'duplicate_distinct_ratio': 0.1  # distinct/sampled at or below: duplicates
+    }
+    AUTO_CHOICES = {
+        'small': 'insertion_sort',
+        'presorted': 'insertion_sort',
+        'runs': 'merge_sort',  # few long runs: too many inversions for insertion sort
+        'reversed': 'merge_sort',
+        'duplicates': 'merge_sort',  # Lomuto QuickSort degrades on repeated keys
+        'default': 'quick_sort'
+    }
+    
+    # Hybrid cutoffs; `main.py tune` searches these per pattern and size band
+    QUICK_INSERTION_CUTOFF = 0  # insertion-sort partitions up to this size (0 = off)
+    MERGE_INSERTION_CUTOFF = 0  # insertion-sort sections up to this size (0 = off)
+    ROTATION_MERGE_RUN = 20  # RotationMergeSort's insertion-sorted run length
+    # ShellSort gap sequence: 'shell', 'knuth', 'ciura' or 'sedgewick'
+    SHELL_GAPS = 'ciura'
+    
+    # Tuning profile (main.py tune), loaded by the main.py and benchmark.py entry points
+    TUNING_PROFILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  'tuning_profile.json')
+    TUNING_BANDS = [128, 1024, 8192]  # size band edges
+    TUNING_SIZES = [64, 512, 4096]  # sizes searched by default, one per band
+    TUNING_ETA = 2  # successive halving keeps 1/eta of the candidates per round
+    TUNING_PATTERN = None  # pattern of the data being sorted, if known
+    TUNED = {}  # pattern -> size band -> {parameter: value}
+    PINNED = set()  # parameters set explicitly (Config.pin), never overridden by TUNED
+    
+    # Complexity fitting (benchmark.py --scaling)
+    SCALING_SIZES = [64, 128, 256, 512, 1024, 2048]  # geometric size ladder
+    COMPLEXITY_TOLERANCE = 0.1  # residual exponent accepted as matching a claim
+    
+    # Memory profiling (main.py --profile, benchmark.py --memory)
+    PROFILE = False
+    MEMORY_SAMPLE_INTERVAL = 0.005  # seconds between RSS samples
+    MEMORY_BUDGET_BASE = 64 * 1024  # bytes allowed regardless of n
+    MEMORY_BUDGET_PER_ELEMENT = 64  # bytes per unit of the claimed space model
+    
+    # Selection (QuickSelect.select/partial_sort, main.py --top)
+    SELECT_HEAP_LIMIT = 64  # largest k handled by heap-select
+    TOP_K = None  # partially sort only the k smallest elements
+    
+    # Online sorting (OnlineSorter, main.py --stream)
+    ONLINE_LOAD = 512  # target chunk length; chunks split at twice this
+    STREAM = False
+    STREAM_INTERVAL = 0.05  # seconds between streamed values
+    
+    # Browser renderer (main.py serve)
+    SERVE_HOST = '127.0.0.1'  # localhost only; the page has no authentication
+    SERVE_PORT = 8765
+    SERVE_WINDOW = 4  # frames the page may have undrawn before the sort waits
+    
+    # Operation cost model (get_stats()['cost'], benchmark.py --weights);
+    # raise 'write' for storage where writes cost more than reads
+    COST_WEIGHTS = {'compare': 1.0, 'read': 1.0, 'write': 1.0, 'swap': 0.0}
+    
     # Display Options
     SHOW_TITLE = True
     SHOW_LEGEND = True
@@ -47,4 +164,68 @@ class Config:
         """Update configuration values"""
         for key, value in kwargs.items():
             if hasattr(cls, key.upper()):
-                setattr(cls, key.upper(), value)
\ No newline at end of file
+                setattr(cls, key.upper(), value)
+    
+    @classmethod
+    def pin(cls, **kwargs):
+        """Update configuration values that tuning profiles must not override"""
+        cls.update(**kwargs)
+        cls.PINNED.update(key.upper() for key in kwargs if hasattr(cls, key.upper()))
+    
+    @classmethod
+    def size_band(cls, n: int) -> str:
+        """
+        Name the TUNING_BANDS band an input size falls in
+        
+        Args:
+            n: Input size
+        
+        Returns:
+            Band label such as '128-1024', or '8192+' above the last edge
+        """
+        edges = [0] + cls.TUNING_BANDS
+        i = bisect_right(edges, n) - 1
+        return f"{edges[i]}-{edges[i + 1]}" if i + 1 < len(edges) else f"{edges[i]}+"
+    
+    @classmethod
+    def tuned(cls, name: str, n: int):
+        """
+        Value of a tunable parameter for an input of n elements
+        
+        The tuning profile entry for TUNING_PATTERN (or 'random' when the
+        pattern is unknown) and the size band of n wins over the plain
+        class attribute, unless the attribute was set with pin().
+        
+        Args:
+            name: Parameter (class attribute) name
+            n: Input size
+        
+        Returns:
+            Tuned value, or the attribute's own value when none was tuned
+        """
+        if name in cls.PINNED:
+            return getattr(cls, name)
+        bands = cls.TUNED.get(cls.TUNING_PATTERN or 'random', {})
+        return bands.get(cls.size_band(n), {}).get(name, getattr(cls, name))
+    
+    @classmethod
+    def load_tuning(cls, path=None) -> bool:
+        """
+        Load tuned parameters written by `main.py tune`
+        
+        Args:
+            path: Profile path (default: TUNING_PROFILE)
+        
+        Returns:
+            True if a profile was found and loaded
+        """
+        path = path or cls.TUNING_PROFILE
+        if not path or not os.path.exists(path):
+            return False
+        import json
+        
+        with open(path) as f:
+            profile = json.load(f)
+        cls.TUNED = profile.get('parameters', {})
+        cls.TUNING_BANDS = profile.get('bands', cls.TUNING_BANDS)
+        return True
\ No newline at end of file
@@ -2,5 +2,8 @@
 Data generation package
 """
 from .data_generator import DataGenerator, DataPattern
+from .adversary import QuicksortAdversary
+from .loader import load_input, SAMPLING_METHODS, RAW_DTYPES
 
-__all__ = ['DataGenerator', 'DataPattern']
\ No newline at end of file
+__all__ = ['DataGenerator', 'DataPattern', 'QuicksortAdversary', 'load_input',
+           'SAMPLING_METHODS', 'RAW_DTYPES']
@@ -0,0 +1,105 @@
+"""
+McIlroy's adversary: builds a quicksort-killing input while a sorter runs
+"""
+from typing import List
+
+
+class QuicksortAdversary:
+    """
+    Decide element values lazily from the comparisons a sorter makes
+    
+    Every element starts as "gas", larger than any value decided so far.
+    When two gas elements are compared, one is frozen to the next "solid"
+    value, preferring the element last compared against a solid one: in a
+    quicksort that element is the pivot, so each pivot turns out to be the
+    smallest remaining element. The answers stay consistent with one fixed
+    input, which ranks() returns after the sort, so sorting that input
+    again with the same random choices repeats the quadratic run (see
+    M. D. McIlroy, "A Killer Adversary for Quicksort", 1999).
+    """
+    
+    __slots__ = ('values', 'gas', 'solid', 'candidate')
+    
+    def __init__(self, size: int):
+        """
+        Initialize adversary
+        
+        Args:
+            size: Number of elements
+        """
+        self.gas = size
+        self.values = [size] * size
+        self.solid = 0
+        self.candidate = 0
+    
+    def keys(self) -> List['AdversaryKey']:
+        """
+        Keys to sort, one per element, that ask the adversary when compared
+        
+        Returns:
+            List of AdversaryKey in element order
+        """
+        return [AdversaryKey(self, i) for i in range(len(self.values))]
+    
+    def _freeze(self, i: int):
+        """Give element i the next solid value"""
+        self.values[i] = self.solid
+        self.solid += 1
+    
+    def compare(self, x: int, y: int) -> int:
+        """
+        Compare elements x and y, freezing one if both are still gas
+        
+        Args:
+            x: First element
+            y: Second element
+        
+        Returns:
+            Negative, zero or positive as x is smaller than, equal to or
+            greater than y
+        """
+        values = self.values
+        if values[x] == self.gas and values[y] == self.gas:
+            self._freeze(x if x == self.candidate else y)
+        if values[x] == self.gas:
+            self.candidate = x
+        elif values[y] == self.gas:
+            self.candidate = y
+        return values[x] - values[y]
+    
+    def ranks(self) -> List[int]:
+        """
+        Fix the input the sorter was answered for
+        
+        Elements never compared with each other while gas are frozen in
+        index order, which no answer contradicts.
+        
+        Returns:
+            Distinct rank 0..size-1 of every element
+        """
+        for i, value in enumerate(self.values):
+            if value == self.gas:
+                self._freeze(i)
+        return list(self.values)
+
+
+class AdversaryKey:
+    """Sort key whose comparisons are answered by a QuicksortAdversary"""
+    
+    __slots__ = ('adversary', 'index')
+    
+    def __init__(self, adversary: QuicksortAdversary, index: int):
+        self.adversary = adversary
+        self.index = index
+    
+    def __lt__(self, other: 'AdversaryKey') -> bool:
+        return self.adversary.compare(self.index, other.index) < 0
+    
+    def __le__(self, other: 'AdversaryKey') -> bool:
+        return self.adversary.compare(self.index, other.index) <= 0
+    
+    def __gt__(self, other: 'AdversaryKey') -> bool:
+        return self.adversary.compare(self.index, other.index) > 0
+    
+    def __ge__(self, other: 'AdversaryKey') -> bool:
+        return self.adversary.compare(self.index, other.index) >= 0
@@ -1,9 +1,9 @@
 """
 Data generation utilities for sorting algorithms
 """
-import numpy as np
-from typing import List
+from typing import List, Optional
 from enum import Enum
+from config import Config
 
 
 class DataPattern(Enum):
@@ -14,45 +14,157 @@ class DataPattern(Enum):
     NEARLY_SORTED = "nearly_sorted"
     FEW_UNIQUE = "few_unique"
     MANY_DUPLICATES = "many_duplicates"
+    ORGAN_PIPE = "organ_pipe"
+    SAWTOOTH = "sawtooth"
+    ZIPF = "zipf"
+    GAUSSIAN = "gaussian"
+    ALL_EQUAL = "all_equal"
+    QUICKSORT_KILLER = "quicksort_killer"
+    
+    @property
+    def adaptive(self) -> bool:
+        """Whether the input is built against the sorter that will sort it"""
+        return self is DataPattern.QUICKSORT_KILLER
+
+
+class SeededInput(list):
+    """
+    Generated values that only keep their shape under seeded random choices
+    
+    seed is the seed the sorter's random choices were drawn from while the
+    input was built; DataGenerator.seed_sorter() hands it to the sorter
+    that sorts it.
+    """
+    
+    __slots__ = ('seed',)
 
 
 class DataGenerator:
     """Generate various types of data for sorting"""
     
+    # Run-wide NumPy generator for Config.PATTERN_SEED, as (seed, generator)
+    _shared_rng = None
+    
     @staticmethod
     def generate(size: int, min_val: int, max_val: int, 
-                 pattern: DataPattern = DataPattern.RANDOM) -> List[int]:
+                 pattern: DataPattern = DataPattern.RANDOM,
+                 runs: Optional[int] = None, skew: Optional[float] = None,
+                 seed: Optional[int] = None, target: str = 'quick_sort') -> List[int]:
         """
         Generate data based on specified pattern
         
+        An explicit seed makes this call reproducible on its own. Without
+        one, calls draw from a single stream seeded once with
+        Config.PATTERN_SEED, so a seeded run is reproducible as a whole while
+        its inputs still differ from each other.
+            
         Args:
             size: Number of elements
             min_val: Minimum value
             max_val: Maximum value
             pattern: Type of data pattern
-            
+            runs: Ascending runs of SAWTOOTH (default: Config.PATTERN_RUNS)
+            skew: Zipf exponent of ZIPF (default: Config.PATTERN_SKEW)
+            seed: Seed for the random generators (default: Config.PATTERN_SEED)
+            target: ALGORITHM_MAP key QUICKSORT_KILLER is built against
+        
         Returns:
             List of integers
         """
         if pattern == DataPattern.RANDOM:
-            return DataGenerator._random(size, min_val, max_val)
+            return DataGenerator._random(size, min_val, max_val, DataGenerator._rng(seed))
         elif pattern == DataPattern.SORTED:
             return DataGenerator._sorted(size, min_val, max_val)
         elif pattern == DataPattern.REVERSED:
             return DataGenerator._reversed(size, min_val, max_val)
         elif pattern == DataPattern.NEARLY_SORTED:
-            return DataGenerator._nearly_sorted(size, min_val, max_val)
+            return DataGenerator._nearly_sorted(size, min_val, max_val, DataGenerator._rng(seed))
         elif pattern == DataPattern.FEW_UNIQUE:
-            return DataGenerator._few_unique(size, min_val, max_val)
+            return DataGenerator._few_unique(size, min_val, max_val, DataGenerator._rng(seed))
         elif pattern == DataPattern.MANY_DUPLICATES:
-            return DataGenerator._many_duplicates(size, min_val, max_val)
+            return DataGenerator._many_duplicates(size, min_val, max_val,
+                                                  DataGenerator._rng(seed))
+        elif pattern == DataPattern.ORGAN_PIPE:
+            return DataGenerator._organ_pipe(size, min_val, max_val)
+        elif pattern == DataPattern.SAWTOOTH:
+            return DataGenerator._sawtooth(size, min_val, max_val,
+                                           runs or Config.PATTERN_RUNS)
+        elif pattern == DataPattern.ZIPF:
+            return DataGenerator._zipf(size, min_val, max_val,
+                                       skew or Config.PATTERN_SKEW, DataGenerator._rng(seed))
+        elif pattern == DataPattern.GAUSSIAN:
+            return DataGenerator._gaussian(size, min_val, max_val, DataGenerator._rng(seed))
+        elif pattern == DataPattern.ALL_EQUAL:
+            return [(min_val + max_val) // 2] * size
+        elif pattern == DataPattern.QUICKSORT_KILLER:
+            seed = Config.PATTERN_SEED if seed is None else seed
+            return DataGenerator._quicksort_killer(size, min_val, max_val, target, seed)
         else:
-            return DataGenerator._random(size, min_val, max_val)
+            return DataGenerator._random(size, min_val, max_val, DataGenerator._rng(seed))
+    
+    @staticmethod
+    def seed_sorter(sorter, data):
+        """
+        Give a sorter with seeded random choices the seed data was built for
+        
+        Inputs such as QUICKSORT_KILLER are only adversarial while the
+        sorter draws the same pivots as when they were built. Sorters
+        without a seed attribute and plain inputs are left alone.
+        
+        Args:
+            sorter: Sorter instance about to sort data
+            data: Generated input
+        """
+        seed = getattr(data, 'seed', None)
+        if seed is not None and hasattr(sorter, 'seed'):
+            sorter.seed = seed
     
     @staticmethod
-    def _random(size: int, min_val: int, max_val: int) -> List[int]:
+    def _rng(seed: Optional[int] = None):
+        """
+        NumPy generator for one generate() call
+        
+        Args:
+            seed: Seed for this call only (default: the Config.PATTERN_SEED
+                stream, or fresh entropy when that is None too)
+        
+        Returns:
+            numpy.random.Generator
+        """
+        import numpy as np
+        
+        if seed is not None:
+            return np.random.default_rng(seed)
+        if Config.PATTERN_SEED is None:
+            return np.random.default_rng()
+        shared = DataGenerator._shared_rng
+        if shared is None or shared[0] != Config.PATTERN_SEED:
+            shared = (Config.PATTERN_SEED, np.random.default_rng(Config.PATTERN_SEED))
+            DataGenerator._shared_rng = shared
+        return shared[1]
+    
+    @staticmethod
+    async def stream(values, interval: float = 0.0):
+        """
+        Yield values one at a time as an async source, like a network feed
+        
+        Args:
+            values: Values to emit, in arrival order
+            interval: Seconds to wait before each value
+        
+        Yields:
+            Each value in turn
+        """
+        import asyncio
+        
+        for value in values:
+            await asyncio.sleep(interval)
+            yield value
+    
+    @staticmethod
+    def _random(size: int, min_val: int, max_val: int, rng) -> List[int]:
         """Generate random data"""
-        return [np.random.randint(min_val, max_val) for _ in range(size)]
+        return rng.integers(min_val, max_val, size).tolist()
     
     @staticmethod
     def _sorted(size: int, min_val: int, max_val: int) -> List[int]:
@@ -66,26 +178,109 @@ class DataGenerator:
         return list(reversed(DataGenerator._sorted(size, min_val, max_val)))
     
     @staticmethod
-    def _nearly_sorted(size: int, min_val: int, max_val: int) -> List[int]:
+    def _nearly_sorted(size: int, min_val: int, max_val: int, rng) -> List[int]:
         """Generate nearly sorted data with a few swaps"""
         data = DataGenerator._sorted(size, min_val, max_val)
         # Swap 10% of elements randomly
         num_swaps = max(1, size // 10)
         for _ in range(num_swaps):
-            i, j = np.random.randint(0, size, 2)
+            i, j = rng.integers(0, size, 2)
             data[i], data[j] = data[j], data[i]
         return data
     
     @staticmethod
-    def _few_unique(size: int, min_val: int, max_val: int) -> List[int]:
+    def _few_unique(size: int, min_val: int, max_val: int, rng) -> List[int]:
         """Generate data with only a few unique values"""
         unique_count = min(5, max_val - min_val)
-        unique_values = np.random.choice(range(min_val, max_val), unique_count, replace=False)
-        return [np.random.choice(unique_values) for _ in range(size)]
+        unique_values = min_val + rng.choice(max_val - min_val, unique_count, replace=False)
+        return rng.choice(unique_values, size).tolist()
     
     @staticmethod
-    def _many_duplicates(size: int, min_val: int, max_val: int) -> List[int]:
+    def _many_duplicates(size: int, min_val: int, max_val: int, rng) -> List[int]:
         """Generate data with many duplicate values"""
         unique_count = max(3, (max_val - min_val) // 10)
-        unique_values = np.random.choice(range(min_val, max_val), unique_count, replace=False)
-        return [np.random.choice(unique_values) for _ in range(size)]
\ No newline at end of file
+        unique_values = min_val + rng.choice(max_val - min_val, unique_count, replace=False)
+        return rng.choice(unique_values, size).tolist()
+    
+    @staticmethod
+    def _organ_pipe(size: int, min_val: int, max_val: int) -> List[int]:
+        """Generate data rising to the middle and falling back"""
+        import numpy as np
+        
+        i = np.arange(size)
+        height = np.minimum(i, size - 1 - i)
+        top = max((size - 1) // 2, 1)
+        return (min_val + height * (max_val - min_val - 1) // top).tolist()
+    
+    @staticmethod
+    def _sawtooth(size: int, min_val: int, max_val: int, runs: int) -> List[int]:
+        """Generate runs ascending runs, each spanning the value range"""
+        import numpy as np
+        
+        period = max(-(-size // max(runs, 1)), 1)
+        position = np.arange(size) % period
+        return (min_val + position * (max_val - min_val - 1) // max(period - 1, 1)).tolist()
+    
+    @staticmethod
+    def _zipf(size: int, min_val: int, max_val: int, skew: float, rng) -> List[int]:
+        """Generate keys whose k-th most frequent occurs in proportion to 1 / k^skew"""
+        import numpy as np
+        
+        span = max(max_val - min_val, 1)
+        weights = np.arange(1, span + 1, dtype=float) ** -skew
+        ranks = rng.choice(span, size, p=weights / weights.sum())
+        # Scatter the frequent keys over the range instead of the low end
+        return (min_val + rng.permutation(span)[ranks]).tolist()
+    
+    @staticmethod
+    def _gaussian(size: int, min_val: int, max_val: int, rng) -> List[int]:
+        """Generate normally distributed keys, three deviations to each bound"""
+        import numpy as np
+        
+        values = rng.normal((min_val + max_val) / 2, (max_val - min_val) / 6, size)
+        return np.clip(np.rint(values), min_val, max_val - 1).astype(int).tolist()
+    
+    @staticmethod
+    def _quicksort_killer(size: int, min_val: int, max_val: int, target: str,
+                          seed: Optional[int] = None) -> SeededInput:
+        """
+        Generate McIlroy's adversarial input against a sorter
+        
+        The target sorter sorts keys whose values a QuicksortAdversary
+        decides from its comparisons as they happen. Random pivots do not
+        escape it, but the fixed input only replays the run when the pivots
+        are drawn again, so the target is seeded and the seed travels with
+        the result: a target sorter given it through seed_sorter() repeats
+        the run on every sort.
+        
+        Args:
+            size: Number of elements
+            min_val: Minimum value
+            max_val: Maximum value (exceeded when the range has fewer than
+                size values, as the adversary needs distinct keys)
+            target: ALGORITHM_MAP key of the sorter to defeat
+            seed: Seed for the target's random choices (default: a fresh one)
+        
+        Returns:
+            SeededInput of distinct integers
+        """
+        import random
+        from algorithms import get_algorithm
+        from .adversary import QuicksortAdversary
+        
+        if seed is None:
+            seed = random.Random().getrandbits(32)
+        adversary = QuicksortAdversary(size)
+        sorter = get_algorithm(target)()
+        if hasattr(sorter, 'seed'):
+            sorter.seed = seed
+        try:
+            sorter.sort(adversary.keys(), copy=False)
+        except RecursionError:
+            # The replay fails at the same depth; the answers so far still hold
+            pass
+        
+        step = max(1, (max_val - min_val) // max(size, 1))
+        data = SeededInput(min_val + rank * step for rank in adversary.ranks())
+        data.seed = seed
+        return data
@@ -0,0 +1,223 @@
+"""
+Read real inputs from .npy, raw binary and CSV files, sampled to a visualizable size
+"""
+import os
+from itertools import chain, islice
+from typing import List, Optional, Tuple
+from config import Config
+
+# Raw formats are headerless little-endian integers; the extension names the width
+RAW_DTYPES = {'int32': '<i4', 'int64': '<i8'}
+RAW_EXTENSIONS = {'.i32': 'int32', '.int32': 'int32', '.i64': 'int64', '.int64': 'int64'}
+
+SAMPLING_METHODS = ['stride', 'reservoir']
+
+
+def open_binary(path: str, dtype: Optional[str] = None):
+    """
+    Map a .npy or raw integer file without reading it into memory
+    
+    Args:
+        path: File path
+        dtype: 'int32' or 'int64' for raw files (default: from the extension)
+    
+    Returns:
+        Read-only 1-D NumPy memmap
+    
+    Raises:
+        ValueError: If a raw file's width is neither given nor implied by
+            its extension, or a .npy array is not one-dimensional
+    """
+    import numpy as np
+    
+    if path.lower().endswith('.npy'):
+        values = np.load(path, mmap_mode='r')
+        if values.ndim != 1:
+            raise ValueError(f"{path} holds a {values.ndim}-D array; expected 1-D keys")
+        return values
+    
+    dtype = dtype or RAW_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if dtype not in RAW_DTYPES:
+        raise ValueError(f"Cannot tell the integer width of {path}; "
+                         f"pass dtype as one of {', '.join(RAW_DTYPES)}")
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=RAW_DTYPES[dtype])
+    return np.memmap(path, dtype=RAW_DTYPES[dtype], mode='r')
+
+
+def read_csv_chunks(path: str, column: int = Config.CSV_COLUMN,
+                    chunk_rows: int = Config.CSV_CHUNK_ROWS, step: int = 1):
+    """
+    Parse one column of a CSV file a chunk of rows at a time
+    
+    A first row whose field is not a number is taken as a header.
+    
+    Args:
+        path: File path
+        column: Zero-based column holding the keys
+        chunk_rows: Rows parsed per chunk
+        step: Keep only every step-th data row
+    
+    Yields:
+        1-D NumPy arrays of int64 keys, or float64 when a chunk has fractions
+    """
+    import numpy as np
+    
+    with open(path, newline='') as f:
+        first = f.readline()
+        rows = chain([first], f) if _is_number(first, column) else f
+        rows = islice(rows, 0, None, step)
+        while True:
+            lines = list(islice(rows, chunk_rows))
+            if not lines:
+                return
+            try:
+                yield np.loadtxt(lines, delimiter=',', usecols=column, dtype=np.int64, ndmin=1)
+            except ValueError:
+                yield np.loadtxt(lines, delimiter=',', usecols=column, dtype=np.float64, ndmin=1)
+
+
+def count_csv_rows(path: str, column: int = Config.CSV_COLUMN) -> int:
+    """
+    Count data rows without parsing them, reading 1 MiB at a time
+    
+    Args:
+        path: File path
+        column: Zero-based column holding the keys (decides about a header)
+    
+    Returns:
+        Number of rows after any header
+    """
+    count = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            count += block.count(b'\n')
+            last = block[-1:]
+    # A last row without a line break
+    count += last != b'\n'
+    with open(path, newline='') as f:
+        first = f.readline()
+    return count - (bool(first) and not _is_number(first, column))
+
+
+def _is_number(line: str, column: int) -> bool:
+    """Whether the given field of a CSV line parses as a number"""
+    try:
+        float(line.split(',')[column])
+        return True
+    except (ValueError, IndexError):
+        return False
+
+
+def stride_sample(values, size: int):
+    """
+    Every k-th element, k chosen so at most size elements remain
+    
+    On a memmap only the pages holding the picked elements are read.
+    
+    Args:
+        values: 1-D array
+        size: Largest sample size
+    
+    Returns:
+        1-D NumPy array in input order
+    """
+    step = max(1, -(-len(values) // max(size, 1)))
+    return values[::step][:size]
+
+
+def reservoir_sample(chunks, size: int, seed: Optional[int] = None):
+    """
+    Uniform sample of size elements from chunks of unknown total length
+    
+    Vectorized Algorithm R: the t-th element (0-based) replaces a random
+    slot when a draw from [0, t] falls below size, later elements winning.
+    Positions are kept so the sample comes back in input order.
+    
+    Args:
+        chunks: Iterable of 1-D NumPy arrays
+        size: Sample size
+        seed: Seed for the random generator (optional)
+    
+    Returns:
+        Tuple of (1-D NumPy array in input order, total number of elements)
+    """
+    import numpy as np
+    
+    rng = np.random.default_rng(seed)
+    sample = None
+    positions = np.empty(size, dtype=np.int64)
+    seen = 0
+    for chunk in chunks:
+        if sample is None:
+            sample = np.empty(size, dtype=chunk.dtype)
+        elif chunk.dtype != sample.dtype:
+            sample = sample.astype(np.result_type(sample, chunk))
+        # Fill the reservoir first
+        fill = min(max(size - seen, 0), len(chunk))
+        sample[seen:seen + fill] = chunk[:fill]
+        positions[seen:seen + fill] = np.arange(seen, seen + fill)
+        rest = np.arange(seen + fill, seen + len(chunk))
+        slots = rng.integers(0, rest + 1) if len(rest) else rest
+        replace = slots < size
+        # Fancy assignment keeps the last of repeated slots, as sequential replacement would
+        sample[slots[replace]] = chunk[fill:][replace]
+        positions[slots[replace]] = rest[replace]
+        seen += len(chunk)
+    
+    if sample is None:
+        return np.empty(0, dtype=np.int64), 0
+    kept = min(size, seen)
+    order = np.argsort(positions[:kept], kind='stable')
+    return sample[:kept][order], seen
+
+
+def load_input(path: str, size: int, sample: str = Config.INPUT_SAMPLE,
+               dtype: Optional[str] = None, seed: Optional[int] = None) -> Tuple[List, int]:
+    """
+    Load keys from a file, sampled down to at most size values
+    
+    .npy and raw integer files are memory-mapped, so stride sampling reads
+    only the sampled pages and reservoir sampling only the chosen
+    elements; CSV files are parsed in chunks of Config.CSV_CHUNK_ROWS rows.
+    
+    Args:
+        path: .npy, raw (.i32/.i64, or any name with dtype) or .csv file
+        size: Largest number of values to return
+        sample: 'stride' (evenly spaced, keeps the file's layout) or
+            'reservoir' (uniformly random, in file order)
+        dtype: 'int32' or 'int64' for raw files
+        seed: Seed for reservoir sampling (default: Config.PATTERN_SEED)
+    
+    Returns:
+        Tuple of (list of values, number of values in the file)
+    
+    Raises:
+        ValueError: If the sampling method or raw integer width is unknown
+    """
+    import numpy as np
+    
+    if sample not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method '{sample}'; "
+                         f"choose from {', '.join(SAMPLING_METHODS)}")
+    seed = Config.PATTERN_SEED if seed is None else seed
+    
+    if path.lower().endswith('.csv'):
+        if sample == 'reservoir':
+            values, total = reservoir_sample(read_csv_chunks(path), size, seed)
+        else:
+            total = count_csv_rows(path)
+            step = max(1, -(-total // max(size, 1)))
+            chunks = list(read_csv_chunks(path, step=step))
+            values = np.concatenate(chunks)[:size] if chunks else np.empty(0, dtype=np.int64)
+        return values.tolist(), total
+    
+    values = open_binary(path, dtype)
+    total = len(values)
+    if sample == 'stride' or total <= size:
+        picked = stride_sample(values, size)
+    else:
+        rng = np.random.default_rng(seed)
+        picked = values[np.sort(rng.choice(total, size, replace=False))]
+    return np.asarray(picked).tolist(), total
@@ -2,13 +2,13 @@
 Main entry point for Sorting Visualizer
 """
 import sys
+import time
 import argparse
 from typing import Optional
 
 from config import Config
-from data import DataGenerator, DataPattern
-from visualizer import Visualizer
-from algorithms import get_algorithm, ALGORITHM_MAP
+from data import DataGenerator, DataPattern, SAMPLING_METHODS, RAW_DTYPES
+from algorithms import get_algorithm, ALGORITHM_MAP, GAP_SEQUENCES
 
 
 class SortingVisualizer:
@@ -22,9 +22,27 @@ class SortingVisualizer:
             config: Configuration object
         """
         self.config = config or Config()
-        self.visualizer = Visualizer(self.config)
+        self.visualizer = None
         self.data = []
+    
+    def _create_visualizer(self):
+        """
+        Create the renderer on first use so sort-only paths never import it
         
+        Returns:
+            Visualizer, PlaybackEngine or TerminalRenderer instance
+        """
+        from visualizer import Visualizer, PlaybackEngine
+        
+        if self.config.TERMINAL_RENDERING:
+            from visualizer import TerminalRenderer
+            
+            return TerminalRenderer(self.config)
+        # Streamed arrivals grow the view, which only the live renderer redraws
+        if self.config.LIVE_RENDERING or self.config.STREAM:
+            return Visualizer(self.config)
+        return PlaybackEngine(self.config)
+    
     def run(self, algorithm_name: str, data_pattern: DataPattern = DataPattern.RANDOM):
         """
         Run the sorting visualization
@@ -33,28 +51,71 @@ class SortingVisualizer:
             algorithm_name: Name of sorting algorithm
             data_pattern: Type of data pattern to generate
         """
-        # Generate data
+        from analysis import presortedness
+        
+        # Load or generate data
+        input_path = self.config.INPUT_PATH
+        if input_path:
+            from data import load_input
+            
+            start = time.perf_counter()
+            try:
+                self.data, total = load_input(
+                    input_path,
+                    self.config.DATA_SIZE,
+                    self.config.INPUT_SAMPLE,
+                    self.config.INPUT_DTYPE
+                )
+            except (OSError, ValueError) as e:
+                print(f"Error: cannot read '{input_path}': {e}")
+                return
+            load_time = time.perf_counter() - start
+        else:
+            self.data = DataGenerator.generate(
+                self.config.DATA_SIZE,
+                self.config.DATA_MIN,
+                self.config.DATA_MAX,
+                data_pattern,
+                target=algorithm_name
+            )
+        metrics = presortedness(self.data)
+        
         print(f"\n{'='*60}")
         print(f"SORTING VISUALIZER")
         print(f"{'='*60}")
         print(f"Algorithm: {algorithm_name}")
-        print(f"Data Size: {self.config.DATA_SIZE}")
-        print(f"Data Pattern: {data_pattern.value}")
+        print(f"Data Size: {len(self.data)}")
+        if input_path:
+            sampled = f", {self.config.INPUT_SAMPLE} sample of {total}" if total > len(self.data) else ""
+            print(f"Input: {input_path}{sampled} (loaded in {load_time * 1000:.0f} ms)")
+        else:
+            print(f"Data Pattern: {data_pattern.value}")
+        print(f"Inversions: {metrics['inversions']} ({metrics['inversion_ratio']:.1%} of pairs)")
+        print(f"Runs: {metrics['runs']}  LIS: {metrics['lis']}  "
+              f"Distinct: {metrics['distinct']}  Entropy: {metrics['entropy']:.2f} bits")
         print(f"{'='*60}\n")
         
-        self.data = DataGenerator.generate(
-            self.config.DATA_SIZE,
-            self.config.DATA_MIN,
-            self.config.DATA_MAX,
-            data_pattern
-        )
-        
         # Get algorithm
         AlgorithmClass = get_algorithm(algorithm_name)
         if not AlgorithmClass:
             print(f"Error: Algorithm '{algorithm_name}' not found!")
             print(f"Available algorithms: {', '.join(ALGORITHM_MAP.keys())}")
             return
+        top_k = self.config.TOP_K
+        if top_k:
+            # Partial sorting has one engine, whatever algorithm was named
+            from algorithms import QuickSelect
+            
+            AlgorithmClass = QuickSelect
+        stream = self.config.STREAM
+        if stream:
+            # Streams arrive one value at a time, which only the online sorter accepts
+            from algorithms import OnlineSorter
+            
+            AlgorithmClass = OnlineSorter
+        
+        if self.visualizer is None and not self.config.PROFILE:
+            self.visualizer = self._create_visualizer()
         
         # Setup visualizer callback
         def visualize_callback(**kwargs):
@@ -63,23 +124,90 @@ class SortingVisualizer:
                 stats = algorithm.get_stats()
             self.visualizer.visualize(stats=stats, **kwargs)
         
-        # Create algorithm instance with visualizer
-        algorithm = AlgorithmClass(visualizer=visualize_callback)
-        
-        # Setup visualization
-        self.visualizer.setup(self.data, algorithm.get_name())
+        if self.config.PROFILE:
+            # No renderer, so only the sort's own allocations are measured
+            algorithm = AlgorithmClass()
+        elif self.config.SHOW_HEATMAP:
+            # Record accesses instead of frames, then draw them all at once
+            from analysis import AccessTrace
+            
+            algorithm = AlgorithmClass()
+            algorithm.trace = AccessTrace(len(self.data), self.config.HEATMAP_BUCKETS)
+            self.visualizer.algorithm_name = algorithm.get_name()
+        else:
+            # Create algorithm instance with visualizer
+            algorithm = AlgorithmClass(visualizer=visualize_callback)
+            # Delta renderers read only the positions the sorter wrote
+            algorithm.changes = getattr(self.visualizer, 'changes', None)
+            
+            # Setup visualization; a stream starts out empty
+            self.visualizer.setup([] if stream else self.data, algorithm.get_name())
+        algorithm.track_inversions = self.config.TRACK_INVERSIONS
+        # Adversarial inputs carry the pivot seed they were built against
+        DataGenerator.seed_sorter(algorithm, self.data)
+        if self.config.SIMULATE_CACHE:
+            from analysis import MemoryModel
+            
+            algorithm.memory = MemoryModel(len(self.data))
         
         # Print algorithm info
         complexity = algorithm.get_complexity()
-        print(f"Time Complexity:")
-        print(f"  Best Case:  {complexity['time_best']}")
-        print(f"  Average:    {complexity['time_avg']}")
-        print(f"  Worst Case: {complexity['time_worst']}")
+        if top_k:
+            print(f"Partial sort of the {top_k} smallest elements")
+            print(f"Time Complexity: O(n log k) heap-select for k <= {self.config.SELECT_HEAP_LIMIT}, "
+                  f"O(n + k log k) introselect above")
+        else:
+            print(f"Time Complexity:")
+            print(f"  Best Case:  {complexity['time_best']}")
+            print(f"  Average:    {complexity['time_avg']}")
+            print(f"  Worst Case: {complexity['time_worst']}")
         print(f"Space Complexity: {complexity['space']}")
+        print(f"Stable: {'yes' if algorithm.STABLE else 'no'}")
+        if algorithm.TUNABLE and self.config.TUNED:
+            n = len(self.data)
+            tuned = ', '.join(f"{name}={self.config.tuned(name, n)}" for name in algorithm.TUNABLE)
+            print(f"Tuned for {data_pattern.value}, n in {self.config.size_band(n)}: {tuned}")
+        if stream:
+            print(f"Streaming {len(self.data)} values, one every "
+                  f"{self.config.STREAM_INTERVAL * 1000:g} ms")
         print(f"\nStarting visualization...\n")
         
         # Sort
-        sorted_data = algorithm.sort(self.data)
+        start = time.perf_counter()
+        try:
+            if top_k:
+                sorted_data = algorithm.partial_sort(self.data, top_k)
+            elif stream:
+                import asyncio
+                
+                source = DataGenerator.stream(self.data, self.config.STREAM_INTERVAL)
+                asyncio.run(algorithm.afeed(source))
+                sorted_data = algorithm.snapshot()
+            else:
+                sorted_data = algorithm.sort(self.data)
+        except BaseException:
+            # The terminal renderer hides the cursor until finalize(); give
+            # it back when the sort raises or is interrupted with Ctrl+C
+            if self.config.TERMINAL_RENDERING and self.visualizer is not None:
+                self.visualizer.finalize()
+            raise
+        elapsed = time.perf_counter() - start
+        
+        memory = None
+        if self.config.PROFILE:
+            from analysis import MemoryProbe, memory_budget
+            
+            # Profile a second run: tracing would distort the timing above
+            sorter = AlgorithmClass()
+            DataGenerator.seed_sorter(sorter, self.data)
+            work = self.data[:]
+            with MemoryProbe() as probe:
+                if top_k:
+                    sorter.partial_sort(work, top_k, copy=False)
+                else:
+                    sorter.sort(work, copy=False)
+            memory = probe.report()
+            memory['budget'] = memory_budget(len(work), complexity['space'])
         
         # Print statistics
         stats = algorithm.get_stats()
@@ -88,19 +216,68 @@ class SortingVisualizer:
         print(f"{'='*60}")
         print(f"Comparisons: {stats['comparisons']}")
         print(f"Swaps:       {stats['swaps']}")
-        print(f"Accesses:    {stats['accesses']}")
+        print(f"Accesses:    {stats['accesses']} ({stats['writes']} writes)")
+        print(f"Cost:        {stats['cost']:,.0f} (weights {self.config.COST_WEIGHTS})")
+        print(f"Time:        {elapsed * 1000:.2f} ms")
+        if 'insert_rate' in stats:
+            print(f"Inserts:     {stats['inserts']} ({stats['insert_rate']:,.0f}/s, "
+                  f"{stats['chunks']} chunks)")
+        if 'select_method' in stats:
+            print(f"Selection:   {stats['select_method']} (k = {stats['select_k']})")
+        if 'auto_choice' in stats:
+            print(f"Auto choice: {stats['auto_choice']} "
+                  f"(probe {stats['probe_time'] * 1000:.2f} ms, "
+                  f"descent ratio {stats['probe']['descent_ratio']:.3f}, "
+                  f"distinct ratio {stats['probe']['distinct_ratio']:.3f})")
+        if algorithm.memory is not None:
+            cache = algorithm.memory.report()
+            print(f"Cache:       {cache['reads']} reads, {cache['writes']} writes, "
+                  f"{cache['cycles']} cycles ({cache['cycles_per_access']:.2f}/access)")
+            for name, level in cache['levels'].items():
+                print(f"  {name}: {level['hits']} hits, {level['misses']} misses "
+                      f"({level['hit_rate']:.1%} hit rate)")
+        if memory is not None:
+            budget = memory['budget']
+            verdict = '' if budget is None else (
+                f", budget {budget / 1024:.1f} KiB for {complexity['space']}"
+                + (' - OVER BUDGET' if memory['peak_bytes'] > budget else '')
+            )
+            print(f"Peak memory: {memory['peak_bytes'] / 1024:.1f} KiB traced{verdict}")
+            print(f"  Retained {memory['net_bytes'] / 1024:.1f} KiB, "
+                  f"{memory['peak_blocks']} blocks, RSS +{memory['rss_peak'] / 1024:.1f} KiB "
+                  f"({memory['samples']} samples)")
         print(f"{'='*60}\n")
         
         # Verify sort
-        is_sorted = all(sorted_data[i] <= sorted_data[i+1] for i in range(len(sorted_data)-1))
+        if top_k:
+            is_sorted = list(sorted_data[:top_k]) == sorted(self.data)[:top_k]
+        else:
+            is_sorted = all(sorted_data[i] <= sorted_data[i+1] for i in range(len(sorted_data)-1))
         print(f"Verification: {'✓ PASSED' if is_sorted else '✗ FAILED'}")
         
         # Finalize visualization
-        self.visualizer.finalize()
+        if self.config.PROFILE:
+            return
+        if self.config.SHOW_HEATMAP:
+            curve = algorithm.tracker.curve if algorithm.tracker is not None else None
+            self.visualizer.show_heatmap(algorithm.trace, stats, curve)
+        else:
+            self.visualizer.finalize()
 
 
 def main():
     """Main function with CLI argument parsing"""
+    if sys.argv[1:2] == ['tune']:
+        import tuner
+        
+        return tuner.main(sys.argv[2:])
+    if sys.argv[1:2] == ['serve']:
+        import server
+        
+        return server.main(sys.argv[2:])
+    
+    Config.load_tuning()
+    
     parser = argparse.ArgumentParser(
         description='Sorting Algorithm Visualizer',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -110,6 +287,21 @@ Examples:
   python main.py merge_sort --size 50 --delay 0.1
   python main.py bubble_sort --pattern nearly_sorted
   python main.py insertion_sort --size 30 --delay 0.05 --pattern reversed
+  python main.py quick_sort --size 2000 --speed 4
+  python main.py merge_sort --size 500 --terminal --delay 0
+  python main.py merge_sort --size 200 --inversions
+  python main.py quick_sort --size 100000 --max 1000000 --heatmap
+  python main.py merge_sort --size 20000 --heatmap --cache
+  python main.py merge_sort --size 50000 --max 1000000 --profile
+  python main.py quick_sort --size 200 --top 10
+  python main.py online --size 100 --stream --interval 0.02
+  python main.py shell_sort --size 100 --gaps sedgewick
+  python main.py quick_sort --size 200 --pattern quicksort_killer
+  python main.py merge_sort --pattern sawtooth --runs 8 --seed 42
+  python main.py quick_sort --input keys.npy --size 500 --sample reservoir
+  python main.py merge_sort --input dump.bin --dtype int64 --size 200
+  python main.py tune --algorithms quick_sort merge_sort   (see: python main.py tune --help)
+  python main.py serve quick_sort --size 5000              (see: python main.py serve --help)
         """
     )
     
@@ -147,6 +339,76 @@ Examples:
         help=f'Animation delay in seconds (default: {Config.ANIMATION_DELAY})'
     )
     
+    parser.add_argument(
+        '--speed',
+        type=float,
+        default=Config.PLAYBACK_SPEED,
+        help=f'Playback speed multiplier (default: {Config.PLAYBACK_SPEED})'
+    )
+    
+    parser.add_argument(
+        '--terminal',
+        action='store_true',
+        help='Draw in the terminal with ANSI escapes instead of a matplotlib window (works over SSH)'
+    )
+    
+    parser.add_argument(
+        '--live',
+        action='store_true',
+        help='Draw while sorting instead of playing back recorded events'
+    )
+    
+    parser.add_argument(
+        '--inversions',
+        action='store_true',
+        help='Plot remaining inversions against operations on a second axis'
+    )
+    
+    parser.add_argument(
+        '--heatmap',
+        action='store_true',
+        help='Sort without frames and show a time x index access heatmap'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Simulate the cache hierarchy in config.py and report hits and misses'
+    )
+    
+    parser.add_argument(
+        '--top',
+        type=int,
+        metavar='K',
+        help='Only sort the K smallest elements, with the QuickSelect engine'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Feed the data one value at a time into the online sorter as an async stream'
+    )
+    
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=Config.STREAM_INTERVAL,
+        help=f'Seconds between streamed values (default: {Config.STREAM_INTERVAL})'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Sort without rendering and report time and peak memory of the sort'
+    )
+    
+    parser.add_argument(
+        '--gaps',
+        choices=list(GAP_SEQUENCES),
+        help=f'ShellSort gap sequence; overrides a tuning profile '
+             f'(default: tuned, else {Config.SHELL_GAPS})'
+    )
+    
     parser.add_argument(
         '--pattern',
         choices=[p.value for p in DataPattern],
@@ -154,6 +416,47 @@ Examples:
         help='Data pattern to generate (default: random)'
     )
     
+    parser.add_argument(
+        '--input',
+        metavar='PATH',
+        help='Sort keys from a .npy, raw .i32/.i64 or .csv file instead of a '
+             'generated pattern, sampled down to --size values'
+    )
+    
+    parser.add_argument(
+        '--dtype',
+        choices=list(RAW_DTYPES),
+        help='Integer width of a raw --input file (default: from its extension)'
+    )
+    
+    parser.add_argument(
+        '--sample',
+        choices=SAMPLING_METHODS,
+        default=Config.INPUT_SAMPLE,
+        help='How --input is sampled: stride keeps the layout, reservoir is uniform '
+             f'(default: {Config.INPUT_SAMPLE})'
+    )
+    
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=Config.PATTERN_RUNS,
+        help=f'Ascending runs of the sawtooth pattern (default: {Config.PATTERN_RUNS})'
+    )
+    
+    parser.add_argument(
+        '--skew',
+        type=float,
+        default=Config.PATTERN_SKEW,
+        help=f'Exponent of the zipf pattern (default: {Config.PATTERN_SKEW})'
+    )
+    
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Seed for reproducible generated data (default: random)'
+    )
+    
     parser.add_argument(
         '--no-stats',
         action='store_true',
@@ -161,6 +464,10 @@ Examples:
     )
     
     args = parser.parse_args()
+    if args.stream and args.top:
+        parser.error('--stream and --top cannot be combined')
+    if args.terminal and args.heatmap:
+        parser.error('--terminal and --heatmap cannot be combined')
     
     # Update config
     Config.update(
@@ -168,8 +475,27 @@ Examples:
         data_min=args.min,
         data_max=args.max,
         animation_delay=args.delay,
+        playback_speed=args.speed,
+        live_rendering=args.live,
+        terminal_rendering=args.terminal,
+        track_inversions=args.inversions,
+        show_heatmap=args.heatmap,
+        simulate_cache=args.cache,
+        profile=args.profile,
+        top_k=args.top,
+        stream=args.stream,
+        stream_interval=args.interval,
+        tuning_pattern=args.pattern,
+        pattern_runs=args.runs,
+        pattern_skew=args.skew,
+        pattern_seed=args.seed,
+        input_path=args.input,
+        input_dtype=args.dtype,
+        input_sample=args.sample,
         show_stats=not args.no_stats
     )
+    if args.gaps:
+        Config.pin(shell_gaps=args.gaps)
     
     # Create and run visualizer
     visualizer = SortingVisualizer()
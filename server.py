@@ -0,0 +1,422 @@
+"""
+Local visualization server: a canvas page fed delta frames over a WebSocket
+"""
+import os
+import sys
+import base64
+import struct
+import asyncio
+import hashlib
+import argparse
+import threading
+from urllib.parse import urlsplit
+from typing import Callable, List, Optional, Tuple
+
+from config import Config
+from data import DataPattern
+from algorithms import ALGORITHM_MAP
+
+PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'visualizer', 'static', 'index.html')
+
+# RFC 6455 handshake suffix and opcodes
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+# Largest client message accepted; the page only sends 4-byte acks
+MAX_CLIENT_MESSAGE = 1 << 16
+
+
+def encode_frame(opcode: int, payload: bytes = b'', mask: bool = False) -> bytes:
+    """
+    Build one unfragmented WebSocket frame
+    
+    Args:
+        opcode: Frame opcode
+        payload: Message bytes
+        mask: Mask the payload, as clients must
+    
+    Returns:
+        Frame bytes
+    """
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        head = struct.pack('!BB', 0x80 | opcode, mask_bit | length)
+    elif length < 1 << 16:
+        head = struct.pack('!BBH', 0x80 | opcode, mask_bit | 126, length)
+    else:
+        head = struct.pack('!BBQ', 0x80 | opcode, mask_bit | 127, length)
+    if not mask:
+        return head + payload
+    key = os.urandom(4)
+    return head + key + _unmask(payload, key)
+
+
+def _unmask(payload: bytes, key: bytes) -> bytes:
+    """XOR payload with the repeating 4-byte key (masking is its own inverse)"""
+    repeated = (key * (len(payload) // 4 + 1))[:len(payload)]
+    return (int.from_bytes(payload, 'little') ^ int.from_bytes(repeated, 'little')).to_bytes(
+        len(payload), 'little')
+
+
+async def read_frame(reader: asyncio.StreamReader,
+                     limit: Optional[int] = None) -> Tuple[int, bytes]:
+    """
+    Read one WebSocket frame, unmasking it if needed
+    
+    Args:
+        reader: Stream to read from
+        limit: Largest payload accepted (optional)
+    
+    Returns:
+        Tuple of (opcode, payload)
+    
+    Raises:
+        ConnectionError: If the payload exceeds limit
+        asyncio.IncompleteReadError: If the peer closes mid-frame
+    """
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length, = struct.unpack('!H', await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack('!Q', await reader.readexactly(8))
+    if limit is not None and length > limit:
+        raise ConnectionError(f"client message of {length} bytes exceeds {limit}")
+    key = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    return first & 0x0F, _unmask(payload, key) if key else payload
+
+
+def accept_key(key: str) -> str:
+    """
+    Sec-WebSocket-Accept value for a client's Sec-WebSocket-Key
+    
+    Args:
+        key: Client key
+    
+    Returns:
+        Base64 SHA-1 of the key and the protocol GUID
+    """
+    digest = hashlib.sha1((key + WEBSOCKET_GUID).encode('ascii')).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+def same_origin(headers: dict) -> bool:
+    """
+    Whether a WebSocket request comes from this server's own page
+    
+    Browsers send Origin with every WebSocket handshake, so without this
+    check any page open in the browser could start sorts on the local
+    server. Clients that send no Origin (scripts, tests) are not browsers
+    and are let through.
+    
+    Args:
+        headers: Request headers with lowercase names
+    
+    Returns:
+        True if Origin is absent or names the host the request was sent to
+    """
+    origin = headers.get('origin')
+    if origin is None:
+        return True
+    return urlsplit(origin).netloc.lower() == headers.get('host', '').lower()
+
+
+class Session:
+    """
+    One page connection, written to by a sort thread
+    
+    send() takes one of window credits and the page returns credits as it
+    draws, so at most window frames are ever in flight and the sort blocks
+    until the page catches up.
+    """
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, window: int = Config.SERVE_WINDOW):
+        """
+        Initialize session
+        
+        Args:
+            loop: Event loop that owns the connection
+            window: Most frames sent but not yet drawn
+        """
+        self.loop = loop
+        self.window = window
+        self.outgoing: asyncio.Queue = asyncio.Queue()
+        self.credits = threading.Semaphore(window)
+        self.closed = threading.Event()
+        self.sent = 0
+        self.acked = 0
+        self.max_in_flight = 0
+    
+    def send(self, payload: bytes):
+        """
+        Queue a binary frame, waiting for a credit first (any thread)
+        
+        Args:
+            payload: Frame message
+        
+        Raises:
+            ConnectionResetError: If the page has disconnected
+        """
+        while not self.credits.acquire(timeout=0.1):
+            if self.closed.is_set():
+                raise ConnectionResetError("page disconnected")
+        if self.closed.is_set():
+            raise ConnectionResetError("page disconnected")
+        self.sent += 1
+        self.max_in_flight = max(self.max_in_flight, self.sent - self.acked)
+        self.loop.call_soon_threadsafe(self.outgoing.put_nowait,
+                                       encode_frame(OP_BINARY, payload))
+    
+    def send_text(self, text: str):
+        """
+        Queue a text message without taking a credit (any thread)
+        
+        Args:
+            text: Message
+        """
+        self.loop.call_soon_threadsafe(self.outgoing.put_nowait,
+                                       encode_frame(OP_TEXT, text.encode('utf-8')))
+    
+    def acknowledge(self, count: int):
+        """
+        Return credits for frames the page has drawn (event loop thread)
+        
+        Args:
+            count: Frames drawn, capped at the frames in flight
+        """
+        count = min(count, self.sent - self.acked)
+        if count > 0:
+            self.acked += count
+            self.credits.release(count)
+    
+    async def pump(self, writer: asyncio.StreamWriter):
+        """Write queued messages until a None arrives"""
+        while True:
+            message = await self.outgoing.get()
+            if message is None:
+                return
+            writer.write(message)
+            await writer.drain()
+    
+    async def receive(self, reader: asyncio.StreamReader):
+        """Handle acks, pings and close until the page goes away"""
+        try:
+            while True:
+                opcode, payload = await read_frame(reader, MAX_CLIENT_MESSAGE)
+                if opcode == OP_CLOSE:
+                    self.outgoing.put_nowait(encode_frame(OP_CLOSE, payload[:2]))
+                    return
+                if opcode == OP_PING:
+                    self.outgoing.put_nowait(encode_frame(OP_PONG, payload))
+                elif opcode == OP_BINARY and len(payload) == 4:
+                    self.acknowledge(struct.unpack('<I', payload)[0])
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.closed.set()
+
+
+async def start_server(run: Callable[[Session], None], host: str = Config.SERVE_HOST,
+                       port: int = Config.SERVE_PORT,
+                       window: int = Config.SERVE_WINDOW) -> asyncio.AbstractServer:
+    """
+    Serve the page at / and run one sort per WebSocket connection at /ws
+    
+    Sorts run one at a time in a worker thread; a second page waits for
+    the first sort to finish. WebSocket requests from other origins get a
+    403 (see same_origin()).
+    
+    Args:
+        run: Function sorting into a Session, called in a worker thread
+        host: Interface to listen on
+        port: Port (0 picks a free one)
+        window: Frames in flight per connection
+    
+    Returns:
+        Listening asyncio server
+    """
+    lock = asyncio.Lock()
+    
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = request.decode('latin-1').split('\r\n')
+        parts = lines[0].split()
+        path = parts[1] if len(parts) > 1 else '/'
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        try:
+            if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                if same_origin(headers):
+                    await _websocket(reader, writer, headers)
+                else:
+                    _respond(writer, '403 Forbidden', b'Cross-origin request refused', 'text/plain')
+            elif path in ('/', '/index.html'):
+                with open(PAGE, 'rb') as f:
+                    _respond(writer, '200 OK', f.read(), 'text/html; charset=utf-8')
+            else:
+                _respond(writer, '404 Not Found', b'Not found', 'text/plain')
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def _websocket(reader, writer, headers):
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept_key(headers.get('sec-websocket-key', ''))}\r\n\r\n"
+        ).encode('ascii'))
+        loop = asyncio.get_running_loop()
+        session = Session(loop, window)
+        pump = asyncio.create_task(session.pump(writer))
+        receiver = asyncio.create_task(session.receive(reader))
+        async with lock:
+            if not session.closed.is_set():
+                await loop.run_in_executor(None, run, session)
+        if not session.closed.is_set():
+            session.outgoing.put_nowait(encode_frame(OP_CLOSE, struct.pack('!H', 1000)))
+        session.outgoing.put_nowait(None)
+        await pump
+        receiver.cancel()
+    
+    return await asyncio.start_server(handle, host, port)
+
+
+def _respond(writer: asyncio.StreamWriter, status: str, body: bytes, content_type: str):
+    """Write a complete HTTP response"""
+    writer.write((
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n"
+    ).encode('ascii') + body)
+
+
+def run_sort(session: Session, algorithm_name: str, pattern: DataPattern):
+    """
+    Generate data and sort it into a session through the main application
+    
+    Args:
+        session: Connection to render into
+        algorithm_name: Key in ALGORITHM_MAP
+        pattern: Data pattern to generate
+    """
+    from main import SortingVisualizer
+    from visualizer import WebRenderer
+    
+    app = SortingVisualizer()
+    app.visualizer = WebRenderer(session, app.config)
+    try:
+        app.run(algorithm_name, pattern)
+    except ConnectionError:
+        print("Page disconnected; sort abandoned")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function with CLI argument parsing"""
+    parser = argparse.ArgumentParser(
+        prog='main.py serve',
+        description='Serve a browser visualization of a sort on this machine',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python main.py serve quick_sort --size 5000
+  python main.py serve merge_sort --size 200000 --pattern reversed --window 2
+  python main.py serve heap_sort --port 9000   (then open http://127.0.0.1:9000/)
+
+Each page load runs a fresh sort; the sort pauses whenever the page has
+--window frames it has not drawn yet.
+        """
+    )
+    
+    parser.add_argument(
+        'algorithm',
+        choices=list(ALGORITHM_MAP.keys()),
+        help='Sorting algorithm to visualize'
+    )
+    
+    parser.add_argument(
+        '--size',
+        type=int,
+        default=Config.DATA_SIZE,
+        help=f'Number of elements to sort (default: {Config.DATA_SIZE})'
+    )
+    
+    parser.add_argument(
+        '--max',
+        type=int,
+        help='Maximum value (default: the larger of Config.DATA_MAX and --size)'
+    )
+    
+    parser.add_argument(
+        '--pattern',
+        choices=[p.value for p in DataPattern],
+        default=DataPattern.RANDOM.value,
+        help='Data pattern to generate (default: random)'
+    )
+    
+    parser.add_argument(
+        '--host',
+        default=Config.SERVE_HOST,
+        help=f'Interface to listen on (default: {Config.SERVE_HOST})'
+    )
+    
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=Config.SERVE_PORT,
+        help=f'Port to listen on (default: {Config.SERVE_PORT})'
+    )
+    
+    parser.add_argument(
+        '--window',
+        type=int,
+        default=Config.SERVE_WINDOW,
+        help=f'Frames the page may have undrawn before the sort waits (default: {Config.SERVE_WINDOW})'
+    )
+    
+    args = parser.parse_args(argv)
+    if args.window < 1:
+        parser.error('--window must be at least 1')
+    
+    Config.load_tuning()
+    Config.update(
+        data_size=args.size,
+        data_max=args.max or max(Config.DATA_MAX, Config.DATA_MIN + args.size),
+        tuning_pattern=args.pattern,
+        serve_window=args.window
+    )
+    pattern = DataPattern(args.pattern)
+    
+    async def serve():
+        server = await start_server(lambda session: run_sort(session, args.algorithm, pattern),
+                                    args.host, args.port, args.window)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Serving {args.algorithm} on http://{host}:{port}/ (Ctrl+C to stop)")
+        async with server:
+            await server.serve_forever()
+    
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -92,6 +92,1208 @@ def test_sorting():
         return False
 
 
+def test_key_sorting():
+    """Test sorting records by a precomputed key"""
+    print("\nTesting key and reverse support...")
+    
+    try:
+        from algorithms import ALGORITHM_MAP
+        
+        records = [(value, index) for index, value in enumerate([3, 1, 2, 3, 1, 0, 2, 3])]
+        calls = []
+        
+        def key(record):
+            calls.append(record)
+            return record[0]
+        
+        for name, algo_class in ALGORITHM_MAP.items():
+            for reverse in (False, True):
+                calls.clear()
+                result = algo_class().sort(records, key=key, reverse=reverse)
+                assert len(calls) == len(records), f"{name} re-ran the key function"
+                expected = sorted(records, key=key, reverse=reverse)
+                assert [r[0] for r in result] == [r[0] for r in expected], name
+                if algo_class.STABLE:
+                    assert result == expected, f"{name} is not stable"
+        
+        # Vectorized networks must handle keys NumPy has no min/max for
+        from algorithms import BitonicSort, OddEvenSort
+        words = ['pear', 'fig', 'apple', 'kiwi', 'fig', 'date', 'lime']
+        pairs = [(value, index % 3) for index, value in enumerate([3, 1, 2, 3, 1, 0, 2])]
+        for algo_class in (BitonicSort, OddEvenSort):
+            assert algo_class().sort(words) == sorted(words)
+            assert algo_class().sort(pairs) == sorted(pairs)
+            by_tuple = lambda record: (record[0], -record[1])
+            assert algo_class().sort(pairs, key=by_tuple) == sorted(pairs, key=by_tuple)
+        
+        # The output comes from the network itself, so a short one shows
+        import itertools
+        
+        class TwoPhases(OddEvenSort):
+            __slots__ = ()
+            
+            def _rounds(self, width):
+                return itertools.islice(super()._rounds(width), 2)
+        
+        assert TwoPhases().sort([5, 4, 3, 2, 1, 0]) == [4, 2, 5, 0, 3, 1]
+        records = [(5, 'a'), (4, 'b'), (3, 'c')]
+        assert TwoPhases().sort(records, key=lambda r: r[0]) == [(4, 'b'), (3, 'c'), (5, 'a')]
+        
+        print("✓ Key and reverse support works!")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Key sorting test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_typed_buffers():
+    """Test in-place sorting of compact typed buffers"""
+    print("\nTesting typed buffers...")
+    
+    try:
+        from array import array
+        import numpy as np
+        from algorithms import ALGORITHM_MAP
+        
+        values = [5, 3, 9, 1, 5, 0, 7, 2, 8]
+        for name, algo_class in ALGORITHM_MAP.items():
+            algo = algo_class()
+            assert not hasattr(algo, '__dict__'), f"{name} is missing __slots__"
+            for buffer in (array('q', values), np.array(values, dtype=np.int32)):
+                result = algo.sort(buffer, copy=False)
+                assert result is buffer and list(buffer) == sorted(values), name
+            
+            # The default still leaves the input untouched
+            buffer = np.array(values)
+            assert list(algo.sort(buffer)) == sorted(values) and list(buffer) == values
+        
+        print("✓ Typed buffers work!")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Typed buffer test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_aggregation():
+    """Test pixel-bucketed aggregation used for large-N rendering"""
+    print("\nTesting large-N aggregation...")
+    
+    try:
+        import numpy as np
+        from visualizer import aggregate
+        
+        data = np.arange(1000)
+        roles = aggregate.role_codes(len(data), 'partitioning',
+                                     pivot_idx=10, section_range=(0, 499))
+        centers, mins, maxs, means, bucket_roles = aggregate.aggregate(data, roles, 100)
+        assert len(centers) == 100
+        assert mins[0] == 0 and maxs[0] == 9 and maxs[-1] == 999
+        assert bucket_roles[1] == aggregate.ROLE_PIVOT
+        assert bucket_roles[2] == aggregate.ROLE_ACTIVE
+        assert bucket_roles[-1] == aggregate.ROLE_DEFAULT
+        print(f"✓ Aggregation works! Buckets: {len(centers)}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Aggregation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_playback_recording():
+    """Test event recording for playback"""
+    print("\nTesting playback recording...")
+    
+    try:
+        from visualizer import EventRecorder
+        from algorithms import QuickSort
+        from data import DataGenerator, DataPattern
+        
+        data = DataGenerator.generate(30, 0, 100, DataPattern.RANDOM)
+        recorder = EventRecorder()
+        qs = QuickSort(visualizer=lambda **kwargs: recorder.record(**kwargs))
+        sorted_data = qs.sort(data[:])
+        
+        # Replaying every delta must reproduce the sorted output
+        values = recorder.initial_data()
+        assert list(values) == data
+        for _, _, indices, changed in recorder.frames:
+            values[indices] = changed
+        assert list(values) == sorted_data
+        print(f"✓ Playback recording works! Events: {len(recorder)}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Playback recording test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_batch_sorting():
+    """Test that batch fast paths match per-row sorting"""
+    print("\nTesting batch sorting...")
+    
+    try:
+        import numpy as np
+        from algorithms import InsertionSort, BubbleSort, QuickSort, BitonicSort
+        
+        batch = np.random.randint(0, 10, (200, 13))
+        for algo_class in (InsertionSort, BubbleSort, BitonicSort, QuickSort):
+            fast = algo_class()
+            fast_rows = fast.sort_batch(batch)
+            looped = algo_class()
+            looped_rows = looped.sort_batch(batch.tolist())
+            
+            assert fast_rows.tolist() == looped_rows == np.sort(batch, axis=1).tolist()
+            if algo_class is not QuickSort:  # random pivots differ per run
+                for name in ('comparisons', 'swaps', 'accesses', 'writes'):
+                    assert list(fast.get_batch_stats()[name]) == looped.get_batch_stats()[name]
+                assert fast.get_stats() == looped.get_stats()
+        
+        print(f"✓ Batch sorting works! Rows: {len(batch)}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Batch sorting test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_auto_selection():
+    """Test that AutoSort picks a sorter from the input shape"""
+    print("\nTesting auto selection...")
+    
+    try:
+        import random
+        from algorithms import AutoSort
+        
+        cases = [
+            (list(range(500)), 'insertion_sort'),
+            (list(range(500, 0, -1)), 'merge_sort'),
+            ([random.randint(0, 4) for _ in range(500)], 'merge_sort'),
+            # Four long runs: few descents but far too many inversions
+            ([i % 1000 for i in range(4000)], 'merge_sort'),
+            (random.sample(range(10000), 500), 'quick_sort')
+        ]
+        for data, expected in cases:
+            sorter = AutoSort()
+            result = sorter.sort(data)
+            stats = sorter.get_stats()
+            
+            assert result == sorted(data)
+            assert stats['auto_choice'] == expected, stats['probe']
+            assert stats['comparisons'] > 0
+        
+        # Large inputs are probed from a bounded sample
+        sorter = AutoSort()
+        sorter.sort(list(range(50000)))
+        assert sorter.get_stats()['probe']['sampled'] <= 4096
+        
+        print(f"✓ Auto selection works! Cases: {len(cases)}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Auto selection test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_presortedness():
+    """Test presortedness metrics against brute force"""
+    print("\nTesting presortedness metrics...")
+    
+    try:
+        import random
+        from analysis import count_inversions, presortedness
+        
+        for _ in range(50):
+            data = [random.randint(0, 20) for _ in range(random.randint(0, 60))]
+            expected = sum(1 for i in range(len(data))
+                           for j in range(i + 1, len(data)) if data[i] > data[j])
+            assert count_inversions(data) == expected
+        
+        metrics = presortedness([3, 1, 2, 2, 5, 4])
+        assert metrics['inversions'] == 4
+        assert metrics['runs'] == 3
+        assert metrics['lis'] == 4
+        assert metrics['distinct'] == 5
+        assert presortedness(list(range(100)))['inversions'] == 0
+        assert presortedness(list(range(100, 0, -1)))['inversion_ratio'] == 1.0
+        assert presortedness([7] * 10)['entropy'] == 0.0
+        
+        print(f"✓ Presortedness metrics work!")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Presortedness test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_inversion_tracking():
+    """Test that incrementally tracked inversions match a full recount"""
+    print("\nTesting inversion tracking...")
+    
+    try:
+        import random
+        from analysis import count_inversions
+        from algorithms import ALGORITHM_MAP
+        
+        for name, algo_class in ALGORITHM_MAP.items():
+            data = [random.randint(0, 30) for _ in range(60)]
+            frames = []
+            algo = algo_class(visualizer=lambda **kwargs: frames.append(algo.tracker.count))
+            algo.track_inversions = True
+            algo.sort(data)
+            stats = algo.get_stats()
+            
+            assert stats['initial_inversions'] == count_inversions(data)
+            assert stats['inversions'] == 0
+            assert frames[0] == stats['initial_inversions'] and frames[-1] == 0
+            if name in ('merge_sort', 'insertion_sort', 'bubble_sort'):
+                assert all(a >= b for a, b in zip(frames, frames[1:])), name
+        
+        # Swap-only sorters agree with a recount at every frame
+        data = [random.randint(0, 30) for _ in range(60)]
+        algo = ALGORITHM_MAP['quick_sort'](
+            visualizer=lambda **kwargs: frames.append(
+                (algo.tracker.count, count_inversions(kwargs['data']))))
+        algo.track_inversions = True
+        frames = []
+        algo.sort(data)
+        assert all(tracked == recounted for tracked, recounted in frames)
+        
+        # Networks rank ties apart internally but must not count them
+        from analysis import presortedness
+        for name in ('bitonic_sort', 'odd_even_sort'):
+            data = [random.randint(0, 5) for _ in range(40)]
+            algo = ALGORITHM_MAP[name](
+                visualizer=lambda **kwargs: frames.append(
+                    (algo.tracker.count, presortedness(kwargs['data'])['inversions'])))
+            algo.track_inversions = True
+            frames = []
+            algo.sort(data)
+            assert all(tracked == recounted for tracked, recounted in frames), name
+        
+        print(f"✓ Inversion tracking works! Curve points: {len(algo.tracker.curve)}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Inversion tracking test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_access_trace():
+    """Test that access traces match the counters and stay bounded"""
+    print("\nTesting access traces...")
+    
+    try:
+        import random
+        from analysis import AccessTrace
+        from algorithms import QuickSort, MergeSort
+        
+        data = [random.randint(0, 1000) for _ in range(2000)]
+        
+        algo = QuickSort()
+        algo.trace = AccessTrace(len(data), index_buckets=64, max_rows=32)
+        algo.sort(data)
+        totals = algo.trace.totals()
+        assert totals['compare'] == 2 * algo.comparisons
+        assert totals['swap'] == 2 * algo.swaps
+        
+        heatmap = algo.trace.histogram(time_buckets=16)
+        assert heatmap.shape == (16, 64)
+        assert heatmap.sum() == algo.trace.events
+        assert len(algo.trace.histogram()) <= 32
+        
+        algo = MergeSort()
+        algo.trace = AccessTrace(len(data), index_buckets=64)
+        algo.sort(data)
+        # One write per element per merge level
+        assert algo.trace.totals()['write'] == algo.accesses - 2 * algo.comparisons
+        
+        print(f"✓ Access traces work! Events: {algo.trace.events}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Access trace test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_cache_simulation():
+    """Test the LRU cache model and the sorter memory accounting"""
+    print("\nTesting cache simulation...")
+    
+    try:
+        import random
+        from analysis import CacheLevel, CacheSimulator, MemoryModel
+        from algorithms import QuickSort, MergeSort
+        
+        # 2 sets x 2 ways of 16-byte lines: lines 0, 2, 4 share set 0, and
+        # loading line 4 evicts line 2, the least recently used
+        level = CacheLevel('L1', 64, 16, 2, 1)
+        assert [level.access(a) for a in (0, 32, 0, 64, 0, 32)] == \
+            [False, False, True, False, True, False]
+        
+        levels = [{'name': 'L1', 'size': 1024, 'line_size': 64, 'associativity': 2, 'latency': 1}]
+        memory = MemoryModel(4096, CacheSimulator(levels, 100), element_size=8)
+        for i in range(4096):
+            memory.read(i)
+        report = memory.report()
+        # A sequential scan misses once per 8-element line
+        assert report['levels']['L1']['misses'] == 4096 // 8
+        assert report['cycles'] == 4096 + 100 * (4096 // 8)
+        
+        data = [random.randint(0, 1000) for _ in range(2000)]
+        algo = QuickSort()
+        algo.memory = MemoryModel(len(data))
+        algo.sort(data)
+        report = algo.memory.report()
+        assert report['reads'] == 2 * algo.comparisons + 2 * algo.swaps
+        assert report['writes'] == 2 * algo.swaps
+        assert report['accesses'] == report['reads'] + report['writes']
+        
+        algo = MergeSort()
+        algo.memory = MemoryModel(len(data))
+        algo.sort(data)
+        assert algo.memory.report()['levels']['L1']['hit_rate'] > 0.9
+        
+        print(f"✓ Cache simulation works! Merge sort cycles: {algo.memory.report()['cycles']}")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Cache simulation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_complexity_fit():
+    """Test growth exponent fitting and the complexity verdicts"""
+    print("\nTesting complexity fitting...")
+    
+    try:
+        import math
+        from analysis import power_law_fit, classify
+        from benchmark import run_matrix, fit_scaling
+        from data import DataPattern
+        
+        sizes = [64, 128, 256, 512, 1024]
+        fit = power_law_fit(sizes, [3 * n * n for n in sizes])
+        assert abs(fit['exponent'] - 2) < 1e-9 and abs(fit['coefficient'] - 3) < 1e-6
+        assert power_law_fit(sizes, [0] * len(sizes)) is None
+        
+        quadratic = {'time_best': 'O(n)', 'time_avg': 'O(n²)', 'time_worst': 'O(n²)'}
+        linearithmic = [n * math.log2(n) for n in sizes]
+        assert classify(sizes, [n * n for n in sizes], quadratic)['verdict'] == 'average'
+        assert classify(sizes, [2 * n for n in sizes], quadratic)['verdict'] == 'best'
+        assert classify(sizes, linearithmic, quadratic)['verdict'] == 'mismatch'
+        
+        rows = run_matrix(['insertion_sort', 'merge_sort'], [DataPattern.SORTED],
+                          [64, 128, 256, 512], scale_range=True)
+        verdicts = {entry['algorithm']: entry['verdict'] for entry in fit_scaling(rows)}
+        assert verdicts == {'insertion_sort': 'best', 'merge_sort': 'average'}, verdicts
+        
+        print(f"✓ Complexity fitting works! Verdicts: {verdicts}")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Complexity fitting test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_memory_profile():
+    """Test peak memory measurement and space budgets"""
+    print("\nTesting memory profiling...")
+    
+    try:
+        import random
+        from analysis import MemoryProbe, memory_budget
+        from benchmark import profile_case
+        
+        with MemoryProbe() as probe:
+            block = [0] * 100000
+            del block
+        report = probe.report()
+        # An 800 KB list was alive at the peak but not at the end
+        assert report['peak_bytes'] >= 800000, report
+        assert report['net_bytes'] < 100000, report
+        
+        assert memory_budget(1000, 'O(n)') > memory_budget(1000, 'O(log n)') > memory_budget(1000, 'O(1)')
+        assert memory_budget(1000, 'O(?)') is None
+        
+        data = [random.randint(0, 10000) for _ in range(2000)]
+        memory = profile_case('merge_sort', data)
+        assert memory['space'] == 'O(n)' and not memory['over_budget'], memory
+        assert memory['peak_bytes'] > 0
+        
+        print(f"✓ Memory profiling works! Merge sort peak: {memory['peak_bytes']} bytes")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Memory profiling test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_selection():
+    """Test select() and partial_sort() on both engines"""
+    print("\nTesting selection...")
+    
+    try:
+        import random
+        from algorithms import QuickSelect, QuickSort
+        
+        for values in (10000, 3):
+            data = [random.randint(0, values) for _ in range(3000)]
+            expected = sorted(data)
+            for k in (0, 7, 1500, 2999):
+                selector = QuickSelect()
+                assert selector.select(data, k) == expected[k]
+                assert max(selector.data[:k], default=expected[k]) <= expected[k]
+                assert min(selector.data[k + 1:], default=expected[k]) >= expected[k]
+            for k in (0, 10, 500, 3000):
+                result = QuickSelect().partial_sort(data, k)
+                assert result[:k] == expected[:k] and sorted(result) == expected
+        
+        selector = QuickSelect()
+        records = [(random.randint(0, 100), i) for i in range(500)]
+        assert selector.select(records, 250, key=lambda r: r[0])[0] == sorted(records)[250][0]
+        
+        data = [random.randint(0, 10000) for _ in range(5000)]
+        heap = QuickSelect()
+        heap.partial_sort(data, 10)
+        introselect = QuickSelect()
+        introselect.select(data, 2500)
+        full = QuickSort()
+        full.sort(data)
+        assert heap.get_stats()['select_method'] == 'heap'
+        assert introselect.get_stats()['select_method'].startswith('quickselect')
+        assert heap.comparisons < introselect.comparisons < full.comparisons
+        
+        try:
+            QuickSelect().select([1, 2, 3], 3)
+            assert False, "Out-of-range k should raise IndexError"
+        except IndexError:
+            pass
+        
+        print(f"✓ Selection works! Comparisons heap/select/sort: "
+              f"{heap.comparisons}/{introselect.comparisons}/{full.comparisons}")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Selection test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_online_sorter():
+    """Test inserts, removes and queries on the chunked online sorter"""
+    print("\nTesting online sorter...")
+    
+    try:
+        import asyncio
+        import random
+        from algorithms import OnlineSorter
+        from data import DataGenerator
+        
+        sorter = OnlineSorter(load=8)
+        reference = []
+        for _ in range(2000):
+            value = random.randint(0, 300)
+            if reference and random.random() < 0.3:
+                value = random.choice(reference)
+                assert sorter.remove(value)
+                reference.remove(value)
+            else:
+                sorter.insert(value)
+                reference.append(value)
+        reference.sort()
+        assert sorter.snapshot() == reference and len(sorter) == len(reference)
+        assert all(len(chunk) <= 16 for chunk in sorter.chunks)
+        assert sorter.maxes == [chunk[-1] for chunk in sorter.chunks]
+        assert not sorter.remove(301)
+        assert sorter[0] == reference[0] and sorter[-1] == reference[-1]
+        assert sorter.rank(150) == sum(1 for v in reference if v < 150)
+        
+        frames = []
+        streamed = OnlineSorter(visualizer=lambda **kwargs: frames.append(kwargs['data']))
+        data = [random.randint(0, 100) for _ in range(200)]
+        count = asyncio.run(streamed.afeed(DataGenerator.stream(data)))
+        assert count == 200 and streamed.snapshot() == sorted(data)
+        assert [len(frame) for frame in frames] == list(range(1, 201))
+        
+        stats = sorter.get_stats()
+        assert stats['inserts'] > stats['removes'] > 0 and stats['queries'] == 3
+        assert stats['insert_rate'] > 0 and stats['query_rate'] > 0
+        
+        print(f"✓ Online sorter works! {stats['insert_rate']:,.0f} inserts/s "
+              f"over {stats['chunks']} chunks")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Online sorter test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_heap_and_shell():
+    """Test Floyd's HeapSort and ShellSort over every gap sequence"""
+    print("\nTesting HeapSort and ShellSort...")
+    
+    try:
+        import math
+        import random
+        from algorithms import HeapSort, ShellSort, GAP_SEQUENCES
+        
+        n = 4000
+        data = [random.randint(0, 10 ** 6) for _ in range(n)]
+        heap = HeapSort()
+        assert heap.sort(data) == sorted(data)
+        # Floyd's sift-down needs about one comparison per level
+        assert heap.comparisons < 1.2 * n * math.log2(n), heap.comparisons
+        
+        comparisons = {}
+        for name, gaps in GAP_SEQUENCES.items():
+            assert gaps(n)[0] == 1 and gaps(n) == sorted(set(gaps(n)))
+            assert max(gaps(n)) < n and gaps(1) == [1]
+            sorter = ShellSort(gaps=name)
+            assert sorter.sort(data) == sorted(data)
+            comparisons[name] = sorter.comparisons
+        assert comparisons['ciura'] < comparisons['shell']
+        
+        try:
+            ShellSort(gaps='fibonacci')
+            assert False, "Unknown gap sequence should raise ValueError"
+        except ValueError:
+            pass
+        
+        print(f"✓ HeapSort and ShellSort work! Comparisons heap: {heap.comparisons}, "
+              f"shell: {comparisons}")
+        return True
+    
+    except Exception as e:
+        print(f"✗ HeapSort/ShellSort test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_rotation_merge_sort():
+    """Test the in-place stable merge sort and its memory advantage"""
+    print("\nTesting rotation merge sort...")
+    
+    try:
+        import random
+        from algorithms import RotationMergeSort
+        from benchmark import profile_case
+        
+        for n in (0, 1, 2, 21, 41, 1000):
+            records = [(random.randint(0, 5), i) for i in range(n)]
+            result = RotationMergeSort().sort(records, key=lambda r: r[0])
+            assert result == sorted(records, key=lambda r: r[0]), n
+        
+        frames = []
+        sorter = RotationMergeSort(visualizer=lambda **kwargs: frames.append(kwargs))
+        sorter.sort([random.randint(0, 100) for _ in range(100)])
+        rotations = [f['rotation'] for f in frames if f['state'] == 'rotating']
+        assert rotations and all(start < mid < end for start, mid, end in rotations)
+        
+        presorted = RotationMergeSort()
+        presorted.sort(list(range(5000)))
+        assert presorted.comparisons < 5000 and presorted.swaps == 0
+        
+        data = [random.randint(0, 10 ** 6) for _ in range(20000)]
+        in_place = profile_case('rotation_merge_sort', data)
+        merge = profile_case('merge_sort', data)
+        assert not in_place['over_budget'] and in_place['space'] == 'O(log n)', in_place
+        assert in_place['peak_bytes'] * 2 < merge['peak_bytes'], (in_place, merge)
+        
+        print(f"✓ Rotation merge sort works! Peak {in_place['peak_bytes']} bytes "
+              f"vs MergeSort {merge['peak_bytes']} bytes")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Rotation merge sort test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_write_costs():
+    """Test write counting, weighted costs and the write-minimizing sorts"""
+    print("\nTesting write-minimizing sorts...")
+    
+    try:
+        import random
+        from algorithms import CycleSort, WriteSelectionSort, SelectionSort
+        from benchmark import parse_weights
+        
+        data = random.sample(range(1000), 300)
+        misplaced = sum(1 for i, value in enumerate(data) if sorted(data)[i] != value)
+        writes = {}
+        for sorter in (CycleSort(), WriteSelectionSort(), SelectionSort()):
+            assert sorter.sort(data) == sorted(data)
+            writes[sorter.get_name()] = sorter.writes
+        assert writes['CycleSort'] == writes['SelectionSort (min writes)'] == misplaced
+        assert writes['SelectionSort'] > misplaced
+        
+        duplicates = [random.randint(0, 5) for _ in range(200)]
+        cycle = CycleSort()
+        assert cycle.sort(duplicates) == sorted(duplicates)
+        assert cycle.writes <= sum(1 for a, b in zip(duplicates, sorted(duplicates)) if a != b)
+        
+        stats = cycle.get_stats()
+        reads = stats['accesses'] - stats['writes']
+        assert stats['cost'] == stats['comparisons'] + reads + stats['writes']
+        assert cycle.get_cost({'write': 10, 'compare': 0, 'read': 0}) == 10 * stats['writes']
+        
+        assert parse_weights('write=10, read=0.5')['write'] == 10.0
+        try:
+            parse_weights('erase=3')
+            assert False, "Unknown weight should raise ValueError"
+        except ValueError:
+            pass
+        
+        print(f"✓ Write-minimizing sorts work! Writes: {writes}")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Write-minimizing sort test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_tuning():
+    """Test successive halving, tuning profiles and tuned lookups"""
+    print("\nTesting auto-tuning...")
+    
+    try:
+        import os
+        import json
+        import tempfile
+        from config import Config
+        from data import DataPattern
+        from algorithms import QuickSort
+        from tuner import successive_halving, tune_case, build_profile, tunable_algorithms
+        
+        result = successive_halving(range(16), lambda c, repeats: abs(c - 11), eta=2)
+        assert result['best'] == 11 and result['rounds'] == 5
+        # 16 + 8*2 + 4*4 + 2*8 + 1*16 evaluations
+        assert result['evaluations'] == 80
+        
+        assert Config.size_band(0) == '0-128' and Config.size_band(128) == '128-1024'
+        assert Config.size_band(10 ** 6) == '8192+'
+        assert {'quick_sort', 'merge_sort', 'shell_sort'} <= set(tunable_algorithms())
+        
+        case = tune_case('quick_sort', DataPattern.RANDOM, 300, objective='cost')
+        assert case['params']['QUICK_INSERTION_CUTOFF'] in QuickSort.TUNABLE['QUICK_INSERTION_CUTOFF']
+        assert case['band'] == '128-1024' and case['score'] <= case['baseline'] * 1.5
+        
+        saved = (Config.TUNED, Config.TUNING_PATTERN, Config.SHELL_GAPS)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, 'profile.json')
+                with open(path, 'w') as f:
+                    json.dump(build_profile([case], 'cost'), f)
+                assert Config.load_tuning(path)
+            Config.TUNING_PATTERN = 'random'
+            tuned = case['params']['QUICK_INSERTION_CUTOFF']
+            assert Config.tuned('QUICK_INSERTION_CUTOFF', 500) == tuned
+            assert Config.tuned('QUICK_INSERTION_CUTOFF', 5000) == Config.QUICK_INSERTION_CUTOFF
+            sorter = QuickSort()
+            sorter.sort(list(range(500, 0, -1)))
+            assert sorter.cutoff == tuned
+            
+            # Explicit settings such as --gaps win over the profile
+            from algorithms import ShellSort
+            Config.TUNED['random']['128-1024']['SHELL_GAPS'] = 'shell'
+            sorter = ShellSort()
+            sorter.sort(list(range(500, 0, -1)))
+            assert sorter.get_name() == "ShellSort (Shell gaps)"
+            Config.pin(shell_gaps='sedgewick')
+            assert sorter.get_name() == "ShellSort (Sedgewick gaps)"
+        finally:
+            Config.TUNED, Config.TUNING_PATTERN, Config.SHELL_GAPS = saved
+            Config.PINNED.discard('SHELL_GAPS')
+        assert not Config.load_tuning(os.path.join(tempfile.gettempdir(), 'missing-profile.json'))
+        
+        print(f"✓ Auto-tuning works! quick_sort cutoff {case['params']} "
+              f"({case['speedup']:.2f}x fewer weighted operations)")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Auto-tuning test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_odd_even_sort():
+    """Test vectorized odd-even phases against a pure-Python reference"""
+    print("\nTesting odd-even sort...")
+    
+    try:
+        import time
+        import random
+        import numpy as np
+        from algorithms import OddEvenSort
+        
+        def reference(values):
+            values = list(values)
+            comparisons = swaps = quiet = 0
+            for phase in range(len(values)):
+                if quiet == 2:
+                    break
+                swapped = 0
+                for i in range(phase % 2, len(values) - 1, 2):
+                    comparisons += 1
+                    if values[i] > values[i + 1]:
+                        values[i], values[i + 1] = values[i + 1], values[i]
+                        swapped += 1
+                swaps += swapped
+                quiet = 0 if swapped else quiet + 1
+            return values, comparisons, swaps
+        
+        for n in (0, 1, 2, 7, 64, 301):
+            data = [random.randint(0, 50) for _ in range(n)]
+            frames = []
+            sorter = OddEvenSort(lambda *args, **kwargs: frames.append(kwargs.get('state')))
+            expected, comparisons, swaps = reference(data)
+            assert sorter.sort(data) == expected
+            assert (sorter.comparisons, sorter.swaps) == (comparisons, swaps)
+            assert sorter.writes == 2 * swaps
+            # One frame per phase instead of one per comparison
+            assert frames.count('phase') <= n
+        
+        batch = np.random.randint(0, 20, (50, 33))
+        fast, looped = OddEvenSort(), OddEvenSort()
+        assert fast.sort_batch(batch).tolist() == looped.sort_batch(batch.tolist())
+        assert fast.get_stats() == looped.get_stats()
+        
+        n = 20000
+        data = np.random.randint(0, 10 ** 6, n)
+        start = time.perf_counter()
+        sorter = OddEvenSort()
+        assert sorter.sort(data.copy()).tolist() == np.sort(data).tolist()
+        elapsed = time.perf_counter() - start
+        
+        print(f"✓ Odd-even sort works! n={n} in {elapsed:.2f}s, "
+              f"{sorter.comparisons} comparisons")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Odd-even sort test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_stress_patterns():
+    """Test the stress patterns and McIlroy's adversary against QuickSort"""
+    print("\nTesting stress patterns...")
+    
+    try:
+        import random
+        from collections import Counter
+        from data import DataGenerator, DataPattern
+        from algorithms import QuickSort
+        from benchmark import run_matrix
+        
+        for pattern in DataPattern:
+            data = DataGenerator.generate(64, 0, 100, pattern, seed=3)
+            assert len(data) == 64 and data == DataGenerator.generate(64, 0, 100, pattern, seed=3)
+        
+        # A run-wide seed gives one reproducible stream, not repeated draws,
+        # and leaves NumPy's global generator alone
+        import numpy as np
+        from config import Config
+        saved = Config.PATTERN_SEED, DataGenerator._shared_rng
+        state = np.random.get_state()[1].copy()
+        try:
+            Config.PATTERN_SEED, DataGenerator._shared_rng = 5, None
+            first = [DataGenerator.generate(32, 0, 1000) for _ in range(2)]
+            DataGenerator._shared_rng = None
+            assert first[0] != first[1] and first == [DataGenerator.generate(32, 0, 1000)
+                                                      for _ in range(2)]
+        finally:
+            Config.PATTERN_SEED, DataGenerator._shared_rng = saved
+        assert (np.random.get_state()[1] == state).all()
+        
+        pipe = DataGenerator.generate(11, 0, 100, DataPattern.ORGAN_PIPE)
+        assert pipe[:6] == sorted(pipe[:6]) and pipe[5:] == sorted(pipe[5:], reverse=True)
+        saw = DataGenerator.generate(40, 0, 100, DataPattern.SAWTOOTH, runs=5)
+        assert sum(saw[i] > saw[i + 1] for i in range(39)) == 4
+        assert len(set(DataGenerator.generate(50, 0, 100, DataPattern.ALL_EQUAL))) == 1
+        zipf = Counter(DataGenerator.generate(2000, 0, 100, DataPattern.ZIPF, skew=2.0))
+        assert zipf.most_common(1)[0][1] > 2000 * 0.5
+        
+        # Deep enough to overflow the stack if QuickSort recursed on both sides
+        n = 1500
+        killer = DataGenerator.generate(n, 0, 100, DataPattern.QUICKSORT_KILLER)
+        assert sorted(killer) == sorted(set(killer))
+        random.random()  # other draws from the random module must not matter
+        sorter = QuickSort()
+        DataGenerator.seed_sorter(sorter, killer)
+        assert sorter.sort(killer) == sorted(killer)
+        # Every sort of the input replays the same pivots
+        again = QuickSort(seed=killer.seed)
+        again.sort(killer)
+        assert again.comparisons == sorter.comparisons
+        typical = QuickSort()
+        typical.sort(DataGenerator.generate(n, 0, 10 ** 6, DataPattern.RANDOM))
+        # Every pivot is the smallest remaining element
+        assert sorter.comparisons > n * n // 2 > 10 * typical.comparisons
+        
+        rows = run_matrix(['quick_sort', 'merge_sort'], [DataPattern.QUICKSORT_KILLER], [200])
+        assert all(row['verified'] for row in rows)
+        assert rows[0]['comparisons'] > 5 * rows[1]['comparisons']
+        
+        print(f"✓ Stress patterns work! Killer comparisons: {sorter.comparisons} "
+              f"vs {typical.comparisons} on random data")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Stress pattern test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_input_files():
+    """Test memory-mapped and chunked CSV inputs with both sampling methods"""
+    print("\nTesting input files...")
+    
+    try:
+        import os
+        import tempfile
+        import numpy as np
+        from data import load_input
+        from data.loader import reservoir_sample
+        
+        values = np.random.randint(-10 ** 6, 10 ** 6, 50000)
+        with tempfile.TemporaryDirectory() as folder:
+            paths = {
+                'npy': os.path.join(folder, 'keys.npy'),
+                'raw': os.path.join(folder, 'keys.i32'),
+                'csv': os.path.join(folder, 'keys.csv')
+            }
+            np.save(paths['npy'], values)
+            values.astype('<i4').tofile(paths['raw'])
+            with open(paths['csv'], 'w') as f:
+                f.write('key,label\n' + '\n'.join(f"{v},row" for v in values))
+            
+            for path in paths.values():
+                loaded, total = load_input(path, 100, 'stride')
+                assert total == len(values) and loaded == values[::500].tolist(), path
+                sample, total = load_input(path, 100, 'reservoir', seed=1)
+                assert total == len(values) and len(sample) == 100
+                assert set(sample) <= set(values.tolist())
+            assert load_input(paths['npy'], 10 ** 6)[0] == values.tolist()
+            
+            try:
+                load_input(paths['raw'].replace('.i32', '.bin'), 10)
+                assert False, "Unknown raw width should raise"
+            except (ValueError, OSError):
+                pass
+        
+        # Reservoir keeps input order and covers the whole stream uniformly
+        chunks = [np.arange(start, min(start + 777, 10000)) for start in range(0, 10000, 777)]
+        means = []
+        for seed in range(200):
+            sample, seen = reservoir_sample(chunks, 50, seed)
+            assert seen == 10000 and list(sample) == sorted(set(sample))
+            means.append(sample.mean())
+        assert abs(np.mean(means) - 4999.5) < 150, np.mean(means)
+        
+        print(f"✓ Input files work! Formats: {', '.join(paths)}")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Input file test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_web_server():
+    """Test the WebSocket server end to end on localhost, including backpressure"""
+    print("\nTesting web server...")
+    
+    try:
+        import io
+        import os
+        import json
+        import base64
+        import random
+        import struct
+        import asyncio
+        import contextlib
+        import numpy as np
+        from config import Config
+        from data import DataPattern
+        from server import (start_server, run_sort, read_frame, encode_frame, accept_key,
+                            OP_BINARY, OP_CLOSE)
+        from visualizer.web import decode_frame, DONE
+        
+        window = 3
+        
+        def ack(writer, count):
+            writer.write(encode_frame(OP_BINARY, struct.pack('<I', count), mask=True))
+        
+        async def scenario():
+            server = await start_server(
+                lambda session: run_sort(session, 'insertion_sort', DataPattern.RANDOM),
+                '127.0.0.1', 0, window
+            )
+            port = server.sockets[0].getsockname()[1]
+            
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            page = await reader.read()
+            writer.close()
+            assert page.startswith(b"HTTP/1.1 200") and b"<canvas" in page
+            
+            key = base64.b64encode(os.urandom(16)).decode()
+            
+            # Other pages in the browser may not start sorts
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write((f"GET /ws HTTP/1.1\r\nHost: localhost:{port}\r\n"
+                          f"Origin: http://example.com\r\nUpgrade: websocket\r\n"
+                          f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n\r\n").encode())
+            response = await reader.read()
+            writer.close()
+            assert response.startswith(b"HTTP/1.1 403")
+            
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write((f"GET /ws HTTP/1.1\r\nHost: localhost:{port}\r\n"
+                          f"Origin: http://localhost:{port}\r\nUpgrade: websocket\r\n"
+                          f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+                          f"Sec-WebSocket-Version: 13\r\n\r\n").encode())
+            response = await reader.readuntil(b"\r\n\r\n")
+            assert b" 101 " in response and accept_key(key).encode() in response
+            _, hello = await read_frame(reader)
+            assert json.loads(hello)['length'] == Config.DATA_SIZE
+            
+            # Without acks the sort stops after window frames
+            frames = [(await read_frame(reader))[1] for _ in range(window)]
+            try:
+                await asyncio.wait_for(read_frame(reader), 0.3)
+                assert False, "server sent past the window"
+            except asyncio.TimeoutError:
+                pass
+            ack(writer, window)
+            
+            values = None
+            while True:
+                for message in frames:
+                    frame = decode_frame(message)
+                    if frame['type'] == DONE:
+                        continue
+                    if values is None or len(values) != frame['length']:
+                        values = np.zeros(frame['length'], dtype=np.float32)
+                    values[frame['indices']] = frame['values']
+                opcode, message = await read_frame(reader)
+                if opcode == OP_CLOSE:
+                    break
+                frames = [message]
+                ack(writer, 1)
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return values
+        
+        size = Config.DATA_SIZE
+        Config.update(data_size=30)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                values = asyncio.run(scenario())
+        finally:
+            Config.update(data_size=size)
+        assert len(values) == 30 and list(values) == sorted(values)
+        
+        # Frames built from the sorter's written indices match every state
+        from algorithms import get_algorithm
+        from visualizer.web import ChangeLog, DeltaEncoder
+        
+        for name in ('quick_sort', 'merge_sort', 'bitonic_sort', 'online'):
+            encoder, changes, shown = DeltaEncoder(), ChangeLog(), None
+            
+            def check(data, state, **kwargs):
+                nonlocal shown
+                written = None if state in ('initial', 'complete') else changes.drain()
+                frame = decode_frame(encoder.encode(data, state, written=written, **kwargs))
+                if shown is None:
+                    shown = np.zeros(frame['length'], dtype=np.float32)
+                shown[frame['indices']] = frame['values']
+                assert list(shown) == [float(x) for x in data], f"{name} frame is stale"
+            
+            sorter = get_algorithm(name)(visualizer=check)
+            sorter.changes = changes
+            sorter.sort(random.Random(7).sample(range(200), 50))
+        
+        print(f"✓ Web server works! Window of {window} frames held")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Web server test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_terminal_renderer():
+    """Test that the terminal renderer's diffed output reproduces each frame"""
+    print("\nTesting terminal renderer...")
+    
+    try:
+        import io
+        import re
+        import random
+        from config import Config
+        from algorithms import QuickSort
+        from visualizer import TerminalRenderer
+        from visualizer.terminal import BLOCKS, HEADER_LINES
+        
+        columns, lines = 40, 12
+        screen = [[' '] * columns for _ in range(lines)]
+        
+        def play(text):
+            # Apply cursor moves and characters; colors and clears are not needed here
+            row = col = 0
+            for move_row, move_col, char in re.findall(
+                    r"\x1b\[(\d+);(\d+)H|\x1b\[[\d;?]*[A-Za-z]|(.)", text, re.S):
+                if move_row:
+                    row, col = int(move_row) - 1, int(move_col) - 1
+                elif char and char != '\n' and row < lines and col < columns:
+                    screen[row][col] = char
+                    col += 1
+        
+        stream = io.StringIO()
+        renderer = TerminalRenderer(stream=stream, size=(columns, lines))
+        # Repaints every frame in full, for comparison
+        repaint = TerminalRenderer(stream=io.StringIO(), size=(columns, lines))
+        delay = Config.ANIMATION_DELAY
+        Config.update(animation_delay=0)
+        try:
+            data = random.sample(range(1, 61), 30)
+            renderer.setup(data, "QuickSort")
+            repaint.setup(data, "QuickSort")
+            sizes = []
+            full_sizes = []
+            
+            def callback(**kwargs):
+                before = stream.tell()
+                renderer.visualize(**kwargs)
+                sizes.append(stream.tell() - before)
+                repaint._cells = None
+                start = repaint.bytes_written
+                repaint.visualize(**kwargs)
+                full_sizes.append(repaint.bytes_written - start)
+                play(stream.getvalue()[before:])
+                # The screen must match a full redraw of this frame
+                for line in range(renderer._cells.shape[0]):
+                    drawn = ''.join(screen[HEADER_LINES + line][:renderer._cells.shape[1]])
+                    assert drawn == ''.join(BLOCKS[renderer._cells[line]]), (line, drawn)
+            
+            QuickSort(visualizer=callback).sort(data)
+        finally:
+            Config.update(animation_delay=delay)
+        
+        # Later frames only rewrite what changed
+        assert sum(sizes) < sum(full_sizes) / 2, (sum(sizes), sum(full_sizes))
+        
+        # A swap without highlights touches just the two columns
+        renderer.visualize(list(range(1, 31)), 'working')
+        full = stream.tell()
+        renderer.visualize([2, 1] + list(range(3, 31)), 'working')
+        swap = stream.tell() - full
+        assert swap < full_sizes[0] / 10, swap
+        
+        # An interrupted run still gives the cursor back
+        import contextlib
+        from main import SortingVisualizer
+        
+        def interrupt(*args, **kwargs):
+            raise KeyboardInterrupt
+        
+        app = SortingVisualizer()
+        app.visualizer = TerminalRenderer(stream=io.StringIO(), size=(columns, lines))
+        app.visualizer.visualize = interrupt
+        terminal = Config.TERMINAL_RENDERING
+        Config.update(terminal_rendering=True)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                app.run('quick_sort')
+            assert False, "the interrupt was swallowed"
+        except KeyboardInterrupt:
+            pass
+        finally:
+            Config.update(terminal_rendering=terminal)
+        assert app.visualizer.stream.getvalue().endswith("\x1b[?25h\n")
+        
+        print(f"✓ Terminal renderer works! {renderer.frames} frames, {sum(sizes)} bytes "
+              f"vs {sum(full_sizes)} repainting, {swap} for a swap")
+        return True
+    
+    except Exception as e:
+        print(f"✗ Terminal renderer test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+# Budget for `import algorithms` plus a small headless sort, in milliseconds
+STARTUP_BUDGET_MS = 100
+
+
+def test_startup():
+    """Test that headless imports stay cheap and skip NumPy/matplotlib"""
+    print("\nTesting headless startup...")
+    
+    try:
+        import subprocess
+        
+        script = (
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import algorithms, data, visualizer\n"
+            "algorithms.QuickSort().sort(list(range(200, 0, -1)))\n"
+            "print((time.perf_counter() - start) * 1000)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script],
+            capture_output=True, text=True, check=True
+        )
+        
+        # stderr lines look like: "import time: self | cumulative | name"
+        imported = [line.rsplit('|', 1)[-1].strip()
+                    for line in result.stderr.splitlines()
+                    if line.startswith('import time:')]
+        heavy = [name for name in imported
+                 if name.split('.')[0] in ('numpy', 'matplotlib')]
+        assert not heavy, f"headless import pulled in {heavy[:3]}"
+        
+        elapsed_ms = float(result.stdout.strip())
+        assert elapsed_ms < STARTUP_BUDGET_MS, \
+            f"startup took {elapsed_ms:.1f} ms (budget {STARTUP_BUDGET_MS} ms)"
+        print(f"✓ Headless startup: {elapsed_ms:.1f} ms, {len(imported)} modules")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Startup test failed: {e}")
+        return False
+
+
 if __name__ == '__main__':
     print("="*60)
     print("SORTING VISUALIZER - SYSTEM TEST")
@@ -102,6 +1304,30 @@ if __name__ == '__main__':
     all_passed &= test_imports()
     all_passed &= test_data_generation()
     all_passed &= test_sorting()
+    all_passed &= test_key_sorting()
+    all_passed &= test_typed_buffers()
+    all_passed &= test_aggregation()
+    all_passed &= test_playback_recording()
+    all_passed &= test_batch_sorting()
+    all_passed &= test_auto_selection()
+    all_passed &= test_presortedness()
+    all_passed &= test_inversion_tracking()
+    all_passed &= test_access_trace()
+    all_passed &= test_cache_simulation()
+    all_passed &= test_complexity_fit()
+    all_passed &= test_memory_profile()
+    all_passed &= test_selection()
+    all_passed &= test_online_sorter()
+    all_passed &= test_heap_and_shell()
+    all_passed &= test_rotation_merge_sort()
+    all_passed &= test_write_costs()
+    all_passed &= test_tuning()
+    all_passed &= test_odd_even_sort()
+    all_passed &= test_stress_patterns()
+    all_passed &= test_input_files()
+    all_passed &= test_web_server()
+    all_passed &= test_terminal_renderer()
+    all_passed &= test_startup()
     
     print("\n" + "="*60)
     if all_passed:
@@ -0,0 +1,292 @@
+"""
+Auto-tuner for hybrid sorter parameters per data pattern and size band
+"""
+import json
+import math
+import os
+import platform
+import argparse
+import statistics
+from contextlib import contextmanager
+from itertools import product
+from typing import Callable, List, Optional, Sequence
+
+from config import Config
+from data import DataGenerator, DataPattern
+from algorithms import ALGORITHM_MAP
+from benchmark import run_case
+
+# Objectives a candidate can be scored by; lower is better
+OBJECTIVES = ['time', 'cost']
+
+
+def tunable_algorithms() -> List[str]:
+    """
+    Registered sorters that declare tunable parameters
+    
+    Returns:
+        ALGORITHM_MAP keys whose class has a non-empty TUNABLE
+    """
+    return [name for name, cls in ALGORITHM_MAP.items() if cls.TUNABLE]
+
+
+def candidates(algorithm_name: str) -> List[tuple]:
+    """
+    Every combination of a sorter's tunable values
+    
+    Args:
+        algorithm_name: Key in ALGORITHM_MAP
+    
+    Returns:
+        List of candidates, each a tuple of (parameter, value) pairs
+    """
+    tunable = ALGORITHM_MAP[algorithm_name].TUNABLE
+    names = list(tunable)
+    return [tuple(zip(names, values)) for values in product(*tunable.values())]
+
+
+@contextmanager
+def applied(candidate: Sequence[tuple]):
+    """
+    Set a candidate's parameters on Config with any loaded profile disabled
+    
+    Args:
+        candidate: Tuple of (parameter, value) pairs
+    """
+    saved = {name: getattr(Config, name) for name, _ in candidate}
+    tuned = Config.TUNED
+    Config.TUNED = {}
+    Config.update(**dict(candidate))
+    try:
+        yield
+    finally:
+        Config.update(**saved)
+        Config.TUNED = tuned
+
+
+def successive_halving(candidates: Sequence, evaluate: Callable, eta: int = 2,
+                       repeats: int = 1) -> dict:
+    """
+    Keep the best 1/eta of the candidates each round, measuring eta times more
+    
+    Every round scores the survivors with evaluate(candidate, repeats),
+    then multiplies repeats by eta, so the total work is about
+    len(candidates) * repeats * log_eta(len(candidates)) evaluations
+    instead of a full grid at the final precision.
+    
+    Args:
+        candidates: Hashable candidates
+        evaluate: Function (candidate, repeats) -> score; lower is better
+        eta: Reduction factor, at least 2
+        repeats: Repeats in the first round
+    
+    Returns:
+        Dictionary with best, score (of best in the last round), rounds,
+        evaluations and repeats (of the last round)
+    """
+    survivors = list(candidates)
+    rounds = evaluations = 0
+    while True:
+        scores = {candidate: evaluate(candidate, repeats) for candidate in survivors}
+        evaluations += len(survivors) * repeats
+        rounds += 1
+        survivors.sort(key=scores.get)
+        if len(survivors) == 1:
+            break
+        survivors = survivors[:max(1, len(survivors) // eta)]
+        repeats *= eta
+    best = survivors[0]
+    return {'best': best, 'score': scores[best], 'rounds': rounds,
+            'evaluations': evaluations, 'repeats': repeats}
+
+
+def tune_case(algorithm_name: str, pattern: DataPattern, size: int,
+              objective: str = 'time', eta: int = Config.TUNING_ETA) -> dict:
+    """
+    Find the best parameters of one sorter for one pattern and size
+    
+    Each round draws fresh inputs that every surviving candidate sorts
+    through the headless benchmark path, scored by the median; unsorted
+    results score infinity.
+    
+    Args:
+        algorithm_name: Key in ALGORITHM_MAP with a TUNABLE
+        pattern: Data pattern to generate
+        size: Input size
+        objective: 'time' (seconds) or 'cost' (weighted operation cost)
+        eta: Successive halving reduction factor
+    
+    Returns:
+        Dictionary with algorithm, pattern, size, band, params, score,
+        baseline (score of the untuned values), speedup, rounds and
+        evaluations
+    """
+    # A sorted pattern wider than its value range would be all equal
+    max_val = max(Config.DATA_MAX, Config.DATA_MIN + size)
+    
+    inputs = {}
+    
+    def evaluate(candidate, repeats):
+        if repeats not in inputs:
+            inputs[repeats] = [DataGenerator.generate(size, Config.DATA_MIN, max_val, pattern,
+                                                      target=algorithm_name)
+                               for _ in range(repeats)]
+        scores = []
+        for data in inputs[repeats]:
+            with applied(candidate):
+                row = run_case(algorithm_name, data)
+            scores.append(row[objective] if row['verified'] else float('inf'))
+        return statistics.median(scores)
+    
+    tunable = ALGORITHM_MAP[algorithm_name].TUNABLE
+    default = tuple((name, getattr(Config, name)) for name in tunable)
+    result = successive_halving(candidates(algorithm_name), evaluate, eta)
+    baseline = evaluate(default, result['repeats'])
+    return {
+        'algorithm': algorithm_name,
+        'pattern': pattern.value,
+        'size': size,
+        'band': Config.size_band(size),
+        'params': dict(result['best']),
+        'score': result['score'],
+        'baseline': baseline,
+        'speedup': baseline / result['score'] if 0 < result['score'] < math.inf else 1.0,
+        'rounds': result['rounds'],
+        'evaluations': result['evaluations']
+    }
+
+
+def build_profile(results: List[dict], objective: str,
+                  previous: Optional[dict] = None) -> dict:
+    """
+    Collect tuned parameters into a profile for Config.load_tuning()
+    
+    Args:
+        results: tune_case() results
+        objective: Objective the results were scored by
+        previous: Existing profile whose parameters are kept unless retuned
+    
+    Returns:
+        Profile with machine, objective, bands, parameters
+        (pattern -> band -> {parameter: value}) and results
+    """
+    parameters = (previous or {}).get('parameters', {})
+    for result in results:
+        band = parameters.setdefault(result['pattern'], {}).setdefault(result['band'], {})
+        band.update(result['params'])
+    return {
+        'machine': {
+            'platform': platform.platform(),
+            'processor': platform.machine(),
+            'python': platform.python_version()
+        },
+        'objective': objective,
+        'bands': Config.TUNING_BANDS,
+        'parameters': parameters,
+        'results': results
+    }
+
+
+def print_results(results: List[dict], objective: str):
+    """
+    Print the chosen parameters next to the untuned baseline
+    
+    Args:
+        results: tune_case() results
+        objective: Objective the results were scored by
+    """
+    unit = 'ms' if objective == 'time' else 'ops'
+    scale = 1000 if objective == 'time' else 1
+    print(f"{'Algorithm':<20} {'Pattern':<16} {'Band':<11} {'Best':>12} {'Default':>12} "
+          f"{'Gain':>6} {'Evals':>6}  Parameters")
+    print("-" * 98)
+    for result in results:
+        params = ', '.join(f"{name}={value}" for name, value in result['params'].items())
+        print(f"{result['algorithm']:<20} {result['pattern']:<16} {result['band']:<11} "
+              f"{result['score'] * scale:>9.2f} {unit:<2} {result['baseline'] * scale:>9.2f} {unit:<2} "
+              f"{result['speedup']:>5.2f}x {result['evaluations']:>6}  {params}")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main function with CLI argument parsing"""
+    parser = argparse.ArgumentParser(
+        prog='main.py tune',
+        description='Tune hybrid sorter parameters per data pattern and size band',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python main.py tune
+  python main.py tune --algorithms quick_sort --patterns random sorted --sizes 256 2048
+  python main.py tune --objective cost --output /tmp/profile.json
+        """
+    )
+    
+    parser.add_argument(
+        '--algorithms',
+        nargs='+',
+        choices=tunable_algorithms(),
+        default=tunable_algorithms(),
+        help='Sorters to tune (default: every sorter with tunable parameters)'
+    )
+    
+    parser.add_argument(
+        '--patterns',
+        nargs='+',
+        choices=[p.value for p in DataPattern],
+        default=[p.value for p in DataPattern],
+        help='Data patterns to tune for (default: all)'
+    )
+    
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        type=int,
+        default=Config.TUNING_SIZES,
+        help=f'Input sizes; each tunes its size band (default: {Config.TUNING_SIZES})'
+    )
+    
+    parser.add_argument(
+        '--objective',
+        choices=OBJECTIVES,
+        default='time',
+        help='Minimize wall time or weighted operation cost (default: time)'
+    )
+    
+    parser.add_argument(
+        '--eta',
+        type=int,
+        default=Config.TUNING_ETA,
+        help=f'Successive halving reduction factor (default: {Config.TUNING_ETA})'
+    )
+    
+    parser.add_argument(
+        '--output',
+        default=Config.TUNING_PROFILE,
+        help='Profile to write; existing entries for other cases are kept '
+             '(default: tuning_profile.json next to config.py)'
+    )
+    
+    args = parser.parse_args(argv)
+    if args.eta < 2:
+        parser.error('--eta must be at least 2')
+    
+    results = []
+    for name in args.algorithms:
+        for pattern in args.patterns:
+            for size in args.sizes:
+                results.append(tune_case(name, DataPattern(pattern), size,
+                                         args.objective, args.eta))
+    print_results(results, args.objective)
+    
+    previous = None
+    if os.path.exists(args.output):
+        with open(args.output) as f:
+            previous = json.load(f)
+    profile = build_profile(results, args.objective, previous)
+    with open(args.output, 'w') as f:
+        json.dump(profile, f, indent=2)
+    if os.path.abspath(args.output) == os.path.abspath(Config.TUNING_PROFILE):
+        print(f"\nWrote {args.output}; main.py and benchmark.py load it at startup")
+    else:
+        print(f"\nWrote {args.output}; load it with Config.load_tuning(path)")
+    return 0
@@ -1,6 +1,25 @@
 """
 Visualization package
+
+Renderers are loaded on first attribute access so that importing the
+package does not pull in matplotlib.
 """
-from .visualizer import Visualizer
+import importlib
+
+_EXPORTS = {
+    'Visualizer': '.visualizer',
+    'EventRecorder': '.playback',
+    'PlaybackEngine': '.playback',
+    'WebRenderer': '.web',
+    'TerminalRenderer': '.terminal'
+}
+
+__all__ = ['Visualizer', 'EventRecorder', 'PlaybackEngine', 'WebRenderer',
+           'TerminalRenderer']
+
 
-__all__ = ['Visualizer']
\ No newline at end of file
+def __getattr__(name: str):
+    """Import renderer classes lazily (PEP 562)"""
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
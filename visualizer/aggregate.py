@@ -0,0 +1,137 @@
+"""
+Pixel-bucketed aggregation for rendering very large arrays
+"""
+import numpy as np
+from typing import Tuple
+
+
+# Highlight roles, numbered by priority when several share one bucket
+ROLE_DEFAULT = 0
+ROLE_DISCARDED = 1
+ROLE_ACTIVE = 2
+ROLE_SORTED = 3
+ROLE_LEFT = 4
+ROLE_RIGHT = 5
+ROLE_COMPARING = 6
+ROLE_SWAPPING = 7
+ROLE_PIVOT = 8
+
+# Config.COLORS key for each role code
+ROLE_COLOR_KEYS = [
+    'default',
+    'discarded',
+    'active_section',
+    'sorted',
+    'left_partition',
+    'right_partition',
+    'comparing',
+    'swapping',
+    'pivot'
+]
+
+
+def _clip_indices(indices, n: int) -> np.ndarray:
+    """Return the in-range entries of an index sequence as an array"""
+    idx = np.asarray(indices, dtype=np.int64).ravel()
+    return idx[(idx >= 0) & (idx < n)]
+
+
+def role_codes(n: int, state: str, **kwargs) -> np.ndarray:
+    """
+    Compute a role code per index, mirroring Visualizer._get_colors
+
+    Args:
+        n: Number of elements
+        state: Current state
+        **kwargs: Visualization parameters
+
+    Returns:
+        int8 array of role codes
+    """
+    roles = np.zeros(n, dtype=np.int8)
+
+    if state == 'complete':
+        roles[:] = ROLE_SORTED
+        return roles
+
+    if kwargs.get('sorted_section') is not None:
+        start, end = kwargs['sorted_section']
+        roles[max(start, 0):end + 1] = ROLE_SORTED
+
+    for start, end in kwargs.get('discarded_ranges') or ():
+        section = roles[max(start, 0):end + 1]
+        section[section == ROLE_DEFAULT] = ROLE_DISCARDED
+
+    if 'section_range' in kwargs:
+        start, end = kwargs['section_range']
+        section = roles[max(start, 0):end + 1]
+        section[section == ROLE_DEFAULT] = ROLE_ACTIVE
+
+    if kwargs.get('pivot_idx') is not None:
+        roles[_clip_indices([kwargs['pivot_idx']], n)] = ROLE_PIVOT
+
+    if kwargs.get('left_indices') is not None:
+        roles[_clip_indices(kwargs['left_indices'], n)] = ROLE_LEFT
+
+    if kwargs.get('right_indices') is not None:
+        roles[_clip_indices(kwargs['right_indices'], n)] = ROLE_RIGHT
+
+    if kwargs.get('rotation') is not None:
+        start, mid, end = kwargs['rotation']
+        roles[max(start, 0):mid] = ROLE_LEFT
+        roles[max(mid, 0):end] = ROLE_RIGHT
+
+    if 'comparing_indices' in kwargs:
+        roles[_clip_indices(kwargs['comparing_indices'], n)] = ROLE_COMPARING
+
+    if 'swap_indices' in kwargs:
+        roles[_clip_indices(kwargs['swap_indices'], n)] = ROLE_SWAPPING
+
+    if kwargs.get('current_idx') is not None:
+        idx = _clip_indices([kwargs['current_idx']], n)
+        roles[idx[roles[idx] == ROLE_DEFAULT]] = ROLE_COMPARING
+
+    return roles
+
+
+def bucket_starts(n: int, buckets: int) -> np.ndarray:
+    """
+    Split range(n) into contiguous, non-empty buckets
+
+    Args:
+        n: Number of elements
+        buckets: Desired number of buckets (capped at n)
+
+    Returns:
+        Start index of each bucket
+    """
+    buckets = max(1, min(buckets, n))
+    return (np.arange(buckets, dtype=np.int64) * n) // buckets
+
+
+def aggregate(data, roles: np.ndarray, buckets: int
+              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduce data and roles to one entry per bucket
+
+    Args:
+        data: Values to aggregate
+        roles: Role code per index
+        buckets: Number of buckets (typically the pixel width)
+
+    Returns:
+        Tuple of (centers, mins, maxs, means, bucket_roles); each bucket
+        takes the highest-priority role found inside it
+    """
+    values = np.asarray(data, dtype=np.float64)
+    n = len(values)
+    starts = bucket_starts(n, buckets)
+    counts = np.diff(np.append(starts, n))
+
+    mins = np.minimum.reduceat(values, starts)
+    maxs = np.maximum.reduceat(values, starts)
+    means = np.add.reduceat(values, starts) / counts
+    bucket_roles = np.maximum.reduceat(roles, starts)
+    centers = starts + (counts - 1) / 2.0
+
+    return centers, mins, maxs, means, bucket_roles
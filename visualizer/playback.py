@@ -0,0 +1,319 @@
+"""
+Recorded-event playback engine built on matplotlib's FuncAnimation
+"""
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+from typing import List, Optional, Tuple
+from .visualizer import Visualizer, project_keys
+
+
+class EventRecorder:
+    """Records visualization events as compact data deltas"""
+    
+    def __init__(self):
+        """Initialize an empty recording"""
+        self.frames: List[Tuple[str, dict, np.ndarray, np.ndarray]] = []
+        self._last: Optional[np.ndarray] = None
+    
+    def __len__(self) -> int:
+        return len(self.frames)
+    
+    def record(self, data: List[int], state: str = 'working', **kwargs):
+        """
+        Record one visualization event
+        
+        Only the indices whose values changed since the previous event are
+        stored, so memory grows with the work done rather than frames * N.
+        
+        Args:
+            data: Current data state
+            state: Current state of algorithm
+            **kwargs: Additional visualization parameters
+        """
+        current = np.asarray(project_keys(data))
+        if self._last is None or len(current) != len(self._last):
+            indices = np.arange(len(current))
+            self._last = current.copy()
+        else:
+            indices = np.flatnonzero(current != self._last)
+            self._last[indices] = current[indices]
+        self.frames.append((state, kwargs, indices, self._last[indices]))
+    
+    def initial_data(self) -> np.ndarray:
+        """Return the data as of the first recorded event"""
+        _, _, indices, values = self.frames[0]
+        data = np.empty(len(indices), dtype=values.dtype)
+        data[indices] = values
+        return data
+
+
+class PlaybackEngine(Visualizer):
+    """
+    Drop-in replacement for Visualizer that records during the sort and
+    plays the recording back with a blitted FuncAnimation in finalize()
+    
+    Pacing is driven by wall-clock time: when drawing falls behind the
+    requested frame rate, intermediate events are applied without being
+    drawn, so playback speed does not drift with N.
+    
+    Keys: space pauses/resumes, right arrow steps one event while paused,
+    '+' and '-' double or halve the speed.
+    """
+    
+    def __init__(self, config=None):
+        """
+        Initialize playback engine
+        
+        Args:
+            config: Configuration object (optional)
+        """
+        super().__init__(config)
+        self.recorder = EventRecorder()
+        self.speed = self.config.PLAYBACK_SPEED
+        self.paused = False
+        self._animation = None
+        self._cursor = -1
+        self._clock_start = 0.0
+        self._clock_offset = 0.0
+        self._pending_step = False
+    
+    def setup(self, data: List[int], algorithm_name: str):
+        """
+        Setup recording for a new sort; the figure is created at playback
+        
+        Args:
+            data: Initial data
+            algorithm_name: Name of algorithm
+        """
+        self.data = data
+        self.algorithm_name = algorithm_name
+    
+    def visualize(self, data: List[int], state: str = 'working', **kwargs):
+        """
+        Record current state of sorting for later playback
+        
+        Args:
+            data: Current data state
+            state: Current state of algorithm
+            **kwargs: Additional visualization parameters
+        """
+        self.recorder.record(data, state, **kwargs)
+    
+    def finalize(self):
+        """Play back the recording and block until the window is closed"""
+        if not self.recorder.frames:
+            return
+        
+        self._init_artists()
+        self.fig.canvas.mpl_connect('key_press_event', self._on_key)
+        self._animation = FuncAnimation(
+            self.fig,
+            self._draw_frame,
+            frames=self._frame_source,
+            init_func=lambda: self._artists,
+            interval=self._interval_ms(),
+            blit=True,
+            repeat=False,
+            cache_frame_data=False
+        )
+        plt.ioff()
+        plt.show()
+    
+    def _interval_ms(self) -> int:
+        """Timer interval for the current speed"""
+        return max(1, int(1000 * self.config.ANIMATION_DELAY / self.speed))
+    
+    def _init_artists(self):
+        """Create the persistent artists that each frame updates"""
+        self.values = self.recorder.initial_data()
+        self.data = self.values
+        n = len(self.values)
+        self._top = float(self.values.max()) * 1.1 if n and self.values.max() > 0 else 100
+        self._cursor = 0
+        
+        self._ensure_figure()
+        self.ax.clear()
+        self.ax.set_xlim(-1, n)
+        self.ax.set_ylim(0, self._top)
+        self.ax.set_xlabel("Index", fontsize=10)
+        self.ax.set_ylabel("Value", fontsize=10)
+        self.ax.set_title(self.algorithm_name, fontsize=14, fontweight='bold')
+        
+        self._aggregated = n > self._aggregate_threshold()
+        if self._aggregated:
+            state, kwargs, _, _ = self.recorder.frames[0]
+            image, _ = self._aggregated_image(self.values, state, top=self._top, **kwargs)
+            self._image = self.ax.imshow(
+                image, origin='lower', aspect='auto', interpolation='nearest',
+                extent=(-0.5, n - 0.5, 0, self._top), animated=True
+            )
+            self._artists = [self._image]
+        else:
+            self._bars = list(self.ax.bar(
+                range(n), self.values, color=self.config.COLORS['default'],
+                edgecolor='black', linewidth=0.5
+            ))
+            self._colors = [self.config.COLORS['default']] * n
+            for bar in self._bars:
+                bar.set_animated(True)
+            self._artists = list(self._bars)
+        
+        # Title and stats live inside the axes so blitting redraws them
+        self._title = self.ax.text(
+            0.5, 0.98, "", transform=self.ax.transAxes, ha='center',
+            va='top', fontsize=11, animated=True
+        )
+        self._stats = self.ax.text(
+            0.02, 0.98, "", transform=self.ax.transAxes, fontsize=9,
+            va='top', animated=True,
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5)
+        )
+        self._artists += [self._title, self._stats]
+        
+        if self.progress_ax is not None:
+            self._init_progress()
+        
+        if self.config.SHOW_LEGEND:
+            self._add_playback_legend()
+        
+        self._clock_start = time.perf_counter()
+        self._clock_offset = 0.0
+    
+    def _init_progress(self):
+        """Prepare the remaining-inversions curve over all recorded events"""
+        points = [
+            (stats['comparisons'] + stats['swaps'], stats['inversions'])
+            for stats in (kwargs.get('stats') or {} for _, kwargs, _, _ in self.recorder.frames)
+            if 'inversions' in stats
+        ]
+        self._curve = np.array(points, dtype=np.float64).reshape(-1, 2)
+        # Curve points shown up to each event
+        self._curve_upto = np.cumsum([
+            'inversions' in (kwargs.get('stats') or {})
+            for _, kwargs, _, _ in self.recorder.frames
+        ])
+        
+        self.progress_ax.clear()
+        initial = self._curve[0, 1] if len(self._curve) else 0
+        self._style_progress_axis(initial)
+        self.progress_ax.set_xlim(0, max(self._curve[-1, 0], 1) if len(self._curve) else 1)
+        self._progress_line, = self.progress_ax.plot(
+            [], [], color=self.config.COLORS['pivot'], animated=True
+        )
+        self._artists.append(self._progress_line)
+    
+    def _add_playback_legend(self):
+        """Add a legend covering every highlight role"""
+        from matplotlib.patches import Patch
+        
+        labels = [
+            ('pivot', 'Pivot'),
+            ('comparing', 'Comparing'),
+            ('swapping', 'Swapping'),
+            ('active_section', 'Active'),
+            ('sorted', 'Sorted')
+        ]
+        legend = self.ax.legend(
+            handles=[Patch(facecolor=self.config.COLORS[key], label=label)
+                     for key, label in labels],
+            loc='upper right', fontsize=8
+        )
+        # Redrawn with the frame so bars never cover it
+        legend.set_animated(True)
+        self._artists.append(legend)
+    
+    def _elapsed(self) -> float:
+        """Playback time in seconds, scaled by speed and excluding pauses"""
+        if self.paused:
+            return self._clock_offset
+        return self._clock_offset + (time.perf_counter() - self._clock_start) * self.speed
+    
+    def _frame_source(self):
+        """
+        Yield the event index due at each timer tick
+        
+        Events that fell due while the previous frame was rendering are
+        skipped over, which compensates for render cost.
+        """
+        last = len(self.recorder.frames) - 1
+        due = 0
+        while due < last:
+            if self.paused:
+                if self._pending_step:
+                    self._pending_step = False
+                    due = min(due + 1, last)
+            else:
+                due = min(max(due + 1, int(self._elapsed() / self.config.ANIMATION_DELAY)), last)
+            yield due
+        yield last
+    
+    def _draw_frame(self, index: int):
+        """
+        Apply events up to index and update the artists
+        
+        Args:
+            index: Event index to display
+        
+        Returns:
+            Artists to blit
+        """
+        changed = []
+        while self._cursor < index:
+            self._cursor += 1
+            _, _, indices, values = self.recorder.frames[self._cursor]
+            self.values[indices] = values
+            changed.append(indices)
+        
+        state, kwargs, _, _ = self.recorder.frames[self._cursor]
+        
+        if self._aggregated:
+            image, _ = self._aggregated_image(self.values, state, top=self._top, **kwargs)
+            self._image.set_data(image)
+        else:
+            if changed:
+                for i in np.unique(np.concatenate(changed)):
+                    self._bars[i].set_height(self.values[i])
+            colors = self._get_colors(state, **kwargs)
+            for i, color in enumerate(colors):
+                if color != self._colors[i]:
+                    self._bars[i].set_color(color)
+                    self._bars[i].set_edgecolor('black')
+            self._colors = colors
+        
+        self._title.set_text(
+            f"{self._get_title(state, **kwargs)}   "
+            f"[{self._cursor + 1}/{len(self.recorder)}, {self.speed:g}x"
+            f"{', paused' if self.paused else ''}]"
+        )
+        if self.config.SHOW_STATS and kwargs.get('stats'):
+            self._stats.set_text(self._stats_text(kwargs['stats']))
+        
+        if self.progress_ax is not None:
+            shown = self._curve[:self._curve_upto[self._cursor]]
+            self._progress_line.set_data(shown[:, 0], shown[:, 1])
+        
+        return self._artists
+    
+    def _on_key(self, event):
+        """
+        Handle playback controls
+        
+        Args:
+            event: Matplotlib key press event
+        """
+        if event.key == ' ':
+            if self.paused:
+                self._clock_start = time.perf_counter()
+            else:
+                self._clock_offset = self._elapsed()
+            self.paused = not self.paused
+        elif event.key == 'right' and self.paused:
+            self._pending_step = True
+        elif event.key in ('+', '=', '-'):
+            self._clock_offset = self._elapsed()
+            self._clock_start = time.perf_counter()
+            self.speed = self.speed * 2 if event.key != '-' else self.speed / 2
+            if self._animation is not None:
+                self._animation.event_source.interval = self._interval_ms()
@@ -0,0 +1,166 @@
+"""
+Terminal renderer: Unicode block columns redrawn with cursor-addressed ANSI escapes
+"""
+import sys
+import time
+import shutil
+from typing import List, Optional, Tuple
+import numpy as np
+from . import aggregate
+from .visualizer import Visualizer, project_keys
+
+# Eighth blocks from empty to full; a column's top cell shows the remainder
+BLOCKS = np.array(list(" ▁▂▃▄▅▆▇█"))
+
+# Lines above the chart: title, then stats
+HEADER_LINES = 2
+
+RESET = "\x1b[0m"
+
+
+class TerminalRenderer(Visualizer):
+    """
+    Drop-in replacement for Visualizer that draws in the terminal
+    
+    Each element (or, when there are more elements than columns, each
+    bucket of elements with its maximum and highest-priority role) is a
+    column of block characters in eighth-cell steps, colored by role with
+    Config.TERMINAL_COLORS. The previous frame's cells are kept, and each
+    frame only moves the cursor to and rewrites the cells whose character
+    or color changed, so a frame costs output proportional to the change.
+    """
+    
+    def __init__(self, config=None, stream=None, size: Optional[Tuple[int, int]] = None):
+        """
+        Initialize terminal renderer
+        
+        Args:
+            config: Configuration object (optional)
+            stream: Text stream to write to (default: sys.stdout)
+            size: Fixed (columns, lines) instead of the terminal's size
+        """
+        super().__init__(config)
+        self.stream = stream or sys.stdout
+        self.size = size
+        self.top = 1.0
+        self.frames = 0
+        self.bytes_written = 0
+        self._cells: Optional[np.ndarray] = None
+        self._roles: Optional[np.ndarray] = None
+        self._header: List[str] = []
+    
+    def setup(self, data: List[int], algorithm_name: str):
+        """
+        Clear the screen for a new sort
+        
+        Args:
+            data: Initial data
+            algorithm_name: Name of algorithm
+        """
+        self.data = data
+        self.algorithm_name = algorithm_name
+        values = project_keys(data)
+        self.top = max(max(values), 1) if len(values) else 1.0
+        self._cells = None
+        self._write("\x1b[?25l\x1b[2J")
+    
+    def visualize(self, data: List[int], state: str = 'working', **kwargs):
+        """
+        Draw the current state, rewriting only the changed cells
+        
+        Args:
+            data: Current data state
+            state: Current state of algorithm
+            **kwargs: Additional visualization parameters
+        """
+        columns, lines = self.size or shutil.get_terminal_size()
+        height = max(1, lines - HEADER_LINES - 1)
+        values = project_keys(data)
+        self.data = data
+        
+        if len(values):
+            roles = aggregate.role_codes(len(values), state, **kwargs)
+            _, _, maxs, _, bucket_roles = aggregate.aggregate(values, roles, columns)
+            self.top = max(self.top, float(maxs.max()))
+        else:
+            maxs = np.zeros(0)
+            bucket_roles = np.zeros(0, dtype=np.int8)
+        
+        # Eighths filled in each cell, top line first
+        eighths = np.rint(np.clip(maxs, 0, None) / self.top * height * 8).astype(np.int64)
+        levels = 8 * np.arange(height - 1, -1, -1)[:, None]
+        cells = np.clip(eighths[None, :] - levels, 0, 8).astype(np.int8)
+        cell_roles = np.broadcast_to(bucket_roles, cells.shape)
+        
+        out = []
+        if self._cells is None or self._cells.shape != cells.shape:
+            # First frame or resized: repaint everything
+            out.append("\x1b[2J")
+            self._header = []
+            changed = np.ones(cells.shape, dtype=bool)
+        else:
+            # A recolored empty cell still looks blank
+            changed = (cells != self._cells) | ((cell_roles != self._roles) & (cells > 0))
+        
+        stats = kwargs.get('stats')
+        header = [
+            self._get_title(state, **kwargs),
+            self._stats_text(stats).replace("\n", "  ") if self.config.SHOW_STATS and stats else ""
+        ]
+        for line, text in enumerate(header):
+            if line >= len(self._header) or self._header[line] != text:
+                out.append(f"\x1b[{line + 1};1H\x1b[2K{text[:columns]}")
+        self._header = header
+        
+        out.append(self._cell_updates(cells, cell_roles, changed))
+        # Park the cursor below the chart so printed text does not overwrite it
+        out.append(f"{RESET}\x1b[{HEADER_LINES + height + 1};1H")
+        self._write("".join(out))
+        self._cells, self._roles = cells, np.array(cell_roles)
+        self.frames += 1
+        
+        if self.config.ANIMATION_DELAY > 0:
+            time.sleep(self.config.ANIMATION_DELAY)
+    
+    def _cell_updates(self, cells: np.ndarray, roles: np.ndarray, changed: np.ndarray) -> str:
+        """
+        Escape sequences that rewrite the changed cells
+        
+        The cursor is only moved when the next changed cell is not the one
+        right after the last written, and the color only set when it differs.
+        
+        Args:
+            cells: Eighths filled per cell, top line first
+            roles: Role code per cell
+            changed: Mask of cells to rewrite
+        
+        Returns:
+            ANSI text
+        """
+        colors = [self.config.TERMINAL_COLORS[key] for key in aggregate.ROLE_COLOR_KEYS]
+        lines, columns = np.nonzero(changed)
+        chars = BLOCKS[cells[lines, columns]]
+        codes = roles[lines, columns]
+        out = []
+        cursor = None
+        color = None
+        for line, column, char, code in zip(lines.tolist(), columns.tolist(),
+                                             chars.tolist(), codes.tolist()):
+            if cursor != (line, column):
+                out.append(f"\x1b[{HEADER_LINES + line + 1};{column + 1}H")
+            if code != color:
+                out.append(f"\x1b[{colors[code]}m")
+                color = code
+            out.append(char)
+            cursor = (line, column + 1)
+        return "".join(out)
+    
+    def _write(self, text: str):
+        """Write and flush one frame's output"""
+        self.stream.write(text)
+        self.stream.flush()
+        self.bytes_written += len(text)
+    
+    def finalize(self):
+        """Restore the cursor under the final frame"""
+        self._write(f"{RESET}\x1b[?25h\n")
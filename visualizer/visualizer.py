@@ -1,11 +1,57 @@
 """
 Visualization engine for sorting algorithms
+
+matplotlib and NumPy are imported on first use so that importing this
+package stays cheap for headless callers.
 """
-import matplotlib.pyplot as plt
+from numbers import Real
 from typing import List, Optional, Tuple
 from config import Config
 
 
+def _key_height(key) -> float:
+    """
+    Order-preserving (approximate) numeric projection of one sort key
+    
+    Strings map to a fraction built from their first characters, and tuples
+    and lists use their first element.
+    
+    Args:
+        key: Sort key
+        
+    Returns:
+        Bar height for the key
+    """
+    if isinstance(key, Real):
+        return float(key)
+    if isinstance(key, (tuple, list)):
+        return _key_height(key[0]) if key else 0.0
+    if isinstance(key, bytes):
+        key = key.decode('latin-1')
+    if isinstance(key, str):
+        height, scale = 0.0, 1.0
+        for char in key[:3]:
+            scale /= 0x110000
+            height += ord(char) * scale
+        return height * 100
+    return 0.0
+
+
+def project_keys(data):
+    """
+    Map sort keys to numeric bar heights
+    
+    Args:
+        data: Keys as passed to visualize()
+        
+    Returns:
+        data itself when the keys are already numeric, else a list of floats
+    """
+    if len(data) == 0 or isinstance(data[0], Real):
+        return data
+    return [_key_height(key) for key in data]
+
+
 class Visualizer:
     """Handles visualization of sorting algorithms"""
     
@@ -17,9 +63,10 @@ class Visualizer:
             config: Configuration object (optional)
         """
         self.config = config if config is not None else Config()
-        self.fig, self.ax = plt.subplots(
-            figsize=(self.config.FIG_WIDTH, self.config.FIG_HEIGHT)
-        )
+        self.fig = None
+        self.ax = None
+        self.progress_ax = None
+        self._progress: List[Tuple[int, int]] = []
         self.data = []
         self.algorithm_name = ""
         
@@ -31,9 +78,28 @@ class Visualizer:
             data: Initial data
             algorithm_name: Name of algorithm
         """
+        import matplotlib.pyplot as plt
+        
         self.data = data
         self.algorithm_name = algorithm_name
+        self._progress = []
+        self._ensure_figure()
         plt.ion()  # Turn on interactive mode
+    
+    def _ensure_figure(self):
+        """Create the figure on first use"""
+        if self.fig is None:
+            import matplotlib.pyplot as plt
+            
+            if self.config.TRACK_INVERSIONS:
+                self.fig, (self.ax, self.progress_ax) = plt.subplots(
+                    2, 1, figsize=(self.config.FIG_WIDTH, self.config.FIG_HEIGHT),
+                    gridspec_kw={'height_ratios': [3, 1]}
+                )
+            else:
+                self.fig, self.ax = plt.subplots(
+                    figsize=(self.config.FIG_WIDTH, self.config.FIG_HEIGHT)
+                )
         
     def visualize(self, data: List[int], state: str = 'working', **kwargs):
         """
@@ -44,14 +110,26 @@ class Visualizer:
             state: Current state of algorithm
             **kwargs: Additional visualization parameters
         """
+        import matplotlib.pyplot as plt
+        
+        data = project_keys(data)
         self.data = data
+        self._ensure_figure()
         self.ax.clear()
         
-        # Get colors for bars
-        colors = self._get_colors(state, **kwargs)
-        
-        # Draw bars
-        bars = self.ax.bar(range(len(data)), data, color=colors, edgecolor='black', linewidth=0.5)
+        if len(data) > self._aggregate_threshold():
+            # Too many bars for the available pixels
+            self._draw_aggregated(data, state, **kwargs)
+        else:
+            # Get colors for bars
+            colors = self._get_colors(state, **kwargs)
+            
+            # Draw bars
+            bars = self.ax.bar(range(len(data)), data, color=colors, edgecolor='black', linewidth=0.5)
+            
+            # Connect compare-exchange pairs of a network stage
+            if kwargs.get('exchange_pairs') is not None:
+                self._draw_pairs(data, *kwargs['exchange_pairs'])
         
         # Set title
         title = self._get_title(state, **kwargs)
@@ -63,7 +141,7 @@ class Visualizer:
         
         # Set limits
         self.ax.set_xlim(-1, len(data))
-        self.ax.set_ylim(0, max(data) * 1.1 if data else 100)
+        self.ax.set_ylim(0, max(data) * 1.1 if len(data) else 100)
         
         # Add legend if enabled
         if self.config.SHOW_LEGEND and state != 'initial' and state != 'complete':
@@ -73,8 +151,152 @@ class Visualizer:
         if self.config.SHOW_STATS and 'stats' in kwargs:
             self._add_stats(kwargs['stats'])
         
+        # Remaining inversions so far
+        if self.progress_ax is not None and 'inversions' in (kwargs.get('stats') or {}):
+            stats = kwargs['stats']
+            self._progress.append((stats['comparisons'] + stats['swaps'], stats['inversions']))
+            self.progress_ax.clear()
+            self._style_progress_axis(stats.get('initial_inversions', 0))
+            self.progress_ax.plot(*zip(*self._progress), color=self.config.COLORS['pivot'])
+        
         plt.pause(self.config.ANIMATION_DELAY)
     
+    def show_heatmap(self, trace, stats: Optional[dict] = None, curve=None):
+        """
+        Show where in the array a finished sort worked, then block
+        
+        Args:
+            trace: AccessTrace recorded during the sort
+            stats: Final statistics for the stats box (optional)
+            curve: (operations, inversions) pairs for the progress axis (optional)
+        """
+        import numpy as np
+        import matplotlib.pyplot as plt
+        
+        self._ensure_figure()
+        self.ax.clear()
+        counts = trace.histogram(time_buckets=max(1, int(self.ax.bbox.height)))
+        image = self.ax.imshow(
+            np.log1p(counts), origin='upper', aspect='auto', interpolation='nearest',
+            cmap=self.config.HEATMAP_CMAP, extent=(-0.5, trace.n - 0.5, trace.events, 0)
+        )
+        self.fig.colorbar(image, ax=self.ax, label='log(1 + accesses)')
+        
+        self.ax.set_title(f"{self.algorithm_name} - Access Heatmap", fontsize=14, fontweight='bold')
+        self.ax.set_xlabel("Index", fontsize=10)
+        self.ax.set_ylabel("Event (compares, swaps, writes)", fontsize=10)
+        
+        if self.config.SHOW_STATS and stats:
+            self._add_stats(stats)
+        
+        if self.progress_ax is not None and curve:
+            self.progress_ax.clear()
+            self._style_progress_axis(curve[0][1])
+            self.progress_ax.plot(*zip(*curve), color=self.config.COLORS['pivot'])
+        
+        plt.ioff()
+        plt.show()
+    
+    def _style_progress_axis(self, initial: int):
+        """
+        Label the inversion progress axis
+        
+        Args:
+            initial: Inversions before sorting, used as the y-axis top
+        """
+        self.progress_ax.set_xlabel("Operations (comparisons + swaps)", fontsize=10)
+        self.progress_ax.set_ylabel("Inversions", fontsize=10)
+        self.progress_ax.set_ylim(0, max(initial, 1) * 1.05)
+    
+    def _draw_pairs(self, data: List[int], low, high):
+        """
+        Draw a line between the tops of each compare-exchange pair
+        
+        Args:
+            data: Current data state
+            low: First index of each pair
+            high: Second index of each pair
+        """
+        from matplotlib.collections import LineCollection
+        
+        segments = [((i, data[i]), (j, data[j])) for i, j in zip(low, high)]
+        self.ax.add_collection(LineCollection(
+            segments, colors=self.config.COLORS['swapping'], linewidths=0.8
+        ))
+    
+    def _aggregate_threshold(self) -> int:
+        """
+        Number of elements above which bars are bucketed per pixel column
+        
+        Returns:
+            Element count threshold
+        """
+        if self.config.AGGREGATE_THRESHOLD is not None:
+            return self.config.AGGREGATE_THRESHOLD
+        return max(1, int(self.ax.bbox.width))
+    
+    def _draw_aggregated(self, data: List[int], state: str, **kwargs):
+        """
+        Draw one image column per pixel bucket instead of individual bars
+        
+        Args:
+            data: Current data state
+            state: Current state
+            **kwargs: Additional parameters
+        """
+        image, top = self._aggregated_image(data, state, **kwargs)
+        self.ax.imshow(
+            image, origin='lower', aspect='auto', interpolation='nearest',
+            extent=(-0.5, len(data) - 0.5, 0, top)
+        )
+    
+    def _aggregated_image(self, data: List[int], state: str, top: Optional[float] = None,
+                          **kwargs) -> Tuple['np.ndarray', float]:
+        """
+        Render pixel buckets into an RGBA image
+        
+        Each column is filled up to the bucket maximum in the bucket's
+        highest-priority role color, shaded between the bucket minimum and
+        maximum, and marked at the bucket mean.
+        
+        Args:
+            data: Current data state
+            state: Current state
+            top: Value at the top edge of the image (default: 1.1 * max)
+            **kwargs: Additional parameters
+            
+        Returns:
+            Tuple of (uint8 RGBA image, top value)
+        """
+        import numpy as np
+        from matplotlib.colors import to_rgba_array
+        from . import aggregate
+        
+        roles = aggregate.role_codes(len(data), state, **kwargs)
+        centers, mins, maxs, means, bucket_roles = aggregate.aggregate(
+            data, roles, self._aggregate_threshold()
+        )
+        
+        if top is None:
+            top = float(maxs.max()) * 1.1 or 100
+        height = max(1, int(self.ax.bbox.height))
+        rows = (np.arange(height) + 0.5)[:, None] * (top / height)
+        
+        # Lookup table: role colors, darkened role colors, background, mean
+        colors = to_rgba_array([self.config.COLORS[key] for key in aggregate.ROLE_COLOR_KEYS])
+        darkened = colors.copy()
+        darkened[:, :3] *= 0.6
+        lut = (np.vstack([colors, darkened, [1, 1, 1, 1], [0, 0, 0, 1]]) * 255).astype(np.uint8)
+        background = 2 * len(colors)
+        
+        filled = rows <= maxs
+        codes = np.where(filled, bucket_roles, background)
+        codes += len(colors) * (filled & (rows >= mins))
+        mean_rows = np.clip((means / top * height).astype(np.int64), 0, height - 1)
+        codes[mean_rows, np.arange(len(centers))] = background + 1
+        
+        return lut[codes], top
+    
     def _get_colors(self, state: str, **kwargs) -> List[str]:
         """
         Determine bar colors based on state
@@ -98,6 +320,12 @@ class Visualizer:
             for i in range(start, min(end + 1, len(colors))):
                 colors[i] = self.config.COLORS['sorted']
         
+        # Grey out elements ruled out by a selection
+        for start, end in kwargs.get('discarded_ranges') or ():
+            for i in range(max(start, 0), min(end + 1, len(colors))):
+                if colors[i] == self.config.COLORS['default']:
+                    colors[i] = self.config.COLORS['discarded']
+        
         # Highlight active section
         if 'section_range' in kwargs:
             start, end = kwargs['section_range']
@@ -123,6 +351,12 @@ class Visualizer:
                 if 0 <= idx < len(colors):
                     colors[idx] = self.config.COLORS['right_partition']
         
+        # Highlight the two blocks of a rotation
+        if kwargs.get('rotation') is not None:
+            start, mid, end = kwargs['rotation']
+            for i in range(max(start, 0), min(end, len(colors))):
+                colors[i] = self.config.COLORS['left_partition' if i < mid else 'right_partition']
+        
         # Highlight comparing elements
         if 'comparing_indices' in kwargs:
             for idx in kwargs['comparing_indices']:
@@ -172,6 +406,37 @@ class Visualizer:
             return f"{base} - Merging Subarrays"
         elif state == 'searching':
             return f"{base} - Searching for Minimum"
+        elif state == 'stage':
+            k, j = kwargs.get('stage', (0, 0))
+            return f"{base} - Compare-Exchange Stage (block {k}, distance {j})"
+        elif state == 'phase':
+            index, parity = kwargs.get('phase', (0, 0))
+            return f"{base} - Phase {index + 1} ({'odd' if parity else 'even'} pairs)"
+        elif state == 'discarded':
+            return f"{base} - Discarding the Side Without the Target"
+        elif state == 'heap_select':
+            return f"{base} - Replacing the Heap Maximum"
+        elif state == 'heap_sort':
+            return f"{base} - Sorting the Selected Prefix"
+        elif state == 'selected':
+            return f"{base} - Selection Complete"
+        elif state == 'arrival':
+            return f"{base} - Value Arrived"
+        elif state == 'heap_built':
+            return f"{base} - Heap Built"
+        elif state == 'sifting':
+            return f"{base} - Sifting Down the Heap"
+        elif state == 'rotating':
+            start, mid, end = kwargs.get('rotation', (0, 0, 0))
+            return f"{base} - Rotating Blocks of {mid - start} and {end - mid}"
+        elif state == 'ranked':
+            return f"{base} - Selecting the Next Rank"
+        elif state == 'cycle_write':
+            return f"{base} - Writing to the Final Position"
+        elif state == 'cycle_closed':
+            return f"{base} - Cycle Closed"
+        elif state == 'gap_pass':
+            return f"{base} - Insertion Pass with Gap {kwargs.get('gap', 1)}"
         else:
             return f"{base} - Sorting in Progress"
     
@@ -197,6 +462,14 @@ class Visualizer:
                 Patch(facecolor=self.config.COLORS['right_partition'], label='> Pivot')
             )
         
+        if kwargs.get('rotation') is not None:
+            legend_elements.append(
+                Patch(facecolor=self.config.COLORS['left_partition'], label='Left Block')
+            )
+            legend_elements.append(
+                Patch(facecolor=self.config.COLORS['right_partition'], label='Right Block')
+            )
+        
         if 'comparing_indices' in kwargs:
             legend_elements.append(
                 Patch(facecolor=self.config.COLORS['comparing'], label='Comparing')
@@ -207,6 +480,11 @@ class Visualizer:
                 Patch(facecolor=self.config.COLORS['sorted'], label='Sorted')
             )
         
+        if kwargs.get('discarded_ranges'):
+            legend_elements.append(
+                Patch(facecolor=self.config.COLORS['discarded'], label='Discarded')
+            )
+        
         if legend_elements:
             self.ax.legend(handles=legend_elements, loc='upper right', fontsize=8)
     
@@ -217,20 +495,40 @@ class Visualizer:
         Args:
             stats: Statistics dictionary
         """
-        stats_text = (
-            f"Comparisons: {stats.get('comparisons', 0)}\n"
-            f"Swaps: {stats.get('swaps', 0)}\n"
-            f"Accesses: {stats.get('accesses', 0)}"
-        )
         self.ax.text(
-            0.02, 0.98, stats_text,
+            0.02, 0.98, self._stats_text(stats),
             transform=self.ax.transAxes,
             fontsize=9,
             verticalalignment='top',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5)
         )
     
+    def _stats_text(self, stats: dict) -> str:
+        """
+        Format statistics for display
+        
+        Args:
+            stats: Statistics dictionary
+            
+        Returns:
+            Multi-line statistics string
+        """
+        text = (
+            f"Comparisons: {stats.get('comparisons', 0)}\n"
+            f"Swaps: {stats.get('swaps', 0)}\n"
+            f"Accesses: {stats.get('accesses', 0)}"
+        )
+        if 'cost' in stats:
+            text += f"\nWrites: {stats['writes']}\nCost: {stats['cost']:,.0f}"
+        if 'inversions' in stats:
+            text += f"\nInversions: {stats['inversions']}"
+        if 'insert_rate' in stats:
+            text += f"\nInserts: {stats['inserts']} ({stats['insert_rate']:,.0f}/s)"
+        return text
+    
     def finalize(self):
         """Finalize visualization"""
+        import matplotlib.pyplot as plt
+        
         plt.ioff()
         plt.show()
\ No newline at end of file
@@ -0,0 +1,241 @@
+"""
+Browser renderer: encodes frames as binary deltas for the canvas page
+
+Frame layout (little-endian), one WebSocket binary message per frame:
+
+    header   u8 type, u8 0, u16 title bytes, u16 stats bytes, u16 0,
+             u32 length, u32 changed values, u32 changed roles
+    text     UTF-8 title, then UTF-8 stats, zero-padded to 4 bytes
+    values   u32 indices, then f32 heights
+    roles    u32 indices, then u8 role codes (see aggregate.ROLE_COLOR_KEYS)
+
+When the length changes the frame carries every value and the page resets
+all roles to ROLE_DEFAULT before applying the listed ones. Otherwise only
+the positions the sorter wrote since the last frame (see ChangeLog) are
+projected and compared, so a frame costs time in proportion to the moves
+it shows rather than to n. The page
+answers each batch of frames it has drawn with a u32 frame count.
+"""
+import json
+import struct
+from typing import List
+import numpy as np
+from .aggregate import role_codes, ROLE_COLOR_KEYS
+from .visualizer import Visualizer, project_keys
+
+FRAME = 1
+DONE = 2
+
+HEADER = struct.Struct('<BBHHHIII')
+
+# Legend text per role code
+ROLE_LABELS = ['Default', 'Discarded', 'Active', 'Sorted', 'Left Block',
+               'Right Block', 'Comparing', 'Swapping', 'Pivot']
+
+
+class ChangeLog:
+    """Collects the indices a sorter writes between two frames"""
+    
+    __slots__ = ('_indices', '_arrays')
+    
+    def __init__(self):
+        """Initialize an empty log"""
+        self._indices = []
+        self._arrays = []
+    
+    def add(self, index: int):
+        """Record one written index"""
+        self._indices.append(index)
+    
+    def extend(self, indices):
+        """Record an array of written indices (e.g. a network round)"""
+        self._arrays.append(np.asarray(indices, dtype=np.int64))
+    
+    def drain(self) -> np.ndarray:
+        """
+        Take the indices written since the last call
+        
+        Returns:
+            Sorted array of distinct indices
+        """
+        written = np.unique(np.concatenate(
+            [np.asarray(self._indices, dtype=np.int64)] + self._arrays))
+        self._indices.clear()
+        self._arrays.clear()
+        return written
+
+
+class DeltaEncoder:
+    """Encodes each frame as the values and roles changed since the last"""
+    
+    def __init__(self):
+        """Initialize with no previous frame"""
+        self._values = None
+        self._roles = None
+    
+    def encode(self, data: List[int], state: str, title: str = '', stats_text: str = '',
+               written=None, **kwargs) -> bytes:
+        """
+        Encode one frame
+        
+        Args:
+            data: Current data state
+            state: Current state of algorithm
+            title: Title line to show
+            stats_text: Statistics text to show
+            written: Indices written since the last frame, or None to
+                compare every value
+            **kwargs: Additional visualization parameters (highlights)
+        
+        Returns:
+            Binary frame message
+        """
+        n = len(data)
+        roles = role_codes(n, state, **kwargs).astype(np.uint8)
+        if self._values is None or n != len(self._values):
+            self._values = np.array(project_keys(data), dtype=np.float32)
+            changed = np.arange(n)
+            recolored = np.flatnonzero(roles)
+        else:
+            # Positions the sorter did not write still hold their last value
+            if written is None:
+                written, keys = np.arange(n), data
+            elif isinstance(data, np.ndarray):
+                keys = data[written]
+            else:
+                keys = [data[i] for i in written.tolist()]
+            values = np.asarray(project_keys(keys), dtype=np.float32)
+            moved = values != self._values[written]
+            changed = written[moved]
+            self._values[changed] = values[moved]
+            recolored = np.flatnonzero(roles != self._roles)
+        self._roles = roles
+        
+        return self._pack(FRAME, n, title, stats_text, changed, self._values[changed],
+                          recolored, roles[recolored])
+    
+    def done(self) -> bytes:
+        """
+        Encode the end-of-sort marker
+        
+        Returns:
+            Binary message with no changes
+        """
+        n = 0 if self._values is None else len(self._values)
+        empty = np.empty(0, dtype=np.int64)
+        return self._pack(DONE, n, '', '', empty, empty, empty, empty)
+    
+    @staticmethod
+    def _pack(kind: int, n: int, title: str, stats: str, changed, values,
+              recolored, roles) -> bytes:
+        """Lay out one message as described in the module docstring"""
+        title, stats = title.encode('utf-8')[:0xFFFF], stats.encode('utf-8')[:0xFFFF]
+        text = title + stats
+        head = HEADER.pack(kind, 0, len(title), len(stats), 0, n, len(changed), len(recolored))
+        return b''.join((
+            head,
+            text,
+            b'\0' * (-len(text) % 4),
+            np.asarray(changed, dtype='<u4').tobytes(),
+            np.asarray(values, dtype='<f4').tobytes(),
+            np.asarray(recolored, dtype='<u4').tobytes(),
+            np.asarray(roles, dtype='u1').tobytes()
+        ))
+
+
+def decode_frame(message: bytes) -> dict:
+    """
+    Decode a frame the way the page does
+    
+    Args:
+        message: Binary frame message
+    
+    Returns:
+        Dictionary with type, length, title, stats, indices, values,
+        role_indices and roles
+    """
+    kind, _, title_len, stats_len, _, n, changed, recolored = HEADER.unpack_from(message)
+    offset = HEADER.size
+    title = message[offset:offset + title_len].decode('utf-8')
+    stats = message[offset + title_len:offset + title_len + stats_len].decode('utf-8')
+    offset += title_len + stats_len
+    offset += -offset % 4
+    
+    def take(dtype, count):
+        nonlocal offset
+        array = np.frombuffer(message, dtype=dtype, count=count, offset=offset)
+        offset += array.nbytes
+        return array
+    
+    indices = take('<u4', changed)
+    values = take('<f4', changed)
+    role_indices = take('<u4', recolored)
+    roles = take('u1', recolored)
+    return {'type': kind, 'length': n, 'title': title, 'stats': stats,
+            'indices': indices, 'values': values,
+            'role_indices': role_indices, 'roles': roles}
+
+
+class WebRenderer(Visualizer):
+    """
+    Drop-in replacement for Visualizer that sends frames to a browser
+    
+    The session blocks send() while the page has too many undrawn frames,
+    so the sort runs only as fast as the page draws. The application
+    attaches self.changes to the sorter, so each frame only re-reads the
+    positions written since the previous one.
+    """
+    
+    def __init__(self, session, config=None):
+        """
+        Initialize web renderer
+        
+        Args:
+            session: Connection with send(bytes), send_text(str) and window
+            config: Configuration object (optional)
+        """
+        super().__init__(config)
+        self.session = session
+        self.encoder = DeltaEncoder()
+        self.changes = ChangeLog()
+    
+    def setup(self, data: List[int], algorithm_name: str):
+        """
+        Announce a new sort to the page
+        
+        Args:
+            data: Initial data
+            algorithm_name: Name of algorithm
+        """
+        self.data = data
+        self.algorithm_name = algorithm_name
+        self.session.send_text(json.dumps({
+            'type': 'hello',
+            'algorithm': algorithm_name,
+            'length': len(data),
+            'window': self.session.window,
+            'colors': [self.config.COLORS[key] for key in ROLE_COLOR_KEYS],
+            'labels': ROLE_LABELS
+        }))
+    
+    def visualize(self, data: List[int], state: str = 'working', **kwargs):
+        """
+        Send the current state as a delta frame
+        
+        Args:
+            data: Current data state
+            state: Current state of algorithm
+            **kwargs: Additional visualization parameters
+        """
+        stats = kwargs.get('stats')
+        text = self._stats_text(stats) if self.config.SHOW_STATS and stats else ''
+        title = self._get_title(state, **kwargs)
+        written = self.changes.drain()
+        if state in ('initial', 'complete'):
+            # sort(reverse=True) reverses the data around these frames unlogged
+            written = None
+        self.session.send(self.encoder.encode(data, state, title, text, written, **kwargs))
+    
+    def finalize(self):
+        """Tell the page the sort is over"""
+        self.session.send(self.encoder.done())